@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Fill rate and cost of contact crawling against the upstream simulator.
+
+Simulated facility websites put Instagram, WhatsApp and the founding year on
+the home page but the email address (mostly) on /contact, so a home-page-only
+scrape misses most emails. For each crawl limit (``SCRAPER_CRAWL_PAGES``) the
+same sites are scraped from a cold cache with ``AsyncScraper`` and the run
+reports the share of sites with each contact field, website requests per site
+(robots.txt and terms of service lookups are not site pages and not counted)
+and per-site latency, which includes those compliance lookups.
+
+By default per-domain politeness delays and the per-domain concurrency limit
+are lifted, since every synthetic website shares the simulator's host. Its
+latencies then measure our own work plus website latency only and do NOT
+reflect production, where every further page of a site waits for the
+domain's next request slot (``min_delay_between_requests``, 6 s). With
+``--politeness production`` each site gets its own loopback host and the
+production compliance settings stay in force, so the latencies include
+those slot waits.
+
+Usage:
+    python benchmarks/bench_contact_crawl.py
+    python benchmarks/bench_contact_crawl.py --sites 100 --pages 0 1 3 --latency-ms 80
+    python benchmarks/bench_contact_crawl.py --sites 20 --politeness production
+"""
+
+import os
+import sys
+import time
+import asyncio
+import logging
+import argparse
+import tempfile
+import statistics
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.app.devtools.upstream_simulator import (  # noqa: E402
+    SimulatorConfig, UpstreamSimulator, places_near, site_url_for, start_in_thread
+)
+
+
+async def _scrape_all(scraper, sites: List[str]) -> Dict[str, object]:
+    latencies = []
+
+    async def timed(site: str):
+        started = time.perf_counter()
+        contact = await scraper.scrape(site)
+        latencies.append((time.perf_counter() - started) * 1000)
+        return contact
+
+    contacts = await asyncio.gather(*(timed(site) for site in sites))
+    return {'contacts': contacts, 'latencies': latencies}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Contact crawl fill rate versus pages fetched")
+    parser.add_argument('--sites', type=int, default=60)
+    parser.add_argument('--pages', type=int, nargs='+', default=[0, 1, 2, 3], help="crawl limits to compare")
+    parser.add_argument('--latency-ms', type=float, default=40, help="median simulated website latency")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--politeness', choices=('off', 'production'), default='off',
+                        help="'off' lifts per-domain delays (latency is not production-like)")
+    args = parser.parse_args()
+    polite = args.politeness == 'production'
+
+    config = SimulatorConfig(seed=args.seed, site_hosts='loopback' if polite else 'shared')
+    config.providers['websites'].latency_ms = args.latency_ms
+    # Per-site loopback hosts are only reachable when the simulator listens on all of 127/8
+    server, base_url = start_in_thread(config, host='0.0.0.0' if polite else '127.0.0.1')
+    simulator: UpstreamSimulator = server.config.app.state.simulator
+    os.environ['SCRAPE_CACHE_PATH'] = str(Path(tempfile.mkdtemp(prefix="bench-crawl-")) / "scrape_cache.db")
+    logging.disable(logging.WARNING)
+
+    from src.app.utils import web_scraper
+    from src.app.utils.legal_compliance import compliance_checker
+    if not polite:
+        compliance_checker.min_delay_between_requests = 0
+        compliance_checker.max_requests_per_minute = 10 ** 6
+
+    places = [p for p in places_near(config, 'gym', 10.0, 10.0, 20000) if p.has_website][:args.sites]
+    sites = [site_url_for(config, place, base_url) for place in places]
+    print(f"{len(sites)} sites, {args.latency_ms:.0f} ms median website latency")
+    if polite:
+        print(f"production politeness: {compliance_checker.min_delay_between_requests} s between pages of a site")
+    else:
+        print("politeness delays off: latencies exclude per-domain slot waits and do not reflect production")
+    print(f"{'pages':<7}" + ''.join(f"{name:>18}" for name in web_scraper.CONTACT_FIELDS)
+          + f"{'requests/site':>15}{'p50':>9}{'p95':>9}")
+    try:
+        for pages in args.pages:
+            web_scraper.SCRAPER_CRAWL_PAGES = pages
+            web_scraper.scrape_cache.clear()
+            before = simulator.stats()['providers']['websites']['calls']
+            scraper = web_scraper.AsyncScraper() if polite else web_scraper.AsyncScraper(per_domain_concurrency=len(sites))
+            run = asyncio.run(_scrape_all(scraper, sites))
+            requests_per_site = (simulator.stats()['providers']['websites']['calls'] - before) / len(sites)
+            cuts = statistics.quantiles(run['latencies'], n=100, method='inclusive')
+            fill = [sum(1 for c in run['contacts'] if getattr(c, name)) / len(sites)
+                    for name in web_scraper.CONTACT_FIELDS]
+            print(f"{pages:<7}" + ''.join(f"{share:>17.0%} " for share in fill)
+                  + f"{requests_per_site:>15.2f}{cuts[49]:>7.0f}ms{cuts[94]:>7.0f}ms")
+    finally:
+        server.should_exit = True
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Worst-case scaling of email and phone extraction.
+
+The previous extractor's email pattern rescans a token from every position
+inside it when the token turns out not to be an address, so page text such
+as a long dotted or hyphenated identifier takes quadratic time. Each
+adversarial input below is run at doubling sizes through that pattern set
+(copied from ``legacy_extraction.py``) and through
+``contact_extractor.extract_contacts``, and the run reports CPU time per
+size. It fails if doubling the input makes the new extractor more than
+``--max-growth`` times slower (scaled for other size steps).
+
+Usage:
+    python benchmarks/bench_contact_extractor.py
+    python benchmarks/bench_contact_extractor.py --sizes 4000 8000 16000 32000 --max-growth 3
+"""
+
+import re
+import sys
+import math
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.app.utils.contact_extractor import extract_contacts  # noqa: E402
+
+# The patterns of legacy_extraction._extract_email / _extract_phone_numbers
+LEGACY_EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+LEGACY_PHONE_PATTERNS = (
+    re.compile(r'\+?[\d\s\-\(\)]{10,}'),
+    re.compile(r'\(\d{3}\)\s?\d{3}-\d{4}'),
+    re.compile(r'\d{3}-\d{3}-\d{4}'),
+    re.compile(r'\+1\s?\d{3}\s?\d{3}\s?\d{4}'),
+)
+
+# Input name -> text of about ``n`` characters
+ADVERSARIAL_INPUTS: Dict[str, Callable[[int], str]] = {
+    'dotted token': lambda n: 'a.' * (n // 2),
+    'hyphenated token': lambda n: 'a-' * (n // 2),
+    'address prefixes': lambda n: 'x@a.' * (n // 4),
+    'at signs': lambda n: '@' * n,
+    'chained addresses': lambda n: 'a@a@' * (n // 4),
+    'digit soup': lambda n: '1' * n,
+    'spaced digits': lambda n: '1 ' * (n // 2),
+    'open brackets': lambda n: '(((1' * (n // 4),
+}
+
+
+def _legacy(text: str) -> None:
+    LEGACY_EMAIL_PATTERN.findall(text)
+    for pattern in LEGACY_PHONE_PATTERNS:
+        pattern.findall(text)
+
+
+def _cpu_ms(fn: Callable[[], object]) -> float:
+    """Best-of-three CPU milliseconds."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.process_time()
+        fn()
+        best = min(best, time.process_time() - start)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Worst-case scaling of email and phone extraction")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 4000, 8000, 16000])
+    parser.add_argument('--max-growth', type=float, default=3.0,
+                        help="largest allowed slowdown of the new extractor per doubling of the input")
+    args = parser.parse_args()
+
+    print(f"{'input':<20}{'chars':>8}{'old':>11}{'new':>11}")
+    failures: List[str] = []
+    for name, make in ADVERSARIAL_INPUTS.items():
+        previous = None
+        for size in args.sizes:
+            text = make(size)
+            old = _cpu_ms(lambda: _legacy(text))
+            new = _cpu_ms(lambda: extract_contacts(text, calling_code='1'))
+            print(f"{name:<20}{len(text):>8}{old:>9.2f}ms{new:>9.2f}ms")
+            if previous is not None:
+                allowed = args.max_growth ** math.log2(size / previous_size)
+            # Timer resolution makes ratios of sub-millisecond runs meaningless
+            if previous is not None and previous >= 1.0 and new / previous > allowed:
+                failures.append(f"{name}: {previous:.2f}ms -> {new:.2f}ms from {previous_size} to {size} chars")
+            previous, previous_size = new, size
+
+    if failures:
+        print("\nsuperlinear growth:\n  " + "\n  ".join(failures))
+        return 1
+    print(f"\nnew extractor grows at most {args.max_growth:g}x per doubling on every input")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Per-page CPU cost of the web scraper's HTML extraction.
+
+Runs ``_extract_comprehensive_business_info`` and the multi-traversal
+reference in ``legacy_extraction.py`` over the saved pages in
+``fixtures/pages/`` and reports CPU time per page (``time.process_time``)
+for each, both for extraction on an already parsed page and for parse plus
+extraction. Every page's output is compared with the reference first; the
+run fails if any field differs, except those in ``CHANGED_FIELDS`` whose
+differences are only listed.
+
+Usage:
+    python benchmarks/bench_extraction.py
+    python benchmarks/bench_extraction.py --repeat 50 --pages benchmarks/fixtures/pages/wordpress_gym.html
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Callable, Dict, List
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+import legacy_extraction  # noqa: E402
+from src.app.utils import web_scraper  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "pages"
+BASE_URL = "https://fixture.example/"
+# Fields the current extractor deliberately computes differently -> why
+CHANGED_FIELDS = {
+    'email': "ranked by source and domain, normalized case (contact_extractor)",
+    'phone': "normalized to E.164 and deduplicated (contact_extractor)",
+}
+
+
+def _cpu_ms(fn: Callable[[], object], repeat: int) -> float:
+    """Best-of-three mean CPU milliseconds per call."""
+    best = float('inf')
+    for _ in range(3):
+        start = time.process_time()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.process_time() - start) / repeat)
+    return best * 1000
+
+
+def _parity(html: str) -> Dict[str, tuple]:
+    """Fields whose values differ between the reference and the current extractor."""
+    expected = legacy_extraction._extract_comprehensive_business_info(BeautifulSoup(html, 'html.parser'), BASE_URL)
+    actual = web_scraper._extract_comprehensive_business_info(BeautifulSoup(html, 'html.parser'), BASE_URL)
+    return {key: (expected.get(key), actual.get(key))
+            for key in expected.keys() | actual.keys() if expected.get(key) != actual.get(key)}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Per-page CPU cost of web scraper extraction")
+    parser.add_argument('--pages', nargs='+', type=Path, default=sorted(FIXTURES_DIR.glob('*.html')))
+    parser.add_argument('--repeat', type=int, default=10, help="runs per page per measurement")
+    args = parser.parse_args()
+
+    pages = [(path.name, path.read_text(encoding='utf-8')) for path in args.pages]
+
+    mismatches = 0
+    for name, html in pages:
+        for key, (expected, actual) in sorted(_parity(html).items()):
+            if key in CHANGED_FIELDS:
+                print(f"changed  {name} {key}: {expected!r} -> {actual!r}")
+                continue
+            mismatches += 1
+            print(f"MISMATCH {name} {key}: expected {expected!r}, got {actual!r}")
+    if mismatches:
+        return 1
+
+    print(f"{'page':<24}{'KB':>7}{'extract old':>13}{'extract new':>13}{'speedup':>9}"
+          f"{'total old':>11}{'total new':>11}")
+    totals: List[List[float]] = []
+    for name, html in pages:
+        soup = BeautifulSoup(html, 'html.parser')
+        row = [
+            _cpu_ms(lambda: legacy_extraction._extract_comprehensive_business_info(soup, BASE_URL), args.repeat),
+            _cpu_ms(lambda: web_scraper._extract_comprehensive_business_info(soup, BASE_URL), args.repeat),
+            _cpu_ms(lambda: legacy_extraction._extract_comprehensive_business_info(
+                BeautifulSoup(html, 'html.parser'), BASE_URL), args.repeat),
+            _cpu_ms(lambda: web_scraper._extract_comprehensive_business_info(
+                BeautifulSoup(html, 'html.parser'), BASE_URL), args.repeat),
+        ]
+        totals.append(row)
+        print(f"{name:<24}{len(html) / 1024:>7.1f}{row[0]:>11.2f}ms{row[1]:>11.2f}ms{row[0] / row[1]:>8.1f}x"
+              f"{row[2]:>9.2f}ms{row[3]:>9.2f}ms")
+
+    old, new, total_old, total_new = (sum(column) / len(totals) for column in zip(*totals))
+    print(f"{'mean per page':<31}{old:>11.2f}ms{new:>11.2f}ms{old / new:>8.1f}x"
+          f"{total_old:>9.2f}ms{total_new:>9.2f}ms")
+    print(f"\noutputs identical on {len(pages)} pages (apart from {', '.join(CHANGED_FIELDS)})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Throughput of the scraper's parse stage: threads versus worker processes.
+
+Simulates enrichment: ``--io-threads`` fetch workers each "download" a page
+from ``fixtures/pages/`` (a sleep of ``--fetch-ms``) and hand the raw bytes to
+``web_scraper.ParseStage``, either parsed in the fetching thread (the default,
+``SCRAPER_PARSE_PROCESSES=0``) or in a pool of worker processes. Meanwhile a
+probe thread stands in for request handling: it sleeps 1 ms in a loop and
+records how late it wakes up, which grows when parsing holds the GIL.
+
+For each mode it reports pages per second, CPU time spent in this process per
+page, and the probe's p50/p99 wake-up lag. Results of every mode are checked
+against the threaded path.
+
+Usage:
+    python benchmarks/bench_parse_pool.py
+    python benchmarks/bench_parse_pool.py --pages 400 --processes 2 4 8 --fetch-ms 100
+"""
+
+import sys
+import time
+import argparse
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.app.utils.web_scraper import ParseStage  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "pages"
+
+
+class _LagProbe(threading.Thread):
+    """Sleeps 1 ms at a time and records the oversleep in milliseconds."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.lags: List[float] = []
+        self._done = threading.Event()
+
+    def run(self) -> None:
+        while not self._done.is_set():
+            started = time.perf_counter()
+            time.sleep(0.001)
+            self.lags.append((time.perf_counter() - started - 0.001) * 1000)
+
+    def stop(self) -> None:
+        self._done.set()
+        self.join()
+
+
+def _run(stage: ParseStage, pages: List[Tuple[str, bytes]], count: int, io_threads: int,
+         fetch_seconds: float) -> Tuple[Dict[str, float], List[Any]]:
+    def fetch_and_parse(i: int) -> Any:
+        name, body = pages[i % len(pages)]
+        time.sleep(fetch_seconds)
+        return stage.extract(body, 'text/html; charset=utf-8', f"https://{name}/")
+
+    probe = _LagProbe()
+    probe.start()
+    cpu_started, started = time.process_time(), time.perf_counter()
+    with ThreadPoolExecutor(max_workers=io_threads) as executor:
+        results = list(executor.map(fetch_and_parse, range(count)))
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    probe.stop()
+    cuts = statistics.quantiles(probe.lags, n=100, method='inclusive')
+    return {
+        'pages_per_s': count / wall,
+        'cpu_ms_per_page': cpu / count * 1000,
+        'probe_p50_ms': cuts[49],
+        'probe_p99_ms': cuts[98],
+    }, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Parse stage throughput: threads versus worker processes")
+    parser.add_argument('--pages', type=int, default=200, help="pages per mode")
+    parser.add_argument('--io-threads', type=int, default=8)
+    parser.add_argument('--fetch-ms', type=float, default=50, help="simulated download time per page")
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+
+    pages = [(path.stem, path.read_bytes()) for path in sorted(FIXTURES_DIR.glob('*.html'))]
+    modes = [('threads', 0)] + [(f"processes={n}", n) for n in args.processes]
+
+    print(f"{len(pages)} fixture pages, {args.pages} per mode, {args.io_threads} I/O threads, "
+          f"{args.fetch_ms:.0f} ms simulated fetch")
+    print(f"{'mode':<14}{'pages/s':>9}{'cpu ms/page':>13}{'probe p50':>11}{'probe p99':>11}")
+    reference = None
+    for label, processes in modes:
+        stage = ParseStage(processes)
+        try:
+            if processes:
+                # Start the workers outside the timed run
+                _run(stage, pages, processes * 2, processes * 2, 0)
+            summary, results = _run(stage, pages, args.pages, args.io_threads, args.fetch_ms / 1000)
+        finally:
+            stage.shutdown()
+        if reference is None:
+            reference = results
+        elif results != reference:
+            print(f"{label}: extracted fields differ from the threaded path")
+            return 1
+        print(f"{label:<14}{summary['pages_per_s']:>9.1f}{summary['cpu_ms_per_page']:>13.2f}"
+              f"{summary['probe_p50_ms']:>9.2f}ms{summary['probe_p99_ms']:>9.2f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
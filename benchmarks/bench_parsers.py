@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+CPU cost of the scraper's HTML parser backends over saved pages.
+
+Parses each page of ``fixtures/pages/`` with 'html.parser' (the reference)
+and with each accelerated backend that is installed (``FAST_HTML_PARSERS``,
+or those given with ``--parsers``), runs the full extraction, and reports
+CPU time per page for parse plus extraction. That the backends extract the
+same data is checked by ``tests/test_parser_parity.py``.
+
+Usage:
+    python benchmarks/bench_parsers.py
+    python benchmarks/bench_parsers.py --parsers lxml html5lib
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from bs4.builder import builder_registry  # noqa: E402
+
+from src.app.utils import web_scraper  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "pages"
+REFERENCE_PARSER = web_scraper.FALLBACK_HTML_PARSER
+
+
+def _cpu_ms(html: str, parser: str, repeat: int) -> float:
+    start = time.process_time()
+    for _ in range(repeat):
+        web_scraper._extract_comprehensive_business_info(web_scraper.parse_html(html, parser), '')
+    return (time.process_time() - start) / repeat * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="CPU cost of the scraper's HTML parser backends")
+    parser.add_argument('--pages', nargs='+', type=Path, default=sorted(FIXTURES_DIR.glob('*.html')))
+    parser.add_argument('--parsers', nargs='+', default=list(web_scraper.FAST_HTML_PARSERS))
+    parser.add_argument('--repeat', type=int, default=5, help="runs per page for the CPU timing")
+    args = parser.parse_args()
+
+    backends = [name for name in args.parsers if builder_registry.lookup(name) is not None]
+    for name in sorted(set(args.parsers) - set(backends)):
+        print(f"skipping {name}: not installed")
+
+    pages = [path.read_text(encoding='utf-8') for path in args.pages]
+    print(f"parse + extract CPU per page ({len(pages)} pages):")
+    for name in [REFERENCE_PARSER] + backends:
+        total = sum(_cpu_ms(html, name, args.repeat) for html in pages)
+        print(f"  {name:<12}{total / len(pages):>9.2f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+End-to-end search benchmarks against the local upstream simulator.
+
+Every scenario runs against ``src/app/devtools/upstream_simulator.py`` with
+realistic per-provider latencies, so no API keys or network access are needed:
+
+    async_cold   PlacesService.search_places_async, a new city every search
+    async_warm   the same search repeated (search, details and scrape caches hot)
+    sync_cold    PlacesService.search_places (thread-pool enrichment path)
+    scrape       scrape_website_for_contacts on synthetic facility websites
+    history      _save_search_history for a 20-facility result
+    api_search   POST /facilities/search for a signed-in user, concurrent clients
+
+For each scenario it reports p50/p95/p99 latency, throughput, upstream calls
+per operation (by provider) and peak traced memory, and writes the run to
+``benchmarks/results/<timestamp>-<commit>.json`` (not tracked: results are
+specific to the machine they ran on). ``--compare`` checks a run against an
+earlier results file from the same machine and exits non-zero on regressions.
+
+Per-domain politeness delays of the compliance checker are disabled (every
+synthetic website shares the simulator's host), so scrape timings measure our
+own work plus upstream latency.
+
+Usage:
+    python benchmarks/bench_search.py
+    python benchmarks/bench_search.py --scenarios api_search --iterations 100 --concurrency 8
+    python benchmarks/bench_search.py --compare benchmarks/results/<earlier run>.json
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.app.devtools.upstream_simulator import (  # noqa: E402
+    SimulatorConfig, UpstreamSimulator, places_near, service_environment, start_in_thread
+)
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+SCENARIOS = ('async_cold', 'async_warm', 'sync_cold', 'scrape', 'history', 'api_search')
+API_KEY = "bench-key"
+# Median latency (ms) and log-normal spread of each simulated provider
+UPSTREAM_LATENCY = {
+    'google_places': (150, 0.4),
+    'google_geocoding': (100, 0.3),
+    'yelp': (200, 0.4),
+    'foursquare': (150, 0.4),
+    'overpass': (400, 0.8),
+    'websites': (250, 0.7),
+}
+# Keep the service-side rate limits out of the way of the load
+UNLIMITED_ENV = {
+    'RATE_LIMIT_API_KEY_PER_MINUTE': '1000000000',
+    'RATE_LIMIT_API_KEY_BURST': '1000000000',
+    'RATE_LIMIT_USER_PER_MINUTE': '1000000000',
+    'RATE_LIMIT_USER_BURST': '1000000000',
+    'RATE_LIMIT_IP_PER_MINUTE': '1000000000',
+    'RATE_LIMIT_IP_BURST': '1000000000',
+    'RATE_LIMIT_DB_PATH': '',
+}
+
+Operation = Callable[[int], Awaitable[bool]]
+
+
+@dataclass
+class ScenarioResult:
+    """Measurements of one scenario."""
+    name: str
+    iterations: int
+    concurrency: int
+    errors: int
+    wall_seconds: float
+    latencies_ms: List[float] = field(repr=False)
+    upstream_calls: Dict[str, int]
+    peak_traced_kb: Optional[float]
+
+    def summary(self) -> Dict[str, Any]:
+        """Machine-readable summary (raw latencies are not stored)."""
+        cuts = statistics.quantiles(self.latencies_ms, n=100, method='inclusive') \
+            if len(self.latencies_ms) > 1 else self.latencies_ms * 99
+        per_op = {provider: round(calls / self.iterations, 2) for provider, calls in self.upstream_calls.items()}
+        per_op['total'] = round(sum(self.upstream_calls.values()) / self.iterations, 2)
+        return {
+            'iterations': self.iterations,
+            'concurrency': self.concurrency,
+            'errors': self.errors,
+            'p50_ms': round(cuts[49], 2),
+            'p95_ms': round(cuts[94], 2),
+            'p99_ms': round(cuts[98], 2),
+            'mean_ms': round(statistics.fmean(self.latencies_ms), 2),
+            'max_ms': round(max(self.latencies_ms), 2),
+            'throughput_per_s': round(self.iterations / self.wall_seconds, 3),
+            'upstream_calls_per_op': per_op,
+            'peak_traced_kb': self.peak_traced_kb,
+        }
+
+
+def _simulator_config(args: argparse.Namespace) -> SimulatorConfig:
+    config = SimulatorConfig(seed=args.seed, page_token_delay_seconds=args.page_token_delay)
+    for provider, (median_ms, sigma) in UPSTREAM_LATENCY.items():
+        config.providers[provider].latency_ms = median_ms * args.latency_scale
+        config.providers[provider].latency_sigma = sigma
+    return config
+
+
+def _upstream_calls(simulator: UpstreamSimulator) -> Dict[str, int]:
+    return {name: stats['calls'] for name, stats in simulator.stats()['providers'].items()}
+
+
+async def run_scenario(name: str, op: Operation, iterations: int, concurrency: int,
+                       simulator: UpstreamSimulator, memory_iterations: int) -> ScenarioResult:
+    """Time ``iterations`` operations with up to ``concurrency`` in flight, then a traced-memory pass."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                ok = await op(index)
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"{name}[{index}] failed: {e}")
+                ok = False
+            latencies.append((time.perf_counter() - start) * 1000)
+            if not ok:
+                errors += 1
+
+    calls_before = _upstream_calls(simulator)
+    started = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(iterations)))
+    wall = time.perf_counter() - started
+    calls_after = _upstream_calls(simulator)
+
+    peak_kb = None
+    if memory_iterations:
+        # Separate pass: tracemalloc slows allocation-heavy code too much to time under it
+        tracemalloc.start()
+        try:
+            for i in range(memory_iterations):
+                await op(iterations + i)
+            peak_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+
+    return ScenarioResult(
+        name=name,
+        iterations=iterations,
+        concurrency=concurrency,
+        errors=errors,
+        wall_seconds=wall,
+        latencies_ms=latencies,
+        upstream_calls={p: calls_after[p] - calls_before.get(p, 0)
+                        for p in calls_after if calls_after[p] - calls_before.get(p, 0)},
+        peak_traced_kb=peak_kb,
+    )
+
+
+def build_scenarios(args: argparse.Namespace, base_url: str, simulator: UpstreamSimulator,
+                    workdir: Path) -> Dict[str, Tuple[Operation, int]]:
+    """Operations to benchmark and the concurrency each runs at (imports happen after env setup)."""
+    import httpx
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.app.database.connection import Base, get_db
+    from src.app.database.models import User
+    from src.app.auth.dependencies import get_optional_user
+    from src.app.models.facility import SearchQuery
+    from src.app.services.places_service import PlacesService
+    from src.app.utils.web_scraper import scrape_website_for_contacts
+    from src.app.utils.legal_compliance import compliance_checker
+    from src.app.api.facilities_simple import SearchCriteria, _save_search_history
+    from src.app.main_api import app
+
+    compliance_checker.min_delay_between_requests = 0
+    compliance_checker.max_requests_per_minute = 10 ** 9
+    # Keep the app's file logging (it is part of the request cost) but not its console echo
+    app_logger = logging.getLogger("facility_finder")
+    for handler in [h for h in app_logger.handlers if type(h) is logging.StreamHandler]:
+        app_logger.removeHandler(handler)
+
+    engine = create_engine(f"sqlite:///{workdir / 'bench.db'}", connect_args={'check_same_thread': False})
+    Base.metadata.create_all(bind=engine)
+    BenchSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    with BenchSession() as db:
+        user = User(email="bench@example.com", username="bench", hashed_password="x")
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        db.expunge(user)
+
+    def query(prefix: str, index: int) -> SearchQuery:
+        return SearchQuery(place_type=args.place_type, city=f"{prefix} City {index}",
+                           country="India", max_results=args.max_results)
+
+    async def async_cold(i: int) -> bool:
+        return (await PlacesService(API_KEY).search_places_async(query("Async", i))).success
+
+    async def async_warm(i: int) -> bool:
+        return (await PlacesService(API_KEY).search_places_async(query("Warm", 0))).success
+
+    async def sync_cold(i: int) -> bool:
+        return (await asyncio.to_thread(PlacesService(API_KEY).search_places, query("Sync", i))).success
+
+    sites = [f"{base_url}/sites/{place.place_id}/"
+             for place in places_near(simulator.config, args.place_type, 10.0, 10.0, 20000)
+             if place.has_website]
+
+    async def scrape(i: int) -> bool:
+        await asyncio.to_thread(scrape_website_for_contacts, sites[i % len(sites)])
+        return True
+
+    history_result = PlacesService(API_KEY).search_places(query("History", 0))
+    criteria = SearchCriteria(place_type=args.place_type, city="History City 0", country="India",
+                              max_results=args.max_results)
+    history_logger = logging.getLogger("facility_finder")
+
+    def save_history() -> None:
+        with BenchSession() as db:
+            _save_search_history(db, user.id, user.username, criteria, history_result, history_logger)
+
+    async def history(i: int) -> bool:
+        await asyncio.to_thread(save_history)
+        return True
+
+    def bench_db():
+        db = BenchSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_optional_user] = lambda: user
+    client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench",
+                               timeout=120)
+
+    async def api_search(i: int) -> bool:
+        response = await client.post("/facilities/search", json={
+            'api_key': API_KEY, 'place_type': args.place_type, 'city': f"Api City {i}",
+            'country': "India", 'max_results': args.max_results,
+        })
+        return response.status_code == 200 and response.json().get('success', False)
+
+    return {
+        'async_cold': (async_cold, 1),
+        'async_warm': (async_warm, 1),
+        'sync_cold': (sync_cold, 1),
+        'scrape': (scrape, 1),
+        'history': (history, 1),
+        'api_search': (api_search, args.concurrency),
+    }
+
+
+def _git_revision() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True).stdout.strip())
+        return {'commit': commit, 'dirty': dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': 'unknown', 'dirty': None}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Print a comparison table and return the regressions beyond ``threshold`` (a fraction)."""
+    regressions = []
+    print(f"\nComparison with {baseline.get('git', {}).get('commit', '?')} "
+          f"({baseline.get('timestamp', '?')}), threshold {threshold:.0%}")
+    print(f"{'scenario':<12} {'metric':<18} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, result in current['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if not before:
+            continue
+        for metric, higher_is_worse in (('p50_ms', True), ('p95_ms', True), ('p99_ms', True),
+                                        ('throughput_per_s', False)):
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            worse = change > threshold if higher_is_worse else change < -threshold
+            flag = "  REGRESSION" if worse else ""
+            print(f"{name:<12} {metric:<18} {old:>10.1f} {new:>10.1f} {change:>+7.0%}{flag}")
+            if worse:
+                regressions.append(f"{name}.{metric}: {old} -> {new} ({change:+.0%})")
+    return regressions
+
+
+def _print_summary(results: Dict[str, Dict[str, Any]]) -> None:
+    print(f"\n{'scenario':<12} {'n':>5} {'err':>4} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'ops/s':>8} {'calls/op':>9} {'peak KB':>9}")
+    for name, r in results.items():
+        peak = f"{r['peak_traced_kb']:.0f}" if r['peak_traced_kb'] is not None else "-"
+        print(f"{name:<12} {r['iterations']:>5} {r['errors']:>4} {r['p50_ms']:>9.1f} {r['p95_ms']:>9.1f} "
+              f"{r['p99_ms']:>9.1f} {r['throughput_per_s']:>8.2f} {r['upstream_calls_per_op']['total']:>9.1f} "
+              f"{peak:>9}")
+
+
+async def _run(args: argparse.Namespace, base_url: str, simulator: UpstreamSimulator,
+               workdir: Path) -> Dict[str, Dict[str, Any]]:
+    scenarios = build_scenarios(args, base_url, simulator, workdir)
+    results = {}
+    for name in args.scenarios:
+        op, concurrency = scenarios[name]
+        print(f"running {name} ({args.iterations} iterations, concurrency {concurrency})...", flush=True)
+        result = await run_scenario(name, op, args.iterations, concurrency, simulator, args.memory_iterations)
+        results[name] = result.summary()
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end search benchmarks against the upstream simulator")
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument('--iterations', type=int, default=10)
+    parser.add_argument('--concurrency', type=int, default=4, help="concurrent clients for api_search")
+    parser.add_argument('--memory-iterations', type=int, default=2,
+                        help="operations run under tracemalloc for peak memory (0 disables)")
+    parser.add_argument('--max-results', type=int, default=20)
+    parser.add_argument('--place-type', default="gym")
+    parser.add_argument('--latency-scale', type=float, default=1.0,
+                        help="multiplier for simulated upstream latency (0 measures pure overhead)")
+    parser.add_argument('--page-token-delay', type=float, default=2.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output-dir', type=Path, default=RESULTS_DIR)
+    parser.add_argument('--no-save', action='store_true', help="do not write a results file")
+    parser.add_argument('--compare', type=Path, help="earlier results file to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2, help="allowed regression as a fraction")
+    args = parser.parse_args()
+
+    server, base_url = start_in_thread(_simulator_config(args))
+    simulator: UpstreamSimulator = server.config.app.state.simulator
+    workdir = Path(tempfile.mkdtemp(prefix="bench-search-"))
+    # Services read their configuration at import time, so set it before importing them
+    os.environ.update(service_environment(base_url))
+    os.environ.update(UNLIMITED_ENV)
+    os.environ['PLACES_CACHE_PATH'] = str(workdir / "places_cache.db")
+    os.environ['SCRAPE_CACHE_PATH'] = str(workdir / "scrape_cache.db")
+
+    try:
+        results = asyncio.run(_run(args, base_url, simulator, workdir))
+    finally:
+        server.should_exit = True
+
+    report = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git': _git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()
+                       if k not in ('compare', 'output_dir', 'no_save')},
+        'upstream_latency_ms': {p: {'median': m * args.latency_scale, 'sigma': s}
+                                for p, (m, s) in UPSTREAM_LATENCY.items()},
+        'scenarios': results,
+    }
+    _print_summary(results)
+
+    if not args.no_save:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+        path = args.output_dir / f"{datetime.now():%Y%m%d-%H%M%S}-{report['git']['commit']}.json"
+        path.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nresults written to {path}")
+
+    if args.compare:
+        regressions = compare(report, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print("\nRegressions:\n  " + "\n  ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,34 +3,59 @@ Simplified Facility search API endpoints.
 Basic version without complex dependencies.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Union
 from datetime import datetime
 import time
 import logging
 import json
 from dataclasses import asdict
 
-from src.app.database.connection import get_db
+from src.app.database.connection import get_db, SessionLocal
 from src.app.database.models import User, SearchHistory, Facility
 from src.app.auth.dependencies import get_current_user, get_optional_user
-from pydantic import BaseModel
-from src.app.services.places_service import PlacesService
-from src.app.models.facility import SearchQuery
+from pydantic import BaseModel, Field
+from src.app.services.places_service import (
+    PlacesService, BATCH_MAX_UPSTREAM_CALLS, BATCH_MAX_DEADLINE_SECONDS
+)
+from src.app.utils.rate_limiter import CallBudget
+from src.app.models.facility import SearchQuery, SearchResult
 
 router = APIRouter(prefix="/facilities", tags=["facilities"])
 
 
-class FacilitySearchRequest(BaseModel):
-    """Facility search request model."""
-    api_key: str
+# Most searches accepted in one batch request
+BATCH_MAX_QUERIES = 50
+
+
+class SearchCriteria(BaseModel):
+    """What to search for: a facility type in a city."""
     place_type: str
     city: str
     country: str
     max_results: int = 20
 
 
+class FacilitySearchRequest(SearchCriteria):
+    """Facility search request model."""
+    api_key: str
+    tiled: bool = False
+    # Seconds allowed for enrichment; the best leads are enriched first
+    deadline_seconds: Optional[float] = Field(default=None, ge=1, le=60)
+
+
+class FacilityBatchSearchRequest(BaseModel):
+    """Batch facility search request model (many searches sharing one quota)."""
+    api_key: str
+    queries: List[SearchCriteria] = Field(min_length=1, max_length=BATCH_MAX_QUERIES)
+    deadline_seconds: Optional[float] = Field(default=None, ge=1, le=BATCH_MAX_DEADLINE_SECONDS)
+    # Google calls the whole batch may make (cache hits are free)
+    max_upstream_calls: int = Field(default=BATCH_MAX_UPSTREAM_CALLS, ge=1, le=BATCH_MAX_UPSTREAM_CALLS)
+
+
 class FacilityResponse(BaseModel):
     """Facility response model."""
     id: int
@@ -55,9 +80,113 @@ class SearchHistoryResponse(BaseModel):
     created_at: datetime
 
 
+def _places_service(search_request: Union[FacilitySearchRequest, FacilityBatchSearchRequest], request: Request,
+                    current_user: Optional[User], call_budget: Optional[CallBudget] = None) -> PlacesService:
+    """Build a PlacesService whose upstream calls count against this caller's rate limits."""
+    return PlacesService(
+        api_key=search_request.api_key,
+        user_id=current_user.id if current_user else None,
+        client_ip=request.client.host if request.client else None,
+        call_budget=call_budget,
+    )
+
+
+def _save_search_history(
+    db: Session,
+    user_id: int,
+    username: str,
+    search_request: SearchCriteria,
+    result: SearchResult,
+    logger: logging.Logger
+) -> None:
+    """Persist a search and its facilities for a user, keeping only the latest 30 searches."""
+    try:
+        search_history = SearchHistory(
+            user_id=user_id,
+            place_type=search_request.place_type,
+            city=search_request.city,
+            country=search_request.country,
+            max_results=search_request.max_results,
+            results_count=result.total_found,
+            search_query=f"{search_request.place_type} in {search_request.city}, {search_request.country}",
+            created_at=datetime.now()
+        )
+        db.add(search_history)
+        db.commit()
+        db.refresh(search_history)
+
+        # Clean up old search history (keep only latest 30)
+        user_history_count = db.query(SearchHistory).filter(SearchHistory.user_id == user_id).count()
+        if user_history_count > 30:
+            # Delete oldest entries beyond 30
+            oldest_entries = db.query(SearchHistory).filter(
+                SearchHistory.user_id == user_id
+            ).order_by(SearchHistory.created_at.asc()).limit(user_history_count - 30).all()
+
+            for entry in oldest_entries:
+                db.delete(entry)
+            db.commit()
+            logger.info(f"facilities.search:history_cleanup user={username} deleted {len(oldest_entries)} old entries")
+
+        # Store the facilities for this search (simplified for now)
+        if result.facilities:
+            for facility_data in result.facilities:
+                facility = Facility(
+                    search_id=search_history.id,
+                    name=facility_data.name,
+                    contact_number=facility_data.contact_number or "",
+                    whatsapp_number=facility_data.whatsapp_number or "",
+                    email=facility_data.email or "",
+                    established_year=facility_data.established_year or "",
+                    location=facility_data.location or "",
+                    address=facility_data.address or "",
+                    google_rating=facility_data.google_rating or 0.0,
+                    instagram_id=facility_data.instagram_id or "",
+                    website=facility_data.website or "",
+                    place_id=facility_data.place_id or "",
+                    formatted_address=facility_data.formatted_address or "",
+                    international_phone_number=facility_data.international_phone_number or "",
+                    formatted_phone_number=facility_data.formatted_phone_number or "",
+                    url=facility_data.url or "",
+                    user_ratings_total=facility_data.user_ratings_total or 0,
+                    price_level=facility_data.price_level or 0,
+                    business_status=facility_data.business_status or "",
+                    types=json.dumps(facility_data.types) if facility_data.types else None,
+                    vicinity=facility_data.vicinity or "",
+                    plus_code=facility_data.plus_code or "",
+                    geometry=json.dumps(facility_data.geometry) if facility_data.geometry else None,
+                    created_at=datetime.now()
+                )
+                db.add(facility)
+
+            db.commit()
+            logger.info(f"facilities.search:facilities_saved count={len(result.facilities)} search_id={search_history.id}")
+
+        logger.info(f"facilities.search:history_saved id={search_history.id} user={username}")
+    except Exception as e:
+        logger.error(f"facilities.search:history_save_failed user={username} error={e}")
+        # Don't fail the search if history saving fails
+
+
+def _save_search_history_in_new_session(
+    user_id: int,
+    username: str,
+    search_request: SearchCriteria,
+    result: SearchResult,
+    logger: logging.Logger
+) -> None:
+    """``_save_search_history`` with a session of its own, for streams that outlive the request's session."""
+    db = SessionLocal()
+    try:
+        _save_search_history(db, user_id, username, search_request, result, logger)
+    finally:
+        db.close()
+
+
 @router.post("/search")
 async def search_facilities(
     search_request: FacilitySearchRequest,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_optional_user)
 ):
@@ -70,6 +199,7 @@ async def search_facilities(
         city=search_request.city,
         country=search_request.country,
         max_results=search_request.max_results,
+        tiled=search_request.tiled,
     )
 
     ok, msg = query.validate()
@@ -77,8 +207,11 @@ async def search_facilities(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
 
     try:
-        service = PlacesService(api_key=search_request.api_key)
-        result = service.search_places(query)
+        service = _places_service(search_request, request, current_user)
+        if query.tiled:
+            result = await service.search_places_tiled_async(query, search_request.deadline_seconds)
+        else:
+            result = await service.search_places_async(query, search_request.deadline_seconds)
     except HTTPException as e:
         # Re-raise HTTP exceptions from Places service
         raise e
@@ -89,74 +222,11 @@ async def search_facilities(
             detail=f"Search failed: {str(e)}"
         )
 
-    # Save search history for authenticated users
+    # Save search history for authenticated users (a blocking commit, so off the event loop)
     if current_user:
-        try:
-            search_history = SearchHistory(
-                user_id=current_user.id,
-                place_type=search_request.place_type,
-                city=search_request.city,
-                country=search_request.country,
-                max_results=search_request.max_results,
-                results_count=result.total_found,
-                search_query=f"{search_request.place_type} in {search_request.city}, {search_request.country}",
-                created_at=datetime.now()
-            )
-            db.add(search_history)
-            db.commit()
-            db.refresh(search_history)
-            
-            # Clean up old search history (keep only latest 30)
-            user_history_count = db.query(SearchHistory).filter(SearchHistory.user_id == current_user.id).count()
-            if user_history_count > 30:
-                # Delete oldest entries beyond 30
-                oldest_entries = db.query(SearchHistory).filter(
-                    SearchHistory.user_id == current_user.id
-                ).order_by(SearchHistory.created_at.asc()).limit(user_history_count - 30).all()
-                
-                for entry in oldest_entries:
-                    db.delete(entry)
-                db.commit()
-                logger.info(f"facilities.search:history_cleanup user={current_user.username} deleted {len(oldest_entries)} old entries")
-            
-            # Store the facilities for this search (simplified for now)
-            if result.facilities:
-                for facility_data in result.facilities:
-                    facility = Facility(
-                        search_id=search_history.id,
-                        name=facility_data.name,
-                        contact_number=facility_data.contact_number or "",
-                        whatsapp_number=facility_data.whatsapp_number or "",
-                        email=facility_data.email or "",
-                        established_year=facility_data.established_year or "",
-                        location=facility_data.location or "",
-                        address=facility_data.address or "",
-                        google_rating=facility_data.google_rating or 0.0,
-                        instagram_id=facility_data.instagram_id or "",
-                        website=facility_data.website or "",
-                        place_id=facility_data.place_id or "",
-                        formatted_address=facility_data.formatted_address or "",
-                        international_phone_number=facility_data.international_phone_number or "",
-                        formatted_phone_number=facility_data.formatted_phone_number or "",
-                        url=facility_data.url or "",
-                        user_ratings_total=facility_data.user_ratings_total or 0,
-                        price_level=facility_data.price_level or 0,
-                        business_status=facility_data.business_status or "",
-                        types=json.dumps(facility_data.types) if facility_data.types else None,
-                        vicinity=facility_data.vicinity or "",
-                        plus_code=facility_data.plus_code or "",
-                        geometry=json.dumps(facility_data.geometry) if facility_data.geometry else None,
-                        created_at=datetime.now()
-                    )
-                    db.add(facility)
-                
-                db.commit()
-                logger.info(f"facilities.search:facilities_saved count={len(result.facilities)} search_id={search_history.id}")
-            
-            logger.info(f"facilities.search:history_saved id={search_history.id} user={current_user.username}")
-        except Exception as e:
-            logger.error(f"facilities.search:history_save_failed user={current_user.username} error={e}")
-            # Don't fail the search if history saving fails
+        await run_in_threadpool(
+            _save_search_history, db, current_user.id, current_user.username, search_request, result, logger
+        )
 
     # Serialize dataclasses to plain dicts
     payload = asdict(result)
@@ -172,6 +242,125 @@ async def search_facilities(
     return payload
 
 
+@router.post("/search/stream")
+async def stream_search_facilities(
+    search_request: FacilitySearchRequest,
+    request: Request,
+    current_user: User = Depends(get_optional_user)
+):
+    """
+    Search facilities and stream progress as NDJSON (one JSON event per line).
+    
+    Basic rows are sent as soon as the text search returns (``facilities``),
+    followed by per-row ``patch`` events as details and website contacts arrive,
+    and a final ``summary``. Saves history if user is authenticated.
+    """
+    logger = logging.getLogger("facility_finder")
+    t0 = time.time()
+    logger.info(f"facilities.search_stream:start city={search_request.city} type={search_request.place_type} max={search_request.max_results}")
+    query = SearchQuery(
+        place_type=search_request.place_type,
+        city=search_request.city,
+        country=search_request.country,
+        max_results=search_request.max_results,
+        tiled=search_request.tiled,
+    )
+
+    ok, msg = query.validate()
+    if not ok:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=msg)
+    if query.tiled:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Tiled search is not available for streaming")
+
+    service = _places_service(search_request, request, current_user)
+    user_id = current_user.id if current_user else None
+    username = current_user.username if current_user else None
+
+    async def event_stream():
+        try:
+            async for event in service.stream_search_async(query, search_request.deadline_seconds):
+                if event['event'] == 'summary':
+                    result = event.pop('result')
+                    if user_id is not None:
+                        # The request-scoped session is closed once streaming starts; the
+                        # commits are blocking, so they run off the event loop
+                        await run_in_threadpool(
+                            _save_search_history_in_new_session, user_id, username, search_request, result, logger
+                        )
+                    event['duration_ms'] = int((time.time() - t0) * 1000)
+                    logger.info(f"facilities.search_stream:done duration_ms={event['duration_ms']} total_found={event['total_found']}")
+                yield json.dumps(event, default=str) + "\n"
+        except Exception as e:
+            logger.error(f"Unexpected error during streaming search: {e}")
+            yield json.dumps({'event': 'error', 'error_message': "Search failed"}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/search/batch")
+async def batch_search_facilities(
+    batch_request: FacilityBatchSearchRequest,
+    request: Request,
+    current_user: User = Depends(get_optional_user)
+):
+    """
+    Run many searches in one request and stream each result as NDJSON when it completes.
+    
+    Searches share concurrency and a quota of Google calls; a facility found by
+    several searches is enriched once. Emits one ``result`` event per query
+    (``index`` refers to ``queries``) and a final ``summary``. Saves history
+    for each successful search if user is authenticated.
+    """
+    logger = logging.getLogger("facility_finder")
+    t0 = time.time()
+    logger.info(f"facilities.search_batch:start queries={len(batch_request.queries)}")
+    queries = []
+    for index, item in enumerate(batch_request.queries):
+        query = SearchQuery(
+            place_type=item.place_type,
+            city=item.city,
+            country=item.country,
+            max_results=item.max_results,
+        )
+        ok, msg = query.validate()
+        if not ok:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Query {index}: {msg}")
+        queries.append(query)
+
+    budget = CallBudget(batch_request.max_upstream_calls)
+    service = _places_service(batch_request, request, current_user, call_budget=budget)
+    user_id = current_user.id if current_user else None
+    username = current_user.username if current_user else None
+
+    async def event_stream():
+        # The request-scoped session is closed once streaming starts
+        db = SessionLocal() if user_id is not None else None
+        try:
+            async for event in service.batch_search_async(queries, batch_request.deadline_seconds):
+                if event['event'] == 'result':
+                    result = event.pop('result')
+                    if db is not None and result.success:
+                        # Blocking commits; one at a time, so the session is never shared between threads
+                        await run_in_threadpool(
+                            _save_search_history, db, user_id, username, batch_request.queries[event['index']],
+                            result, logger
+                        )
+                    event.update(asdict(result))
+                else:
+                    event['upstream_calls'] = budget.used
+                    event['duration_ms'] = int((time.time() - t0) * 1000)
+                    logger.info(f"facilities.search_batch:done duration_ms={event['duration_ms']} unique_places={event['unique_places']}")
+                yield json.dumps(event, default=str) + "\n"
+        except Exception as e:
+            logger.error(f"Unexpected error during batch search: {e}")
+            yield json.dumps({'event': 'error', 'error_message': "Batch search failed"}) + "\n"
+        finally:
+            if db is not None:
+                db.close()
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
 @router.get("/history", response_model=List[SearchHistoryResponse])
 async def get_search_history(
     skip: int = Query(0, ge=0),
@@ -0,0 +1,656 @@
+"""
+Local stand-in for the upstream APIs used by search and enrichment.
+
+Speaks the subset of each API the services call (Google Places text search,
+nearby search and details, Google Geocoding, Yelp business search, Foursquare
+place search and the Overpass interpreter) and serves a synthetic website for
+every facility that has one. Facilities are generated deterministically from a
+seed, so repeated runs see the same data. Latency, error rate, quota and the
+next_page_token activation delay are configurable per provider, which lets the
+whole pipeline be benchmarked and load-tested offline.
+
+Start it and point the services at it (the base URLs are read at import time):
+
+    python -m src.app.devtools.upstream_simulator --port 8100
+
+    GOOGLE_PLACES_BASE_URL=http://127.0.0.1:8100/maps/api/place/
+    GOOGLE_GEOCODE_URL=http://127.0.0.1:8100/maps/api/geocode/json
+    YELP_BASE_URL=http://127.0.0.1:8100/v3/businesses
+    FOURSQUARE_BASE_URL=http://127.0.0.1:8100/v3/places
+    OVERPASS_URL=http://127.0.0.1:8100/api/interpreter
+
+``GET /_sim/stats`` reports calls per provider, ``PATCH /_sim/config`` changes
+settings at runtime (e.g. ``{"providers": {"yelp": {"error_rate": 0.2}}}``) and
+``POST /_sim/reset`` clears counters, quotas and page tokens.
+"""
+
+import os
+import re
+import math
+import time
+import random
+import asyncio
+import hashlib
+import argparse
+import secrets
+import threading
+from dataclasses import dataclass, field, asdict, fields
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from fastapi import FastAPI, Request
+from fastapi.responses import HTMLResponse, JSONResponse, PlainTextResponse, Response
+
+from src.app.services.geo_tiles import haversine_meters
+
+# Configuration constants (overridable via environment)
+SIM_SEED = int(os.getenv('SIM_SEED', '1'))
+SIM_LATENCY_MS = float(os.getenv('SIM_LATENCY_MS', '80'))
+SIM_LATENCY_SIGMA = float(os.getenv('SIM_LATENCY_SIGMA', '0.5'))
+SIM_ERROR_RATE = float(os.getenv('SIM_ERROR_RATE', '0'))
+# Calls each provider answers before reporting quota exhaustion (0 = unlimited)
+SIM_QUOTA = int(os.getenv('SIM_QUOTA', '0'))
+SIM_PAGE_TOKEN_DELAY_SECONDS = float(os.getenv('SIM_PAGE_TOKEN_DELAY_SECONDS', '2.0'))
+# Mean number of facilities per keyword in each 0.01° grid cell
+SIM_PLACES_PER_CELL = float(os.getenv('SIM_PLACES_PER_CELL', '0.6'))
+SIM_WEBSITE_RATE = float(os.getenv('SIM_WEBSITE_RATE', '0.7'))
+SIM_SITE_KB = int(os.getenv('SIM_SITE_KB', '40'))
+# 'shared' serves every site from the simulator's own host; 'loopback' gives
+# each site its own 127.x.y.z host (start the simulator with --host 0.0.0.0)
+SIM_SITE_HOSTS = os.getenv('SIM_SITE_HOSTS', 'shared')
+
+PROVIDERS = ('google_places', 'google_geocoding', 'yelp', 'foursquare', 'overpass', 'websites')
+GRID_DEGREES = 0.01
+METERS_PER_DEGREE = 111320.0
+RESULTS_PER_PAGE = 20
+MAX_SEARCH_RESULTS = 60
+TEXT_SEARCH_RADIUS_METERS = 15000
+CITY_HALF_SPAN_DEGREES = 0.15
+PAGE_TOKEN_TTL_SECONDS = 300
+
+NAME_PREFIXES = ('Iron', 'Summit', 'Pulse', 'Urban', 'Core', 'Peak', 'Zen', 'Prime',
+                 'Vital', 'Apex', 'Metro', 'Blue', 'Golden', 'Northside', 'Riverside', 'Elite')
+STREETS = ('MG Road', 'Park Street', 'Station Road', 'Lake View', 'Main Street', 'Hill Road',
+           'Market Lane', 'Church Street', 'Ring Road', 'Harbour Drive')
+FILLER = ("Our certified coaches design programmes for every level, from first-timers to "
+          "competitive athletes. Members enjoy modern equipment, spacious studios and "
+          "flexible memberships with no hidden fees. ")
+
+
+@dataclass
+class ProviderProfile:
+    """Simulated behaviour of one upstream provider."""
+    latency_ms: float = SIM_LATENCY_MS  # median
+    latency_sigma: float = SIM_LATENCY_SIGMA  # log-normal spread (0 = fixed latency)
+    error_rate: float = SIM_ERROR_RATE
+    quota: int = SIM_QUOTA
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Latency of one call in seconds."""
+        if self.latency_ms <= 0:
+            return 0.0
+        spread = math.exp(rng.gauss(0.0, self.latency_sigma)) if self.latency_sigma > 0 else 1.0
+        return self.latency_ms / 1000.0 * spread
+
+
+@dataclass
+class SimulatorConfig:
+    """Data generation and fault injection settings."""
+    seed: int = SIM_SEED
+    page_token_delay_seconds: float = SIM_PAGE_TOKEN_DELAY_SECONDS
+    places_per_cell: float = SIM_PLACES_PER_CELL
+    website_rate: float = SIM_WEBSITE_RATE
+    site_kb: int = SIM_SITE_KB
+    site_hosts: str = SIM_SITE_HOSTS
+    providers: Dict[str, ProviderProfile] = field(
+        default_factory=lambda: {name: ProviderProfile() for name in PROVIDERS}
+    )
+
+    def update(self, changes: Dict[str, Any]) -> None:
+        """
+        Apply a partial update such as ``{"providers": {"yelp": {"error_rate": 0.2}}}``.
+
+        A ``"*"`` provider key applies to every provider.
+
+        Raises:
+            ValueError: For unknown settings or providers
+        """
+        for key, value in changes.items():
+            if key == 'providers':
+                for name, profile_changes in value.items():
+                    names = PROVIDERS if name == '*' else [name]
+                    for provider in names:
+                        if provider not in self.providers:
+                            raise ValueError(f"Unknown provider: {provider}")
+                        _apply_fields(self.providers[provider], profile_changes)
+            else:
+                _apply_fields(self, {key: value})
+
+
+def _apply_fields(target: Any, changes: Dict[str, Any]) -> None:
+    settable = {f.name for f in fields(target) if f.name != 'providers'}
+    for key, value in changes.items():
+        if key not in settable:
+            raise ValueError(f"Unknown setting: {key}")
+        setattr(target, key, type(getattr(target, key))(value))
+
+
+# ---------------------------------------------------------------------------
+# Synthetic data
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class SyntheticPlace:
+    """A generated facility; every attribute is derived from its place_id."""
+    place_id: str
+    keyword: str
+    name: str
+    lat: float
+    lng: float
+    rating: float
+    user_ratings_total: int
+    business_status: str
+    address: str
+    phone: str
+    established_year: int
+    has_website: bool
+
+    @property
+    def prominence(self) -> float:
+        return self.rating * math.log1p(self.user_ratings_total)
+
+
+def _unit(*parts: Any) -> float:
+    """Deterministic pseudo-random number in [0, 1) derived from ``parts``."""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') / 2 ** 64
+
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.casefold()).strip('-') or 'place'
+
+
+_PLACE_ID = re.compile(r'sim\.([a-z0-9-]+)\.(-?\d+)\.(-?\d+)\.(\d+)')
+
+
+def _make_place(config: SimulatorConfig, keyword: str, i: int, j: int, k: int) -> SyntheticPlace:
+    key = (config.seed, keyword, i, j, k)
+    number = int(_unit(*key, 'number') * 900) + 1
+    return SyntheticPlace(
+        place_id=f"sim.{keyword}.{i}.{j}.{k}",
+        keyword=keyword,
+        name=f"{NAME_PREFIXES[int(_unit(*key, 'name') * len(NAME_PREFIXES))]} "
+             f"{keyword.replace('-', ' ').title()} {number}",
+        lat=round((i + _unit(*key, 'lat')) * GRID_DEGREES, 6),
+        lng=round((j + _unit(*key, 'lng')) * GRID_DEGREES, 6),
+        rating=round(1.0 + 4.0 * _unit(*key, 'rating'), 1),
+        user_ratings_total=int(_unit(*key, 'reviews') ** 3 * 5000),
+        business_status='CLOSED_PERMANENTLY' if _unit(*key, 'closed') < 0.03 else 'OPERATIONAL',
+        address=f"{number} {STREETS[int(_unit(*key, 'street') * len(STREETS))]}",
+        phone=f"+1 555 {int(_unit(*key, 'phone') * 9000000) + 1000000:07d}",
+        established_year=1980 + int(_unit(*key, 'year') * 44),
+        has_website=_unit(*key, 'website') < config.website_rate,
+    )
+
+
+def place_from_id(config: SimulatorConfig, place_id: str) -> Optional[SyntheticPlace]:
+    """Regenerate a place from its id (None if the id was not issued by the simulator)."""
+    match = _PLACE_ID.fullmatch(place_id or '')
+    if not match:
+        return None
+    keyword, i, j, k = match.group(1), int(match.group(2)), int(match.group(3)), int(match.group(4))
+    return _make_place(config, keyword, i, j, k)
+
+
+def places_near(config: SimulatorConfig, keyword: str, lat: float, lng: float,
+                radius: float) -> List[SyntheticPlace]:
+    """Facilities matching ``keyword`` within ``radius`` meters, most prominent first."""
+    keyword = _slug(keyword)
+    d_lat = radius / METERS_PER_DEGREE
+    d_lng = radius / (METERS_PER_DEGREE * max(math.cos(math.radians(lat)), 0.01))
+    found = []
+    for i in range(math.floor((lat - d_lat) / GRID_DEGREES), math.floor((lat + d_lat) / GRID_DEGREES) + 1):
+        for j in range(math.floor((lng - d_lng) / GRID_DEGREES), math.floor((lng + d_lng) / GRID_DEGREES) + 1):
+            count = int(_unit(config.seed, keyword, i, j, 'count') * 2 * config.places_per_cell + 0.5)
+            for k in range(count):
+                place = _make_place(config, keyword, i, j, k)
+                if haversine_meters(lat, lng, place.lat, place.lng) <= radius:
+                    found.append(place)
+    found.sort(key=lambda p: p.prominence, reverse=True)
+    return found
+
+
+def city_center(config: SimulatorConfig, address: str) -> Tuple[float, float]:
+    """Deterministic location of a geocoded address."""
+    key = (config.seed, _slug(address))
+    return round(-40.0 + 95.0 * _unit(*key, 'lat'), 6), round(-170.0 + 340.0 * _unit(*key, 'lng'), 6)
+
+
+def site_url_for(config: SimulatorConfig, place: SyntheticPlace, base_url: str) -> str:
+    """URL of a facility's synthetic website on the simulator serving ``base_url``."""
+    if config.site_hosts == 'loopback':
+        h = int(_unit(config.seed, place.place_id, 'host') * 254 ** 3)
+        host = f"127.{h % 254 + 1}.{h // 254 % 254 + 1}.{h // 254 ** 2 % 254 + 1}"
+        port = urlsplit(base_url).port or 80
+        return f"http://{host}:{port}/sites/{place.place_id}/"
+    return f"{base_url.rstrip('/')}/sites/{place.place_id}/"
+
+
+def _google_place(place: SyntheticPlace, site_url: Optional[str]) -> Dict[str, Any]:
+    result = {
+        'place_id': place.place_id,
+        'name': place.name,
+        'formatted_address': place.address,
+        'vicinity': place.address,
+        'international_phone_number': place.phone,
+        'formatted_phone_number': place.phone.replace('+1 ', '(').replace(' ', ') ', 1),
+        'rating': place.rating,
+        'user_ratings_total': place.user_ratings_total,
+        'business_status': place.business_status,
+        'types': [place.keyword.replace('-', '_'), 'point_of_interest', 'establishment'],
+        'geometry': {'location': {'lat': place.lat, 'lng': place.lng}},
+        'url': f"https://maps.google.com/?cid={int(_unit(place.place_id, 'cid') * 10 ** 12)}",
+    }
+    if site_url:
+        result['website'] = site_url
+    return result
+
+
+def _site_html(config: SimulatorConfig, place: SyntheticPlace, page: str) -> str:
+    handle = _slug(place.name).replace('-', '')
+    email = f"hello@{handle}.example.com"
+    digits = re.sub(r'\D', '', place.phone)
+    email_on_home = _unit(config.seed, place.place_id, 'email') < 0.4
+    nav = (f'<nav><a href="/sites/{place.place_id}/">Home</a> '
+           f'<a href="/sites/{place.place_id}/about">About us</a> '
+           f'<a href="/sites/{place.place_id}/contact">Contact us</a></nav>')
+    if page == 'contact':
+        body = (f'<h1>Contact {place.name}</h1>'
+                f'<p>Email: <a href="mailto:{email}">{email}</a></p>'
+                f'<p class="address">{place.address}</p><p>Phone: {place.phone}</p>'
+                f'<script type="application/ld+json">{{"@type": "LocalBusiness", "name": "{place.name}", '
+                f'"telephone": "{place.phone}", "email": "{email}"}}</script>')
+    elif page == 'about':
+        body = f'<h1>About us</h1><p class="about">Established in {place.established_year}. {FILLER}</p>'
+    else:
+        body = (f'<h1>{place.name}</h1><p>Serving our community since {place.established_year}.</p>'
+                f'<p>Call us: {place.phone}</p><div class="hours">Mon-Sat 06:00-22:00</div>'
+                f'<a href="https://www.instagram.com/{handle}/">Instagram</a> '
+                f'<a href="https://wa.me/{digits}">WhatsApp</a>'
+                + (f' <a href="mailto:{email}">Email us</a>' if email_on_home else ''))
+    html = (f'<!DOCTYPE html><html><head><title>{place.name}</title>'
+            f'<meta name="description" content="{place.name} - {place.keyword}"></head>'
+            f'<body><header>{nav}</header><main>{body}')
+    section = f'<section><p>{FILLER}</p></section>'
+    html += section * (max(0, config.site_kb * 1024 - len(html)) // len(section))
+    return html + '</main><footer>&copy; ' + place.name + '</footer></body></html>'
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _ProviderStats:
+    calls: int = 0
+    errors: int = 0
+    quota_exceeded: int = 0
+
+
+@dataclass
+class _PendingPage:
+    places: List[SyntheticPlace]
+    ready_at: float
+
+
+class UpstreamSimulator:
+    """State behind the simulator app: configuration, counters and page tokens."""
+
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear counters, quota usage and outstanding page tokens."""
+        with self._lock:
+            self._rng = random.Random(self.config.seed)
+            self._stats = {name: _ProviderStats() for name in PROVIDERS}
+            self._tokens: Dict[str, _PendingPage] = {}
+
+    async def admit(self, provider: str) -> Optional[str]:
+        """
+        Count a call, wait its simulated latency and decide its fault.
+
+        Returns:
+            None for a normal answer, 'quota' or 'error'
+        """
+        profile = self.config.providers[provider]
+        with self._lock:
+            stats = self._stats[provider]
+            stats.calls += 1
+            latency = profile.sample_latency(self._rng)
+            fault = None
+            if profile.quota and stats.calls > profile.quota:
+                stats.quota_exceeded += 1
+                fault = 'quota'
+            elif self._rng.random() < profile.error_rate:
+                stats.errors += 1
+                fault = 'error'
+        if latency:
+            await asyncio.sleep(latency)
+        return fault
+
+    def paginate(self, places: List[SyntheticPlace]) -> Tuple[List[SyntheticPlace], Optional[str]]:
+        """First page of ``places`` and a token for the rest (Google caps a search at 60)."""
+        places = places[:MAX_SEARCH_RESULTS]
+        page, rest = places[:RESULTS_PER_PAGE], places[RESULTS_PER_PAGE:]
+        if not rest:
+            return page, None
+        token = secrets.token_urlsafe(24)
+        now = time.monotonic()
+        with self._lock:
+            # Google tokens only become valid a short while after they are issued
+            self._tokens[token] = _PendingPage(rest, now + self.config.page_token_delay_seconds)
+            for stale in [t for t, p in self._tokens.items() if now - p.ready_at > PAGE_TOKEN_TTL_SECONDS]:
+                del self._tokens[stale]
+        return page, token
+
+    def redeem(self, token: str) -> Tuple[str, List[SyntheticPlace], Optional[str]]:
+        """Resolve a page token to (status, page, next token)."""
+        with self._lock:
+            pending = self._tokens.get(token)
+            if pending is None:
+                return 'INVALID_REQUEST', [], None
+            if time.monotonic() < pending.ready_at:
+                return 'INVALID_REQUEST', [], None
+            del self._tokens[token]
+        page, next_token = self.paginate(pending.places)
+        return 'OK', page, next_token
+
+    def site_url(self, request: Request, place: SyntheticPlace) -> Optional[str]:
+        """Public URL of a facility's synthetic website (None if it has none)."""
+        if not place.has_website:
+            return None
+        return site_url_for(self.config, place, str(request.base_url))
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls, injected errors and quota rejections per provider."""
+        with self._lock:
+            return {
+                'providers': {name: asdict(stats) for name, stats in self._stats.items()},
+                'pending_page_tokens': len(self._tokens),
+            }
+
+
+def _google_fault(fault: str) -> JSONResponse:
+    if fault == 'quota':
+        return JSONResponse({'status': 'OVER_QUERY_LIMIT', 'results': [],
+                             'error_message': 'You have exceeded your daily request quota for this API.'})
+    return JSONResponse({'status': 'UNKNOWN_ERROR', 'results': []}, status_code=500)
+
+
+def _rest_fault(fault: str) -> JSONResponse:
+    if fault == 'quota':
+        return JSONResponse({'error': {'code': 'ACCESS_LIMIT_REACHED',
+                                       'description': 'Daily quota exceeded'}}, status_code=429)
+    return JSONResponse({'error': {'code': 'INTERNAL_ERROR'}}, status_code=500)
+
+
+def _missing_key() -> JSONResponse:
+    return JSONResponse({'status': 'REQUEST_DENIED', 'results': [],
+                         'error_message': 'You must use an API key to authenticate each request.'})
+
+
+def create_app(config: Optional[SimulatorConfig] = None) -> FastAPI:
+    """Build a simulator app with its own state."""
+    sim = UpstreamSimulator(config)
+    app = FastAPI(title="Upstream API Simulator", docs_url=None, redoc_url=None)
+    app.state.simulator = sim
+
+    def places_response(request: Request, status: str, page: List[SyntheticPlace],
+                        token: Optional[str]) -> JSONResponse:
+        if status == 'OK' and not page:
+            status = 'ZERO_RESULTS'
+        body: Dict[str, Any] = {
+            'status': status,
+            'results': [_google_place(p, sim.site_url(request, p)) for p in page],
+            'html_attributions': [],
+        }
+        if token:
+            body['next_page_token'] = token
+        return JSONResponse(body)
+
+    @app.get("/maps/api/place/textsearch/json")
+    async def text_search(request: Request, query: str = '', key: str = '', pagetoken: str = ''):
+        if not key:
+            return _missing_key()
+        fault = await sim.admit('google_places')
+        if fault:
+            return _google_fault(fault)
+        if pagetoken:
+            return places_response(request, *sim.redeem(pagetoken))
+        keyword, _, area = query.rpartition(' in ')
+        if not keyword:
+            keyword, area = query, query
+        lat, lng = city_center(sim.config, area)
+        places = places_near(sim.config, keyword, lat, lng, TEXT_SEARCH_RADIUS_METERS)
+        return places_response(request, 'OK', *sim.paginate(places))
+
+    @app.get("/maps/api/place/nearbysearch/json")
+    async def nearby_search(request: Request, location: str = '', radius: float = 1500,
+                            keyword: str = '', key: str = '', pagetoken: str = ''):
+        if not key:
+            return _missing_key()
+        fault = await sim.admit('google_places')
+        if fault:
+            return _google_fault(fault)
+        if pagetoken:
+            return places_response(request, *sim.redeem(pagetoken))
+        try:
+            lat, lng = (float(part) for part in location.split(','))
+        except ValueError:
+            return JSONResponse({'status': 'INVALID_REQUEST', 'results': []})
+        places = places_near(sim.config, keyword or 'place', lat, lng, min(radius, 50000))
+        return places_response(request, 'OK', *sim.paginate(places))
+
+    @app.get("/maps/api/place/details/json")
+    async def place_details(request: Request, place_id: str = '', fields: str = '', key: str = ''):
+        if not key:
+            return _missing_key()
+        fault = await sim.admit('google_places')
+        if fault:
+            return _google_fault(fault)
+        place = place_from_id(sim.config, place_id)
+        if place is None:
+            return JSONResponse({'status': 'NOT_FOUND'})
+        result = _google_place(place, sim.site_url(request, place))
+        if fields:
+            wanted = {name.strip() for name in fields.split(',')}
+            result = {name: value for name, value in result.items() if name in wanted}
+        return JSONResponse({'status': 'OK', 'result': result, 'html_attributions': []})
+
+    @app.get("/maps/api/geocode/json")
+    async def geocode(address: str = '', key: str = ''):
+        if not key:
+            return _missing_key()
+        fault = await sim.admit('google_geocoding')
+        if fault:
+            return _google_fault(fault)
+        if not address.strip():
+            return JSONResponse({'status': 'ZERO_RESULTS', 'results': []})
+        lat, lng = city_center(sim.config, address)
+        span = CITY_HALF_SPAN_DEGREES
+        viewport = {'northeast': {'lat': lat + span, 'lng': lng + span},
+                    'southwest': {'lat': lat - span, 'lng': lng - span}}
+        return JSONResponse({'status': 'OK', 'results': [{
+            'formatted_address': address,
+            'geometry': {'location': {'lat': lat, 'lng': lng}, 'viewport': viewport, 'bounds': viewport},
+        }]})
+
+    @app.get("/v3/businesses/search")
+    async def yelp_search(request: Request, term: str = '', location: str = '', limit: int = 20):
+        if 'authorization' not in request.headers:
+            return JSONResponse({'error': {'code': 'TOKEN_MISSING'}}, status_code=401)
+        fault = await sim.admit('yelp')
+        if fault:
+            return _rest_fault(fault)
+        key = (sim.config.seed, 'yelp', term.casefold(), location.casefold())
+        if not term or _unit(*key, 'found') > 0.8:
+            return JSONResponse({'businesses': [], 'total': 0})
+        businesses = [{
+            'id': _slug(f"{term}-{location}-{n}"),
+            'name': term,
+            'rating': round(2 * (1 + 4 * _unit(*key, n, 'rating'))) / 2,
+            'review_count': int(_unit(*key, n, 'reviews') * 800),
+            'price': '$' * (1 + int(_unit(*key, n, 'price') * 4)),
+            'phone': f"+1555{int(_unit(*key, n, 'phone') * 9000000) + 1000000}",
+            'url': f"https://www.yelp.com/biz/{_slug(term)}-{n}",
+            'categories': [{'alias': 'gyms', 'title': 'Gyms'}],
+            'location': {'address1': f"{n + 1} {STREETS[n % len(STREETS)]}", 'address2': '',
+                         'city': location.split(',')[0].strip()},
+        } for n in range(max(1, min(limit, 3)))]
+        return JSONResponse({'businesses': businesses, 'total': len(businesses)})
+
+    @app.get("/v3/places/search")
+    async def foursquare_search(request: Request, query: str = '', near: str = '', limit: int = 10):
+        if 'authorization' not in request.headers:
+            return JSONResponse({'message': 'Unauthorized'}, status_code=401)
+        fault = await sim.admit('foursquare')
+        if fault:
+            return _rest_fault(fault)
+        key = (sim.config.seed, 'foursquare', query.casefold(), near.casefold())
+        if not query or _unit(*key, 'found') > 0.7:
+            return JSONResponse({'results': []})
+        results = [{
+            'fsq_id': hashlib.md5(f"{query}|{near}|{n}".encode()).hexdigest()[:24],
+            'name': query,
+            'location': {'address': f"{n + 1} {STREETS[n % len(STREETS)]}",
+                         'city': near.split(',')[0].strip()},
+            'rating': round(10 * _unit(*key, n, 'rating'), 1),
+            'price': 1 + int(_unit(*key, n, 'price') * 4),
+            'categories': [{'name': 'Gym and Studio'}],
+            'contact': {'phone': f"+1555{int(_unit(*key, n, 'phone') * 9000000) + 1000000}"},
+        } for n in range(max(1, min(limit, 3)))]
+        return JSONResponse({'results': results})
+
+    @app.post("/api/interpreter")
+    async def overpass(request: Request):
+        fault = await sim.admit('overpass')
+        if fault:
+            if fault == 'quota':
+                return PlainTextResponse("rate_limited", status_code=429)
+            return PlainTextResponse("runtime error", status_code=504)
+        body = (await request.body()).decode(errors='replace')
+        match = re.search(r'"name"~"([^"]+)"', body)
+        if not match or _unit(sim.config.seed, 'osm', match.group(1).casefold()) > 0.6:
+            return JSONResponse({'elements': []})
+        name = match.group(1)
+        key = (sim.config.seed, 'osm', name.casefold())
+        return JSONResponse({'elements': [{
+            'type': 'node',
+            'id': int(_unit(*key, 'id') * 10 ** 10),
+            'lat': round(-40 + 95 * _unit(*key, 'lat'), 6),
+            'lon': round(-170 + 340 * _unit(*key, 'lng'), 6),
+            'tags': {'name': name, 'shop': 'sports', 'addr:street': STREETS[int(_unit(*key, 'st') * len(STREETS))],
+                     'addr:city': 'Simville', 'opening_hours': 'Mo-Sa 06:00-22:00'},
+        }]})
+
+    @app.api_route("/sites/{place_id}/{page:path}", methods=["GET", "HEAD"])
+    async def website(request: Request, place_id: str, page: str = ''):
+        place = place_from_id(sim.config, place_id)
+        fault = await sim.admit('websites')
+        if place is None or not place.has_website or page not in ('', 'about', 'contact'):
+            return HTMLResponse("<html><body>Not found</body></html>", status_code=404)
+        if fault:
+            return HTMLResponse("<html><body>Service unavailable</body></html>",
+                                status_code=429 if fault == 'quota' else 503)
+        # Pages never change for a seed, so revalidation always answers 304
+        etag = f'"{hashlib.sha1(f"{sim.config.seed}|{place_id}|{page}".encode()).hexdigest()[:16]}"'
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers={'ETag': etag})
+        return HTMLResponse(_site_html(sim.config, place, page), headers={'ETag': etag})
+
+    @app.get("/robots.txt")
+    async def robots():
+        return PlainTextResponse("User-agent: *\nAllow: /\n")
+
+    @app.get("/_sim/stats")
+    async def simulator_stats():
+        return sim.stats()
+
+    @app.get("/_sim/config")
+    async def simulator_config():
+        return asdict(sim.config)
+
+    @app.patch("/_sim/config")
+    async def update_simulator_config(changes: Dict[str, Any]):
+        try:
+            sim.config.update(changes)
+        except (ValueError, TypeError) as e:
+            return JSONResponse({'detail': str(e)}, status_code=400)
+        return asdict(sim.config)
+
+    @app.post("/_sim/reset")
+    async def reset_simulator():
+        sim.reset()
+        return Response(status_code=204)
+
+    return app
+
+
+def service_environment(base_url: str) -> Dict[str, str]:
+    """Environment variables that point the services at a simulator running at ``base_url``."""
+    base = base_url.rstrip('/')
+    return {
+        'GOOGLE_PLACES_BASE_URL': f"{base}/maps/api/place/",
+        'GOOGLE_GEOCODE_URL': f"{base}/maps/api/geocode/json",
+        'YELP_BASE_URL': f"{base}/v3/businesses",
+        'FOURSQUARE_BASE_URL': f"{base}/v3/places",
+        'OVERPASS_URL': f"{base}/api/interpreter",
+    }
+
+
+def start_in_thread(config: Optional[SimulatorConfig] = None, host: str = '127.0.0.1',
+                    port: int = 0) -> Tuple[Any, str]:
+    """
+    Serve a simulator from a background thread (port 0 picks a free port).
+
+    Returns:
+        Tuple of (uvicorn server, base URL); set ``server.should_exit = True`` to stop it
+    """
+    import uvicorn
+
+    server = uvicorn.Server(uvicorn.Config(create_app(config), host=host, port=port,
+                                           log_level='error', lifespan='off'))
+    thread = threading.Thread(target=server.run, name='upstream-simulator', daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("Upstream simulator failed to start")
+        time.sleep(0.01)
+    bound_port = server.servers[0].sockets[0].getsockname()[1]
+    return server, f"http://{host}:{bound_port}"
+
+
+# Default app for ``uvicorn src.app.devtools.upstream_simulator:app``
+app = create_app()
+
+
+def main() -> None:
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8100)
+    args = parser.parse_args()
+    base_url = f"http://{args.host}:{args.port}"
+    print("Point the services at the simulator with:")
+    for name, value in service_environment(base_url).items():
+        print(f"  {name}={value}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level='error')
+
+
+if __name__ == "__main__":
+    main()
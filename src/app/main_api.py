@@ -4,6 +4,7 @@ This is the backend API server.
 """
 
 from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import uvicorn
@@ -16,6 +17,13 @@ import json
 from .database.connection import create_tables
 from .api import auth, facilities_simple, leads
 from .api.delete_search_history import router as delete_history_router
+from .utils.http_client import http_clients
+from .utils.provider_health import provider_health
+from .services.details_cache import details_cache
+from .services.search_cache import search_cache
+from .utils.scrape_cache import scrape_cache
+from .utils.web_scraper import parse_stage
+from .services.places_service import coalescing_stats
 
 # Create FastAPI app
 app = FastAPI(
@@ -92,6 +100,14 @@ async def startup_event():
     logger.info("Database tables created successfully")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled upstream HTTP connections and stop parse workers."""
+    await http_clients.aclose()
+    http_clients.close()
+    parse_stage.shutdown()
+
+
 @app.get("/")
 async def root():
     """Root endpoint."""
@@ -112,6 +128,28 @@ async def health_check():
     return {"status": "healthy", "timestamp": "2024-01-01T00:00:00Z"}
 
 
+def _cache_stats():
+    return {
+        "place_details": details_cache.stats(),
+        "text_search": search_cache.stats(),
+        "scraped_websites": scrape_cache.stats(),
+        "coalesced_requests": coalescing_stats(),
+    }
+
+
+@app.get("/health/cache")
+async def cache_stats():
+    """Hit/miss statistics for upstream response caches."""
+    # The persistent caches count their SQLite rows under their locks, which searches also hold
+    return await run_in_threadpool(_cache_stats)
+
+
+@app.get("/health/providers")
+async def provider_stats():
+    """Latency, error rate and circuit breaker state per upstream provider."""
+    return provider_health.snapshot()
+
+
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Global HTTP exception handler."""
@@ -3,9 +3,13 @@ Data models for fitness facilities and related entities.
 """
 
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Iterable, Union
 from datetime import datetime
 
+# Result caps: one text search returns at most 60 places; tiled city searches go further
+MAX_SEARCH_RESULTS = 60
+MAX_TILED_SEARCH_RESULTS = 500
+
 
 @dataclass
 class Facility:
@@ -45,6 +49,9 @@ class Facility:
     description: str = ""
     founded: str = ""
     
+    # Enrichment progress: "pending", "partial" (details merged, website not yet scraped) or "complete"
+    enrichment_status: str = "pending"
+    
     def __post_init__(self):
         """Initialize default values for mutable fields."""
         if self.types is None:
@@ -148,6 +155,7 @@ class SearchQuery:
     city: str
     country: str
     max_results: int = 20
+    tiled: bool = False
     
     def to_google_query(self) -> str:
         """Convert to Google Places API query format."""
@@ -164,8 +172,9 @@ class SearchQuery:
         if not self.country or not self.country.strip():
             return False, "Country is required"
         
-        if self.max_results < 1 or self.max_results > 60:
-            return False, "Max results must be between 1 and 60"
+        limit = MAX_TILED_SEARCH_RESULTS if self.tiled else MAX_SEARCH_RESULTS
+        if self.max_results < 1 or self.max_results > limit:
+            return False, f"Max results must be between 1 and {limit}"
         
         return True, "Valid query"
 
@@ -183,6 +192,56 @@ class ContactInfo:
         return not any([self.email, self.whatsapp, self.instagram, self.established_year])
 
 
+# Facility field filled by each ScrapedProfile field
+SCRAPED_FACILITY_FIELDS = {
+    'email': 'email',
+    'whatsapp': 'whatsapp_number',
+    'instagram': 'instagram_id',
+    'established_year': 'established_year',
+    'facebook': 'facebook',
+    'twitter': 'twitter',
+    'linkedin': 'linkedin',
+    'youtube': 'youtube',
+    'phone': 'phone',
+    'address': 'address',
+    'hours': 'hours',
+    'description': 'description',
+    'founded': 'founded',
+}
+
+
+@dataclass
+class ScrapedProfile(ContactInfo):
+    """Everything extracted from a facility's website: contact details plus social links and business details."""
+    facebook: str = ""
+    twitter: str = ""
+    linkedin: str = ""
+    youtube: str = ""
+    phone: str = ""
+    address: str = ""
+    hours: str = ""
+    description: str = ""
+    founded: str = ""
+    
+    def is_empty(self) -> bool:
+        """Check if nothing was extracted."""
+        return not any(getattr(self, name) for name in SCRAPED_FACILITY_FIELDS)
+    
+    def merge_into(self, facility: Facility, overwrite: Iterable[str] = ()) -> None:
+        """
+        Copy scraped values into a facility.
+
+        Args:
+            facility: Facility to update
+            overwrite: Profile fields that replace existing facility values;
+                the others only fill empty facility fields
+        """
+        for name, target in SCRAPED_FACILITY_FIELDS.items():
+            value = getattr(self, name)
+            if value and (name in overwrite or not getattr(facility, target)):
+                setattr(facility, target, value)
+
+
 @dataclass
 class SearchResult:
     """Represents the result of a facility search."""
@@ -192,6 +251,7 @@ class SearchResult:
     timestamp: Union[datetime, float]
     success: bool = True
     error_message: str = ""
+    enriched_count: int = 0
     
     def __post_init__(self):
         """Convert timestamp to datetime if it's a float."""
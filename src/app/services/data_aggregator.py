@@ -2,18 +2,25 @@
 Comprehensive data aggregation service that combines multiple legal data sources.
 """
 
-import requests
+import os
 import time
 import logging
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from ..models.facility import Facility
+from ..models.facility import Facility, ScrapedProfile
 from ..utils.web_scraper import scrape_website_for_contacts
+from ..utils.contact_extractor import calling_code_for
+from ..utils.http_client import http_clients
 
 logger = logging.getLogger(__name__)
 
+# Provider endpoints (overridable via environment, e.g. to point at a local simulator)
+FOURSQUARE_BASE_URL = os.getenv('FOURSQUARE_BASE_URL', 'https://api.foursquare.com/v3/places')
+YELP_BASE_URL = os.getenv('YELP_BASE_URL', 'https://api.yelp.com/v3/businesses')
+OVERPASS_URL = os.getenv('OVERPASS_URL', 'https://overpass-api.de/api/interpreter')
+
 
 @dataclass
 class DataSource:
@@ -35,19 +42,19 @@ class DataAggregator:
             'foursquare': DataSource(
                 name='Foursquare',
                 api_key='',  # Set via environment variable
-                base_url='https://api.foursquare.com/v3/places',
+                base_url=FOURSQUARE_BASE_URL,
                 rate_limit=1000
             ),
             'yelp': DataSource(
                 name='Yelp',
                 api_key='',  # Set via environment variable
-                base_url='https://api.yelp.com/v3/businesses',
+                base_url=YELP_BASE_URL,
                 rate_limit=500
             ),
             'osm': DataSource(
                 name='OpenStreetMap',
                 api_key='',  # Not needed for OSM
-                base_url='https://overpass-api.de/api/interpreter',
+                base_url=OVERPASS_URL,
                 rate_limit=1000
             )
         }
@@ -85,7 +92,11 @@ class DataAggregator:
         # Always try web scraping as fallback
         if facility.website:
             try:
-                scraped_data = scrape_website_for_contacts(facility.website)
+                scraped_data = scrape_website_for_contacts(
+                    facility.website,
+                    calling_code=calling_code_for(facility.international_phone_number, facility.formatted_address,
+                                                  facility.location)
+                )
                 facility = self._merge_scraped_data(facility, scraped_data)
             except Exception as e:
                 logger.warning(f"Failed to scrape website: {e}")
@@ -110,11 +121,12 @@ class DataAggregator:
                 'limit': 1
             }
             
-            response = requests.get(
+            response = http_clients.get(
                 f"{self.sources['foursquare'].base_url}/search",
                 headers=headers,
                 params=params,
-                timeout=5
+                timeout=5,
+                provider='foursquare'
             )
             
             if response.status_code == 200:
@@ -145,11 +157,12 @@ class DataAggregator:
                 'limit': 1
             }
             
-            response = requests.get(
+            response = http_clients.get(
                 f"{self.sources['yelp'].base_url}/search",
                 headers=headers,
                 params=params,
-                timeout=5
+                timeout=5,
+                provider='yelp'
             )
             
             if response.status_code == 200:
@@ -179,10 +192,11 @@ class DataAggregator:
             out center;
             """
             
-            response = requests.post(
+            response = http_clients.post(
                 self.sources['osm'].base_url,
                 data=query,
-                timeout=5
+                timeout=5,
+                provider='overpass'
             )
             
             if response.status_code == 200:
@@ -258,17 +272,10 @@ class DataAggregator:
         
         return facility
     
-    def _merge_scraped_data(self, facility: Facility, scraped_data) -> Facility:
-        """Merge web scraped data into facility."""
+    def _merge_scraped_data(self, facility: Facility, scraped_data: ScrapedProfile) -> Facility:
+        """Merge web scraped data (contacts, social links, hours, description) into the facility's empty fields."""
         try:
-            if scraped_data.email and not facility.email:
-                facility.email = scraped_data.email
-            if scraped_data.whatsapp and not facility.whatsapp_number:
-                facility.whatsapp_number = scraped_data.whatsapp
-            if scraped_data.instagram and not facility.instagram_id:
-                facility.instagram_id = scraped_data.instagram
-            if scraped_data.established_year and not facility.established_year:
-                facility.established_year = scraped_data.established_year
+            scraped_data.merge_into(facility)
         except Exception as e:
             logger.warning(f"Error merging scraped data: {e}")
         
@@ -0,0 +1,256 @@
+"""
+Two-tier cache for Google Place Details responses keyed by place_id.
+
+Entries live in a small in-memory LRU backed by a SQLite file so they survive
+restarts and are shared by all workers on the host. Every field carries its own
+timestamp and TTL: Google allows place_id to be stored indefinitely, while other
+Places content may be cached for at most 30 days, and volatile fields (rating,
+review count, business status) are refreshed much sooner. When only some fields
+have expired, callers re-request just those fields.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DAY_SECONDS = 24 * 60 * 60
+
+# Configuration constants (overridable via environment)
+PLACES_CACHE_PATH = os.getenv(
+    'PLACES_CACHE_PATH',
+    str(Path(__file__).resolve().parents[3] / "data" / "places_cache.db")
+)
+DETAILS_CACHE_MEMORY_ENTRIES = int(os.getenv('DETAILS_CACHE_MEMORY_ENTRIES', '2000'))
+DETAILS_CACHE_MAX_ROWS = int(os.getenv('DETAILS_CACHE_MAX_ROWS', '50000'))
+
+# Google Maps Platform terms: place_id may be kept indefinitely, everything else <= 30 days
+MAX_CONTENT_TTL_SECONDS = 30 * DAY_SECONDS
+FIELD_TTLS_SECONDS: Dict[str, Optional[int]] = {
+    'place_id': None,
+    'formatted_address': 30 * DAY_SECONDS,
+    'geometry': 30 * DAY_SECONDS,
+    'types': 30 * DAY_SECONDS,
+    'url': 30 * DAY_SECONDS,
+    'name': 7 * DAY_SECONDS,
+    'international_phone_number': 7 * DAY_SECONDS,
+    'formatted_phone_number': 7 * DAY_SECONDS,
+    'website': 7 * DAY_SECONDS,
+    'rating': 1 * DAY_SECONDS,
+    'user_ratings_total': 1 * DAY_SECONDS,
+    'business_status': 1 * DAY_SECONDS,
+}
+DEFAULT_FIELD_TTL_SECONDS = 1 * DAY_SECONDS
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+    hits: int = 0
+    partial_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counters to a dictionary including the hit ratio."""
+        result = asdict(self)
+        lookups = self.hits + self.partial_hits + self.misses
+        result['hit_ratio'] = round(self.hits / lookups, 3) if lookups else 0.0
+        return result
+
+
+def field_ttl(field: str) -> Optional[int]:
+    """TTL in seconds for a Place Details field (None means no expiry)."""
+    ttl = FIELD_TTLS_SECONDS.get(field, DEFAULT_FIELD_TTL_SECONDS)
+    return None if ttl is None else min(ttl, MAX_CONTENT_TTL_SECONDS)
+
+
+class PlaceDetailsCache:
+    """
+    In-memory LRU in front of a size-bounded SQLite store of Place Details fields.
+
+    Each entry maps field name to ``[value, stored_at]``. A ``None`` value records
+    that Google returned no value for a requested field (e.g. no website), so the
+    field is not re-requested on every search. The SQLite file is opened on
+    first use.
+    """
+
+    def __init__(self, path: str = PLACES_CACHE_PATH,
+                 memory_entries: int = DETAILS_CACHE_MEMORY_ENTRIES,
+                 max_rows: int = DETAILS_CACHE_MAX_ROWS):
+        self.memory_entries = memory_entries
+        self.max_rows = max_rows
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, Dict[str, List[Any]]]" = OrderedDict()
+        self._stats = CacheStats()
+        self._writes_since_trim = 0
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._opened = False
+        self._open_lock = threading.Lock()
+
+    def _open(self, path: str) -> Optional[sqlite3.Connection]:
+        try:
+            if path != ':memory:':
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS place_details ("
+                "place_id TEXT PRIMARY KEY, payload TEXT NOT NULL, last_access REAL NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS idx_place_details_access ON place_details(last_access)")
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Place details cache running memory-only; could not open {path}: {e}")
+            return None
+
+    @property
+    def _db(self) -> Optional[sqlite3.Connection]:
+        # Opened on first use, so importing the module creates no files
+        if not self._opened:
+            with self._open_lock:
+                if not self._opened:
+                    self._connection = self._open(self.path)
+                    self._opened = True
+        return self._connection
+
+    def lookup(self, place_id: str, fields: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Look up cached fields for a place.
+
+        Args:
+            place_id: Google place_id
+            fields: Fields the caller needs
+
+        Returns:
+            Tuple of (fresh cached values, fields that are missing or expired)
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(place_id)
+            if entry is not None:
+                self._memory.move_to_end(place_id)
+            else:
+                entry = self._load(place_id, now)
+                if entry is not None:
+                    self._remember(place_id, entry)
+
+            fresh: Dict[str, Any] = {}
+            stale: List[str] = []
+            for field in fields:
+                cached = (entry or {}).get(field)
+                ttl = field_ttl(field)
+                if cached is None or (ttl is not None and now - cached[1] > ttl):
+                    stale.append(field)
+                elif cached[0] is not None:
+                    fresh[field] = cached[0]
+
+            if not stale:
+                self._stats.hits += 1
+            elif len(stale) < len(fields) and entry is not None:
+                self._stats.partial_hits += 1
+            else:
+                self._stats.misses += 1
+            return fresh, stale
+
+    def store(self, place_id: str, result: Dict[str, Any], fields: List[str]) -> None:
+        """
+        Store freshly fetched values for ``fields`` (absent fields are recorded as None).
+
+        Args:
+            place_id: Google place_id
+            result: Place Details ``result`` payload
+            fields: Fields that were requested from Google
+        """
+        now = time.time()
+        with self._lock:
+            entry = dict(self._memory.get(place_id) or self._load(place_id, now) or {})
+            for field in fields:
+                entry[field] = [result.get(field), now]
+            self._remember(place_id, entry)
+            self._save(place_id, entry, now)
+
+    def _remember(self, place_id: str, entry: Dict[str, List[Any]]) -> None:
+        self._memory[place_id] = entry
+        self._memory.move_to_end(place_id)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _load(self, place_id: str, now: float) -> Optional[Dict[str, List[Any]]]:
+        if self._db is None:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT payload FROM place_details WHERE place_id = ?", (place_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE place_details SET last_access = ? WHERE place_id = ?", (now, place_id)
+            )
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning(f"Place details cache read failed for {place_id}: {e}")
+            return None
+
+    def _save(self, place_id: str, entry: Dict[str, List[Any]], now: float) -> None:
+        if self._db is None:
+            return
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO place_details (place_id, payload, last_access) VALUES (?, ?, ?)",
+                (place_id, json.dumps(entry), now)
+            )
+            self._writes_since_trim += 1
+            if self._writes_since_trim >= 100:
+                self._trim()
+        except sqlite3.Error as e:
+            logger.warning(f"Place details cache write failed for {place_id}: {e}")
+
+    def _trim(self) -> None:
+        """Evict least recently used rows once the table exceeds ``max_rows``."""
+        self._writes_since_trim = 0
+        (count,) = self._db.execute("SELECT COUNT(*) FROM place_details").fetchone()
+        excess = count - self.max_rows
+        if excess > 0:
+            # Evict an extra 10% so trimming does not run on every write
+            excess += self.max_rows // 10
+            self._db.execute(
+                "DELETE FROM place_details WHERE place_id IN "
+                "(SELECT place_id FROM place_details ORDER BY last_access ASC LIMIT ?)",
+                (excess,)
+            )
+            self._stats.evictions += excess
+            logger.info(f"Place details cache evicted {excess} entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics and current sizes."""
+        with self._lock:
+            result = self._stats.to_dict()
+            result['memory_entries'] = len(self._memory)
+            if self._db is not None:
+                try:
+                    result['disk_entries'] = self._db.execute("SELECT COUNT(*) FROM place_details").fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return result
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM place_details")
+
+
+# Global cache instance
+details_cache = PlaceDetailsCache()
@@ -0,0 +1,163 @@
+"""
+Concurrent enrichment engine that runs staged facility work under a shared deadline.
+"""
+
+import math
+import time
+import heapq
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.app.models.facility import Facility
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_TIME_BUDGET_SECONDS = 20
+
+# Per-row enrichment states reported in Facility.enrichment_status
+STATUS_PENDING = "pending"
+STATUS_PARTIAL = "partial"
+STATUS_COMPLETE = "complete"
+
+# Review count at which the popularity term of the priority saturates
+POPULARITY_REVIEWS = 1000
+
+
+def enrichment_priority(facility: Facility) -> float:
+    """
+    Expected value of enriching a facility; higher values are enriched first.
+
+    Well-rated, much-reviewed places are the strongest leads, and rows still
+    missing contact fields gain the most from details and website scraping.
+    Permanently closed places go last.
+    """
+    missing = sum(1 for value in (facility.contact_number, facility.website, facility.email) if not value)
+    return _priority(facility.business_status, facility.google_rating, facility.user_ratings_total, missing)
+
+
+def place_priority(place: Dict[str, Any]) -> float:
+    """``enrichment_priority`` of a raw Google place, without building its Facility."""
+    # Facility.from_google_place takes the phone and website from these keys and leaves email empty
+    missing = 1 + sum(1 for key in ('international_phone_number', 'website') if not place.get(key))
+    return _priority(place.get('business_status'), place.get('rating'), place.get('user_ratings_total'), missing)
+
+
+def _priority(business_status: Optional[str], rating: Optional[float],
+              reviews: Optional[int], missing: int) -> float:
+    if business_status == 'CLOSED_PERMANENTLY':
+        return -1.0
+    popularity = min(1.0, math.log1p(reviews or 0) / math.log1p(POPULARITY_REVIEWS))
+    return (rating or 0.0) / 5.0 + popularity + 0.25 * missing
+
+
+@dataclass
+class EnrichmentReport:
+    """Summary of a single enrichment run."""
+    total: int
+    completed: int
+    timed_out: int
+    elapsed_seconds: float
+
+
+class EnrichmentEngine:
+    """
+    Bounded thread pool that executes tasks and their follow-up stages before a deadline.
+
+    Work is submitted with an optional ``then`` callback and a priority. At most
+    ``max_workers`` tasks run at once; the rest wait in a queue and the highest
+    priority task starts whenever a worker frees up. Callbacks always run on the
+    thread that calls ``run_until_complete``, so they can safely merge results into
+    shared ``Facility`` objects and submit the next stage (e.g. scraping after details).
+    At the deadline queued tasks are dropped, and running ones are abandoned and
+    never merged.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 time_budget_seconds: float = DEFAULT_TIME_BUDGET_SECONDS):
+        self.max_workers = max(1, max_workers)
+        self.started_at = time.monotonic()
+        self.deadline = self.started_at + time_budget_seconds
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich")
+        self._pending: Dict[Future, Optional[Callable[[Any], None]]] = {}
+        self._queue: List[Tuple[float, int, Callable[..., Any], Tuple[Any, ...], Optional[Callable[[Any], None]]]] = []
+        self._sequence = itertools.count()
+
+    def remaining(self) -> float:
+        """Seconds left before the shared deadline."""
+        return self.deadline - time.monotonic()
+
+    def elapsed(self) -> float:
+        """Seconds since the engine was created."""
+        return time.monotonic() - self.started_at
+
+    def submit(self, fn: Callable[..., Any], *args: Any,
+               then: Optional[Callable[[Any], None]] = None,
+               priority: float = 0.0) -> bool:
+        """
+        Queue ``fn(*args)`` for the pool (it starts once ``run_until_complete`` dispatches it).
+
+        Args:
+            fn: Blocking callable to run on a worker thread
+            then: Optional callback receiving the result (``None`` if ``fn`` raised)
+            priority: Higher values start first (ties run in submission order)
+
+        Returns:
+            False if the deadline has already passed and the task was not scheduled
+        """
+        if self.remaining() <= 0:
+            return False
+        heapq.heappush(self._queue, (-priority, next(self._sequence), fn, args, then))
+        return True
+
+    def _dispatch(self) -> None:
+        """Start queued tasks in priority order while workers are free."""
+        while self._queue and len(self._pending) < self.max_workers:
+            _, _, fn, args, then = heapq.heappop(self._queue)
+            future = self._executor.submit(fn, *args)
+            self._pending[future] = then
+
+    def run_until_complete(self) -> bool:
+        """
+        Drain submitted work (including stages submitted by callbacks).
+
+        Returns:
+            True if all work finished before the deadline, False if some was abandoned
+        """
+        try:
+            self._dispatch()
+            while self._pending:
+                remaining = self.remaining()
+                if remaining <= 0:
+                    break
+                done, _ = wait(list(self._pending), timeout=remaining, return_when=FIRST_COMPLETED)
+                for future in done:
+                    then = self._pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning(f"Enrichment task failed: {e}")
+                        result = None
+                    if then is None:
+                        continue
+                    try:
+                        then(result)
+                    except Exception as e:
+                        logger.warning(f"Enrichment callback failed: {e}")
+                self._dispatch()
+
+            outstanding = len(self._pending) + len(self._queue)
+            if outstanding:
+                logger.info(
+                    f"Enrichment deadline reached with {len(self._pending)} tasks running "
+                    f"and {len(self._queue)} queued"
+                )
+            self._queue.clear()
+            return not outstanding
+        finally:
+            # Do not block the caller on abandoned network calls
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -3,7 +3,6 @@ Comprehensive data enrichment service using multiple legal data sources.
 """
 
 import os
-import requests
 import time
 import logging
 from typing import Dict, List, Optional, Any, Tuple
@@ -11,8 +10,11 @@ from dataclasses import dataclass
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 
-from ..models.facility import Facility
+from ..models.facility import Facility, ScrapedProfile
 from ..utils.web_scraper import scrape_website_for_contacts
+from ..utils.contact_extractor import calling_code_for
+from ..utils.http_client import http_clients
+from .data_aggregator import FOURSQUARE_BASE_URL, YELP_BASE_URL, OVERPASS_URL
 
 logger = logging.getLogger(__name__)
 
@@ -114,11 +116,12 @@ class DataEnrichmentService:
                 'fields': 'name,location,rating,price,categories,contact,website,hours'
             }
             
-            response = requests.get(
-                'https://api.foursquare.com/v3/places/search',
+            response = http_clients.get(
+                f"{FOURSQUARE_BASE_URL}/search",
                 headers=headers,
                 params=params,
-                timeout=10
+                timeout=10,
+                provider='foursquare'
             )
             
             if response.status_code == 200:
@@ -152,11 +155,12 @@ class DataEnrichmentService:
                 'limit': 1
             }
             
-            response = requests.get(
-                'https://api.yelp.com/v3/businesses/search',
+            response = http_clients.get(
+                f"{YELP_BASE_URL}/search",
                 headers=headers,
                 params=params,
-                timeout=10
+                timeout=10,
+                provider='yelp'
             )
             
             if response.status_code == 200:
@@ -187,10 +191,11 @@ class DataEnrichmentService:
             out center;
             """
             
-            response = requests.post(
-                'https://overpass-api.de/api/interpreter',
+            response = http_clients.post(
+                OVERPASS_URL,
                 data=query,
-                timeout=10
+                timeout=10,
+                provider='overpass'
             )
             
             if response.status_code == 200:
@@ -213,7 +218,11 @@ class DataEnrichmentService:
             return None
         
         try:
-            scraped_data = scrape_website_for_contacts(facility.website)
+            scraped_data = scrape_website_for_contacts(
+                facility.website,
+                calling_code=calling_code_for(facility.international_phone_number, facility.formatted_address,
+                                              facility.location)
+            )
             if scraped_data and not scraped_data.is_empty():
                 return {
                     'source': 'web_scraping',
@@ -363,17 +372,10 @@ class DataEnrichmentService:
         
         return facility
     
-    def _merge_scraped_data(self, facility: Facility, scraped_data) -> Facility:
-        """Merge web scraped data into facility."""
+    def _merge_scraped_data(self, facility: Facility, scraped_data: ScrapedProfile) -> Facility:
+        """Merge web scraped data (contacts, social links, hours, description) into the facility's empty fields."""
         try:
-            if scraped_data.email and not facility.email:
-                facility.email = scraped_data.email
-            if scraped_data.whatsapp and not facility.whatsapp_number:
-                facility.whatsapp_number = scraped_data.whatsapp
-            if scraped_data.instagram and not facility.instagram_id:
-                facility.instagram_id = scraped_data.instagram
-            if scraped_data.established_year and not facility.established_year:
-                facility.established_year = scraped_data.established_year
+            scraped_data.merge_into(facility)
         except Exception as e:
             logger.warning(f"Error merging scraped data: {e}")
         
@@ -0,0 +1,85 @@
+"""
+Geographic tiles for covering a city with Places Nearby Search circles.
+
+A tile is a latitude/longitude rectangle searched with the smallest circle that
+contains it. Tiles split into four quadrants, so dense areas can be refined
+while sparse ones stay coarse.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+EARTH_RADIUS_METERS = 6371008.8
+
+
+def haversine_meters(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in meters."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * math.asin(min(1.0, math.sqrt(a)))
+
+
+@dataclass(frozen=True)
+class Tile:
+    """A latitude/longitude rectangle and its depth in the subdivision tree."""
+    south: float
+    west: float
+    north: float
+    east: float
+    depth: int = 0
+
+    @classmethod
+    def from_viewport(cls, viewport: Dict[str, Any]) -> Optional['Tile']:
+        """Build a tile from a Geocoding ``viewport``/``bounds`` object (None if malformed)."""
+        try:
+            ne, sw = viewport['northeast'], viewport['southwest']
+            return cls(south=float(sw['lat']), west=float(sw['lng']),
+                       north=float(ne['lat']), east=float(ne['lng']))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Center point as (lat, lng)."""
+        return (self.south + self.north) / 2, (self.west + self.east) / 2
+
+    @property
+    def radius_meters(self) -> float:
+        """Radius of the smallest center-based circle containing the whole tile."""
+        lat, lng = self.center
+        return max(
+            haversine_meters(lat, lng, corner_lat, corner_lng)
+            for corner_lat in (self.south, self.north)
+            for corner_lng in (self.west, self.east)
+        )
+
+    def contains(self, lat: float, lng: float) -> bool:
+        """Whether a point lies inside the tile (edges inclusive)."""
+        return self.south <= lat <= self.north and self.west <= lng <= self.east
+
+    def split(self) -> List['Tile']:
+        """The four quadrants of this tile."""
+        mid_lat, mid_lng = self.center
+        depth = self.depth + 1
+        return [
+            Tile(self.south, self.west, mid_lat, mid_lng, depth),
+            Tile(self.south, mid_lng, mid_lat, self.east, depth),
+            Tile(mid_lat, self.west, self.north, mid_lng, depth),
+            Tile(mid_lat, mid_lng, self.north, self.east, depth),
+        ]
+
+
+def cover(area: Tile, max_radius_meters: float) -> List[Tile]:
+    """Split ``area`` until every tile's search circle is within ``max_radius_meters``."""
+    tiles = [area]
+    result: List[Tile] = []
+    while tiles:
+        tile = tiles.pop()
+        if tile.radius_meters > max_radius_meters:
+            tiles.extend(tile.split())
+        else:
+            result.append(tile)
+    return result
@@ -2,53 +2,175 @@
 Google Places API service for searching and retrieving facility information.
 """
 
+import asyncio
+import hashlib
+import itertools
+import math
+import os
+import threading
 import requests
+import httpx
 import time
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import asdict
+from typing import List, Dict, Any, Optional, Tuple, Iterator, AsyncIterator
 
 # Configuration constants (replacing deleted config.settings)
-GOOGLE_PLACES_BASE_URL = "https://maps.googleapis.com/maps/api/place/"
+# Base URLs are overridable so the service can run against a local simulator
+GOOGLE_PLACES_BASE_URL = os.getenv('GOOGLE_PLACES_BASE_URL', "https://maps.googleapis.com/maps/api/place/")
 USER_AGENT = "Fitness-Facility-Finder/2.0"
 MAX_RESULTS_LIMIT = 60
+RESULTS_PER_PAGE = 20
 DEFAULT_MAX_RESULTS = 20
-from src.app.models.facility import Facility, SearchQuery, SearchResult, ContactInfo
-from src.app.utils.security import check_rate_limit, increment_request_count, secure_log_request
-from src.app.utils.web_scraper import scrape_website_for_contacts
+ENRICHMENT_MAX_WORKERS = 8
+ENRICHMENT_TIME_BUDGET_SECONDS = 20
+# Upper bound for a caller-supplied per-request deadline
+ENRICHMENT_MAX_DEADLINE_SECONDS = 60
+TEXT_SEARCH_TIMEOUT_SECONDS = 8
+DETAILS_TIMEOUT_SECONDS = 6
+# Names under which upstream health and circuit breakers are tracked
+PLACES_PROVIDER = "google_places"
+GEOCODING_PROVIDER = "google_geocoding"
+# next_page_token activation polling (Google needs ~2s before a token is usable)
+NEXT_PAGE_POLL_INITIAL_SECONDS = 1.0
+NEXT_PAGE_POLL_MAX_INTERVAL_SECONDS = 2.0
+NEXT_PAGE_TOKEN_TIMEOUT_SECONDS = 10.0
+# Request only essential fields to reduce latency
+DETAILS_FIELDS = (
+    "place_id,name,formatted_address,international_phone_number,"
+    "formatted_phone_number,website,rating,user_ratings_total,"
+    "business_status,types,geometry,url"
+)
+DETAILS_FIELD_LIST = DETAILS_FIELDS.split(',')
+# Tiled (whole-city) search
+GOOGLE_GEOCODE_URL = os.getenv('GOOGLE_GEOCODE_URL', "https://maps.googleapis.com/maps/api/geocode/json")
+NEARBY_MAX_RADIUS_METERS = 50000
+TILED_SEARCH_MAX_CALLS = 60
+TILED_SEARCH_CONCURRENCY = 6
+TILED_SEARCH_MIN_RADIUS_METERS = 250
+# Batch search (many queries in one request)
+BATCH_MAX_CONCURRENT_SEARCHES = 4
+BATCH_MAX_UPSTREAM_CALLS = 500
+BATCH_DEFAULT_DEADLINE_SECONDS = 120
+BATCH_MAX_DEADLINE_SECONDS = 300
+from src.app.models.facility import Facility, SearchQuery, SearchResult, ScrapedProfile
+from src.app.utils.security import secure_log_request
+from src.app.utils.rate_limiter import rate_limiter, RateLimitExceeded, RateLimitDecision, CallBudget
+from src.app.utils.web_scraper import CONTACT_FIELDS, scrape_website_for_contacts, async_scraper
+from src.app.utils.contact_extractor import calling_code_for
+from src.app.utils.http_client import http_clients
+from src.app.services.enrichment_engine import (
+    EnrichmentEngine, EnrichmentReport, enrichment_priority, place_priority, STATUS_PARTIAL, STATUS_COMPLETE
+)
+from src.app.services.enrichment_service import enrichment_service
+from src.app.services.details_cache import details_cache
+from src.app.services.geo_tiles import Tile, cover
+from src.app.services.search_cache import (
+    search_cache, bucket_max_results, normalize_query, CACHE_FRESH, CACHE_MISS, CACHE_STALE
+)
+from src.app.utils.single_flight import SingleFlight, AsyncSingleFlight
 
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget background tasks (cache refreshes)
+_background_tasks: set = set()
+
+# Coalesce identical concurrent text searches and detail lookups (thread and async paths)
+_text_search_flight = SingleFlight()
+_details_flight = SingleFlight()
+_async_text_search_flight = AsyncSingleFlight()
+_async_details_flight = AsyncSingleFlight()
+
+
+def _api_key_digest(api_key: str) -> str:
+    """Short hash of a Google API key, so coalescing keys never hold the raw key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _text_search_flight_key(key_digest: str, query: str, page_token: Optional[str]) -> Tuple[str, str, str]:
+    """Single-flight key for a text search page: the API key hash and the normalized query or page token."""
+    if page_token:
+        return (key_digest, 'page', page_token)
+    return (key_digest, 'query', normalize_query(query))
+
+
+def _emit(events: Optional[asyncio.Queue], event: Dict[str, Any]) -> None:
+    """Publish a streaming search event if a consumer is listening."""
+    if events is not None:
+        events.put_nowait(event)
+
+
+def coalescing_stats() -> Dict[str, Dict[str, int]]:
+    """Executed vs. coalesced upstream calls for monitoring."""
+    return {
+        'text_search': _text_search_flight.stats(),
+        'details': _details_flight.stats(),
+        'text_search_async': _async_text_search_flight.stats(),
+        'details_async': _async_details_flight.stats(),
+    }
+
+
+def _request_deadline(deadline_seconds: Optional[float] = None) -> float:
+    """Monotonic time by which a request's enrichment must stop."""
+    seconds = ENRICHMENT_TIME_BUDGET_SECONDS if deadline_seconds is None else deadline_seconds
+    return time.monotonic() + min(max(0.0, seconds), ENRICHMENT_MAX_DEADLINE_SECONDS)
+
+
+def _page_token_poll_delays() -> Iterator[float]:
+    """Delays before each attempt to use a freshly issued ``next_page_token``."""
+    delay = NEXT_PAGE_POLL_INITIAL_SECONDS
+    waited = 0.0
+    while waited < NEXT_PAGE_TOKEN_TIMEOUT_SECONDS:
+        yield delay
+        waited += delay
+        delay = min(delay * 1.5, NEXT_PAGE_POLL_MAX_INTERVAL_SECONDS)
+
 
 class PlacesService:
     """Service for interacting with Google Places API."""
     
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, user_id: Optional[int] = None, client_ip: Optional[str] = None,
+                 call_budget: Optional[CallBudget] = None):
         self.api_key = api_key
+        # Only calls made with the same key are coalesced
+        self.api_key_digest = _api_key_digest(api_key)
         self.base_url = GOOGLE_PLACES_BASE_URL
+        # Optional cap on Google calls shared by every search this service runs (batch requests)
+        self.call_budget = call_budget
+        # Rate limit buckets charged for this caller's upstream calls
+        self.rate_limit_identity = {
+            'api_key': api_key,
+            'user': str(user_id) if user_id is not None else None,
+            'ip': client_ip,
+        }
     
-    def search_places(self, query: SearchQuery) -> SearchResult:
+    def search_places(self, query: SearchQuery, deadline_seconds: Optional[float] = None) -> SearchResult:
         """
         Search for places using Google Places API.
         
         Args:
             query: SearchQuery object with search parameters
+            deadline_seconds: Time allowed for the whole search including enrichment
+                (defaults to ``ENRICHMENT_TIME_BUDGET_SECONDS``)
             
         Returns:
             SearchResult object with found facilities
         """
-        if not check_rate_limit():
+        deadline = _request_deadline(deadline_seconds)
+        decision = rate_limiter.check(self.rate_limit_identity)
+        if not decision:
             return SearchResult(
                 facilities=[],
                 total_found=0,
                 search_query=query,
                 timestamp=time.time(),
                 success=False,
-                error_message=f"Rate limit exceeded. Maximum 50 requests per 30 minutes."
+                error_message=decision.message()
             )
         
         try:
-            # Get initial results
-            places = self._get_places_from_api(query.to_google_query(), query.max_results)
+            # Get the first page now (or from cache); later pages are fetched while page one is enriched
+            places, pages = self._open_text_search(query)
             
             if not places:
                 # Try to provide more specific error message
@@ -70,8 +192,11 @@ class PlacesService:
             # Build fast results from text search only
             facilities = self._process_places_basic(places, query.city, query.max_results)
 
-            # Enrich with details for selected results within time budget
-            facilities = self._enrich_facilities_with_details(facilities)
+            # Enrich with details and website contacts concurrently within time budget
+            facilities, report = self._enrich_facilities_with_details(
+                facilities, self._iter_facility_pages(pages, query, len(facilities)) if pages else None,
+                deadline
+            )
             
             secure_log_request("search_places", success=True)
             
@@ -80,9 +205,14 @@ class PlacesService:
                 total_found=len(facilities),
                 search_query=query,
                 timestamp=time.time(),
-                success=True
+                success=True,
+                enriched_count=report.completed
             )
             
+        except RateLimitExceeded as e:
+            logger.warning(f"Search refused by rate limiter: {e}")
+            secure_log_request("search_places", success=False, error_msg=str(e))
+            return self._failed_result(query, str(e))
         except requests.RequestException as e:
             logger.error(f"Network error during search: {e}")
             secure_log_request("search_places", success=False, error_msg=f"Network error: {str(e)}")
@@ -131,8 +261,9 @@ class PlacesService:
         Returns:
             Tuple of (is_valid, message)
         """
-        if not check_rate_limit():
-            return False, f"Rate limit exceeded. Maximum 50 requests per 30 minutes."
+        decision = rate_limiter.check(self.rate_limit_identity)
+        if not decision:
+            return False, decision.message()
         
         try:
             query = f"{place_name}, {country}"
@@ -158,50 +289,198 @@ class PlacesService:
     
     def _get_places_from_api(self, query: str, max_results: int) -> List[Dict[str, Any]]:
         """Get places from Google Places API with pagination support."""
-        url = f"{self.base_url}textsearch/json"
-        params = {'query': query, 'key': self.api_key}
-        headers = {
-            'User-Agent': USER_AGENT,
-            'Accept': 'application/json'
-        }
-        
-        all_places = []
+        all_places: List[Dict[str, Any]] = []
         
         try:
-            response = requests.get(
+            for places in self._iter_text_search_pages(query, max_results):
+                all_places.extend(places)
+            
+            return all_places[:max_results]
+            
+        except requests.RequestException as e:
+            logger.error(f"Request error: {e}")
+            return all_places[:max_results]
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"Data processing error: {e}")
+            return all_places[:max_results]
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return all_places[:max_results]
+
+    def _iter_text_search_pages(self, query: str, max_results: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield text search result pages, following ``next_page_token`` until
+        ``max_results`` places have been returned or Google has no more pages.
+        """
+        page_token = None
+        fetched = 0
+        while True:
+            data = self._fetch_text_search_page(query, page_token)
+            places = self._parse_text_search_response(data, query)
+            fetched += len(places)
+            yield places
+            
+            page_token = data.get('next_page_token')
+            if not page_token or fetched >= min(max_results, MAX_RESULTS_LIMIT):
+                return
+
+    def _fetch_text_search_page(self, query: str, page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch one text search page, sharing the call with identical in-flight requests."""
+        return _text_search_flight.do(
+            _text_search_flight_key(self.api_key_digest, query, page_token),
+            self._request_text_search_page, query, page_token,
+            on_shared=self._acquire_shared_call, retry_on=(RateLimitExceeded,)
+        )
+
+    def _request_text_search_page(self, query: str, page_token: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Request one text search page from Google.
+        
+        A fresh ``next_page_token`` only becomes valid a short while after it is
+        issued; until then Google answers INVALID_REQUEST. Follow-up pages are
+        therefore polled on a short backoff schedule instead of a fixed sleep.
+        """
+        url, params, headers = self._text_search_request(query, page_token)
+        delays = _page_token_poll_delays() if page_token else iter([0.0])
+        
+        data: Dict[str, Any] = {}
+        for delay in delays:
+            if delay:
+                time.sleep(delay)
+            self._acquire_upstream_call()
+            response = http_clients.get(
                 url, 
                 params=params, 
                 headers=headers, 
-                timeout=min(8, 15)
+                timeout=TEXT_SEARCH_TIMEOUT_SECONDS,
+                provider=PLACES_PROVIDER
             )
             response.raise_for_status()
             
             data = response.json()
-            increment_request_count()
-            
-            if data.get('status') != 'OK':
-                error_status = data.get('status')
-                error_message = data.get('error_message', 'No error message provided')
-                logger.error(f"Google Places API error: {error_status} - {error_message}")
-                logger.error(f"Failed query: '{query}'")
-                logger.error(f"Full API response: {data}")
-                
-                # Raise exception with detailed error for frontend
-                from fastapi import HTTPException
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Google Places API Error: {error_status}. {error_message}. Query: '{query}'"
-                )
-                
-                return []
-            
-            places = data.get('results', [])
-            all_places.extend(places)
-            
-            # Skip pagination to keep responses fast; first page only
-            
-            return all_places[:max_results]
             
+            if not page_token or data.get('status') != 'INVALID_REQUEST':
+                break
+        return data
+
+    def _acquire_upstream_call(self, shared: bool = False) -> None:
+        """Charge one Google call to this caller's rate limit buckets (raises if refused)."""
+        decision = self._allow_upstream_call(shared)
+        if not decision:
+            raise RateLimitExceeded(decision.scope, decision.retry_after)
+
+    def _acquire_shared_call(self) -> None:
+        """Charge a result taken from another caller's identical in-flight call (raises if refused)."""
+        self._acquire_upstream_call(shared=True)
+
+    def _allow_upstream_call(self, shared: bool = False) -> RateLimitDecision:
+        """
+        Charge one Google call to the call budget (if any) and the rate limit buckets.
+        
+        A ``shared`` call (a result coalesced from another caller's request with
+        the same key) skips the API key bucket and the call budget: the key made
+        only one call, and it was not made for this caller's batch.
+        """
+        budget = None if shared else self.call_budget
+        if budget is not None and not budget.take():
+            return RateLimitDecision(False, 'batch quota', 0.0)
+        decision = rate_limiter.acquire(self._upstream_identity(shared))
+        if not decision and budget is not None:
+            budget.release()
+        return decision
+
+    async def _acquire_upstream_call_async(self, shared: bool = False) -> None:
+        """``_acquire_upstream_call`` for coroutines (a shared limiter store is used off the loop)."""
+        budget = None if shared else self.call_budget
+        if budget is not None and not budget.take():
+            raise RateLimitExceeded('batch quota', 0.0)
+        decision = await rate_limiter.acquire_async(self._upstream_identity(shared))
+        if not decision:
+            if budget is not None:
+                budget.release()
+            raise RateLimitExceeded(decision.scope, decision.retry_after)
+
+    async def _acquire_shared_call_async(self) -> None:
+        """``_acquire_shared_call`` for coroutines."""
+        await self._acquire_upstream_call_async(shared=True)
+
+    def _upstream_identity(self, shared: bool) -> Dict[str, Optional[str]]:
+        return {**self.rate_limit_identity, 'api_key': None} if shared else self.rate_limit_identity
+
+    def _open_text_search(self, query: SearchQuery
+                          ) -> Tuple[List[Dict[str, Any]], Optional[Iterator[List[Dict[str, Any]]]]]:
+        """
+        Return the first page of results and an iterator over the remaining pages.
+        
+        Fresh cache entries (including cached ZERO_RESULTS) are answered without
+        calling Google, stale entries are served while a background refresh runs,
+        and misses stream pages from Google and store them once complete.
+        """
+        query_text = query.to_google_query()
+        cached, state = search_cache.get(query_text, query.max_results)
+        if state != CACHE_MISS:
+            if state == CACHE_STALE:
+                self._revalidate_search(query_text, query.max_results)
+            return cached, None
+        
+        fetch_count = bucket_max_results(query.max_results)
+        pages = self._record_search_pages(
+            query_text, fetch_count, self._iter_text_search_pages(query_text, fetch_count)
+        )
+        return self._get_first_page(pages), pages
+
+    def _record_search_pages(self, query_text: str, fetch_count: int,
+                             pages: Iterator[List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Pass result pages through and cache them.
+        
+        The full list is cached once every page has arrived. If the consumer stops
+        early (``max_results`` reached, deadline, error), the pages fetched so far
+        are cached under the smaller bucket they cover, so repeat searches for up
+        to that many results are still answered from cache.
+        """
+        collected: List[Dict[str, Any]] = []
+        complete = False
+        try:
+            for places in pages:
+                if not places and not collected:
+                    # ZERO_RESULTS: the caller stops here, so cache the negative answer now
+                    search_cache.put(query_text, fetch_count, [])
+                collected.extend(places)
+                yield places
+            complete = True
+        finally:
+            if complete:
+                search_cache.put(query_text, fetch_count, collected)
+            elif collected:
+                search_cache.put(query_text, len(collected), collected)
+
+    def _revalidate_search(self, query_text: str, max_results: int) -> None:
+        """Refresh a stale cache entry on a background thread (at most one refresh per key)."""
+        key = search_cache.key(query_text, max_results)
+        if not search_cache.begin_refresh(key):
+            return
+        
+        def refresh() -> None:
+            try:
+                fetch_count = bucket_max_results(max_results)
+                places: List[Dict[str, Any]] = []
+                for page in self._iter_text_search_pages(query_text, fetch_count):
+                    places.extend(page)
+                search_cache.put(query_text, fetch_count, places)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for '{query_text}': {e}")
+            finally:
+                search_cache.end_refresh(key)
+        
+        threading.Thread(target=refresh, name="search-cache-refresh", daemon=True).start()
+
+    def _get_first_page(self, pages: Iterator[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Pull the first page from a page iterator, returning [] on API or data errors."""
+        try:
+            return next(pages, [])
+        except RateLimitExceeded:
+            raise
         except requests.RequestException as e:
             logger.error(f"Request error: {e}")
             return []
@@ -211,19 +490,68 @@ class PlacesService:
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             return []
+
+    def _text_search_request(self, query: str,
+                             page_token: Optional[str] = None) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Build the URL, params and headers for a text search request."""
+        url = f"{self.base_url}textsearch/json"
+        params = {'query': query, 'key': self.api_key}
+        if page_token:
+            params['pagetoken'] = page_token
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json'
+        }
+        return url, params, headers
+
+    def _parse_text_search_response(self, data: Dict[str, Any], query: str) -> List[Dict[str, Any]]:
+        """Validate a text search payload and return its results."""
+        if data.get('status') == 'ZERO_RESULTS':
+            return []
+        if data.get('status') != 'OK':
+            error_status = data.get('status')
+            error_message = data.get('error_message', 'No error message provided')
+            logger.error(f"Google Places API error: {error_status} - {error_message}")
+            logger.error(f"Failed query: '{query}'")
+            logger.error(f"Full API response: {data}")
+            
+            # Raise exception with detailed error for frontend
+            from fastapi import HTTPException
+            raise HTTPException(
+                status_code=400,
+                detail=f"Google Places API Error: {error_status}. {error_message}. Query: '{query}'"
+            )
+        
+        return data.get('results', [])
+
+    def _iter_facility_pages(self, pages: Iterator[List[Dict[str, Any]]],
+                             query: SearchQuery, already_found: int) -> Iterator[List[Facility]]:
+        """Turn remaining raw result pages into basic facilities, capped at ``query.max_results``."""
+        found = already_found
+        # Check the cap before pulling: each pull may be a Google fetch (with token polling)
+        while found < query.max_results:
+            places = next(pages, None)
+            if places is None:
+                return
+            batch = self._process_places_basic(places, query.city, query.max_results - found)
+            found += len(batch)
+            yield batch
     
-    def _process_places(self, places: List[Dict[str, Any]], location: str) -> List[Facility]:
-        """Process raw place data and enrich with detailed information under a time budget."""
+    def _process_places(self, places: List[Dict[str, Any]], location: str,
+                        deadline_seconds: Optional[float] = None) -> List[Facility]:
+        """Process raw place data and enrich the most valuable places under a time budget."""
         facilities: List[Facility] = []
-        start_time = time.time()
-        time_budget_seconds = 20
+        deadline = _request_deadline(deadline_seconds)
+        
+        # Spend the budget on the best leads first
+        places = sorted(places, key=place_priority, reverse=True)
         
         max_details = 6
         for idx, place in enumerate(places):
             if idx >= max_details:
                 break
             # stop if nearing time budget
-            if time.time() - start_time > time_budget_seconds:
+            if time.monotonic() > deadline:
                 break
             try:
                 # Get detailed information
@@ -237,7 +565,6 @@ class PlacesService:
                 
                 # Enable comprehensive data enrichment
                 try:
-                    from services.enrichment_service import enrichment_service
                     enrichment_result = enrichment_service.enrich_facility(facility)
                     facility = enrichment_result.facility
                     logger.info(f"Enriched facility {facility.name} using sources: {enrichment_result.sources_used}")
@@ -246,17 +573,11 @@ class PlacesService:
                     # Fallback to basic web scraping
                     if facility.website:
                         try:
-                            from utils.web_scraper import scrape_website_for_contacts
-                            scraped_data = scrape_website_for_contacts(facility.website)
-                            
-                            if scraped_data.email:
-                                facility.email = scraped_data.email
-                            if scraped_data.whatsapp:
-                                facility.whatsapp_number = scraped_data.whatsapp
-                            if scraped_data.instagram:
-                                facility.instagram_id = scraped_data.instagram
-                            if scraped_data.established_year:
-                                facility.established_year = scraped_data.established_year
+                            calling_code = calling_code_for(facility.international_phone_number,
+                                                            facility.formatted_address, facility.location)
+                            scraped_data = scrape_website_for_contacts(facility.website, calling_code=calling_code,
+                                                                       deadline=deadline)
+                            self._merge_scraped_profile(facility, scraped_data)
                         except Exception as scrape_error:
                             logger.warning(f"Failed to scrape website {facility.website}: {scrape_error}")
                 
@@ -298,108 +619,853 @@ class PlacesService:
                 continue
         return facilities
 
-    def _enrich_facilities_with_details(self, facilities: List[Facility]) -> List[Facility]:
-        """Fetch details for facilities within a strict time budget to populate selected fields (phone, website, etc)."""
-        start_time = time.time()
-        time_budget_seconds = 20
-        per_request_timeout_seconds = 6
-        enriched: List[Facility] = []
-
-        for idx, f in enumerate(facilities):
-            if time.time() - start_time > time_budget_seconds:
-                # Out of budget; return what we have (mix of enriched/unenriched)
-                enriched.extend(facilities[idx:])
-                break
-            if not f.place_id:
-                enriched.append(f)
-                continue
+    def _enrich_facilities_with_details(self, facilities: List[Facility],
+                                        more_pages: Optional[Iterator[List[Facility]]] = None,
+                                        deadline: Optional[float] = None
+                                        ) -> Tuple[List[Facility], EnrichmentReport]:
+        """
+        Fetch details and scrape websites concurrently until the request deadline.
+
+        Rows are enriched in order of ``enrichment_priority`` rather than list order,
+        so the best leads are finished first when the budget is tight. Each
+        facility's website scrape is queued as a second stage (at the row's
+        priority) as soon as its details arrive. If ``more_pages`` is given,
+        further text search pages are pulled ahead of other work while the first
+        page is being enriched, and their rows join the queue as they arrive.
+        Each row's ``enrichment_status`` records how far it got before the deadline.
+        """
+        if deadline is None:
+            deadline = _request_deadline()
+        engine = EnrichmentEngine(
+            max_workers=ENRICHMENT_MAX_WORKERS,
+            time_budget_seconds=max(0.0, deadline - time.monotonic())
+        )
+        finished: set = set()
+        completed: set = set()
+        priorities: Dict[int, float] = {}
+
+        def on_scraped(idx: int, scraped_data: Optional[ScrapedProfile]) -> None:
+            if scraped_data:
+                self._merge_scraped_profile(facilities[idx], scraped_data)
+            facilities[idx].enrichment_status = STATUS_COMPLETE
+            finished.add(idx)
+            completed.add(idx)
 
-            # Reuse _get_place_details (already has timeout caps)
-            details = self._get_place_details(f.place_id)
+        def on_details(idx: int, details: Optional[Dict[str, Any]]) -> None:
+            f = facilities[idx]
             if not details:
-                enriched.append(f)
-                continue
+                finished.add(idx)
+                return
+            self._merge_place_details(f, details)
+            if not f.website:
+                f.enrichment_status = STATUS_COMPLETE
+                finished.add(idx)
+                completed.add(idx)
+                return
+            f.enrichment_status = STATUS_PARTIAL
+            calling_code = calling_code_for(f.international_phone_number, f.formatted_address, f.location)
+            if not engine.submit(scrape_website_for_contacts, f.website, CONTACT_FIELDS, calling_code, deadline,
+                                 then=lambda scraped: on_scraped(idx, scraped), priority=priorities[idx]):
+                logger.info(f"Skipping website scrape for {f.name}: time budget exhausted")
 
-            # Merge details into existing record
-            try:
-                f.formatted_address = details.get('formatted_address', f.formatted_address)
-                f.international_phone_number = details.get('international_phone_number', f.international_phone_number)
-                f.formatted_phone_number = details.get('formatted_phone_number', f.formatted_phone_number)
-                f.website = details.get('website', f.website)
-                f.google_rating = details.get('rating', f.google_rating) or f.google_rating
-                f.user_ratings_total = details.get('user_ratings_total', f.user_ratings_total)
-                f.business_status = details.get('business_status', f.business_status)
-                f.types = details.get('types', f.types) or f.types
-                f.geometry = details.get('geometry', f.geometry) or f.geometry
-                
-                # Enable website scraping for additional data
-                if f.website:
-                    try:
-                        from utils.web_scraper import scrape_website_for_contacts
-                        scraped_data = scrape_website_for_contacts(f.website)
-                        
-                        # Merge scraped data into facility
-                        if scraped_data.email:
-                            f.email = scraped_data.email
-                        if scraped_data.whatsapp:
-                            f.whatsapp_number = scraped_data.whatsapp
-                        if scraped_data.instagram:
-                            f.instagram_id = scraped_data.instagram
-                        if scraped_data.established_year:
-                            f.established_year = scraped_data.established_year
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to scrape website {f.website}: {e}")
-                        # Continue without scraped data
-                        
-            except Exception:
-                pass
+        def schedule(idx: int) -> None:
+            if facilities[idx].place_id:
+                priorities[idx] = enrichment_priority(facilities[idx])
+                engine.submit(self._get_place_details, facilities[idx].place_id,
+                              then=lambda details: on_details(idx, details), priority=priorities[idx])
+
+        def on_page(batch: Optional[List[Facility]]) -> None:
+            if not batch:
+                return
+            start = len(facilities)
+            facilities.extend(batch)
+            for idx in range(start, len(facilities)):
+                schedule(idx)
+            engine.submit(next, more_pages, None, then=on_page, priority=math.inf)
 
-            enriched.append(f)
+        for idx in range(len(facilities)):
+            schedule(idx)
+        if more_pages is not None:
+            # New rows may outrank queued ones, so page fetches jump the queue
+            engine.submit(next, more_pages, None, then=on_page, priority=math.inf)
 
-        return enriched
+        engine.run_until_complete()
+
+        report = EnrichmentReport(
+            total=len(facilities),
+            completed=len(completed),
+            timed_out=sum(1 for idx, f in enumerate(facilities) if f.place_id and idx not in finished),
+            elapsed_seconds=round(engine.elapsed(), 3)
+        )
+        logger.info(
+            f"Enriched {report.completed}/{report.total} facilities in {report.elapsed_seconds}s"
+        )
+        return facilities, report
+
+    def _merge_place_details(self, f: Facility, details: Dict[str, Any]) -> None:
+        """Merge a Place Details result into an existing facility record."""
+        f.formatted_address = details.get('formatted_address', f.formatted_address)
+        f.international_phone_number = details.get('international_phone_number', f.international_phone_number)
+        f.formatted_phone_number = details.get('formatted_phone_number', f.formatted_phone_number)
+        f.website = details.get('website', f.website)
+        f.google_rating = details.get('rating', f.google_rating) or f.google_rating
+        f.user_ratings_total = details.get('user_ratings_total', f.user_ratings_total)
+        f.business_status = details.get('business_status', f.business_status)
+        f.types = details.get('types', f.types) or f.types
+        f.geometry = details.get('geometry', f.geometry) or f.geometry
+
+    def _merge_scraped_profile(self, f: Facility, scraped_data: ScrapedProfile) -> None:
+        """
+        Merge a scraped website profile into an existing facility record.
+        
+        Scraped contacts replace what the facility has; the other fields (social
+        links, hours, description, ...) only fill gaps left by Google's details.
+        """
+        scraped_data.merge_into(f, overwrite=CONTACT_FIELDS)
     
     def _get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information for a specific place."""
-        if not check_rate_limit():
+        """
+        Get detailed information for a specific place.
+        
+        Served from cache when fresh; otherwise identical in-flight lookups made
+        with the same API key share one Google call.
+        """
+        cached, stale_fields = details_cache.lookup(place_id, DETAILS_FIELD_LIST)
+        if not stale_fields:
+            return cached
+        try:
+            return _details_flight.do(
+                (self.api_key_digest, place_id), self._fetch_place_details, place_id, cached, stale_fields,
+                on_shared=self._acquire_shared_call, retry_on=(RateLimitExceeded,)
+            )
+        except RateLimitExceeded:
+            logger.warning(f"Rate limit reached; skipping details for {place_id}")
             return None
+
+    def _fetch_place_details(self, place_id: str, cached: Dict[str, Any],
+                             stale_fields: List[str]) -> Optional[Dict[str, Any]]:
+        """Request a place's missing or expired details fields from Google and merge them with ``cached``."""
+        self._acquire_upstream_call()
+        
+        # Only request the fields that are missing or expired
+        url, params, headers = self._details_request(place_id, stale_fields)
         
+        try:
+            response = http_clients.get(
+                url, 
+                params=params, 
+                headers=headers, 
+                timeout=DETAILS_TIMEOUT_SECONDS,
+                provider=PLACES_PROVIDER
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            return self._cache_details_response(place_id, data, cached, stale_fields)
+                
+        except requests.RequestException as e:
+            logger.error(f"Request error getting place details: {e}")
+            return None
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"Data error getting place details: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error getting place details: {e}")
+            return None
+
+    def _details_request(self, place_id: str,
+                         fields: Optional[List[str]] = None) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Build the URL, params and headers for a Place Details request."""
         url = f"{self.base_url}details/json"
-        # Request only essential fields to reduce latency
-        fields = (
-            "place_id,name,formatted_address,international_phone_number,"
-            "formatted_phone_number,website,rating,user_ratings_total,"
-            "business_status,types,geometry,url"
-        )
         params = {
             'place_id': place_id,
-            'fields': fields,
+            'fields': ','.join(fields) if fields else DETAILS_FIELDS,
             'key': self.api_key
         }
         headers = {
             'User-Agent': USER_AGENT,
             'Accept': 'application/json'
         }
+        return url, params, headers
+
+    def _cache_details_response(self, place_id: str, data: Dict[str, Any], cached: Dict[str, Any],
+                                fields: List[str]) -> Optional[Dict[str, Any]]:
+        """Parse a Place Details payload, store the requested fields and merge with fresh cached ones."""
+        result = self._parse_details_response(data)
+        if result is None:
+            return None
+        details_cache.store(place_id, result, fields)
+        return {**cached, **result}
+
+    def _parse_details_response(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the result of a Place Details payload, or None on API errors."""
+        if data.get('status') == 'OK':
+            return data.get('result', {})
+        logger.warning(f"Place details API error: {data.get('status')}")
+        return None
+
+    def _failed_result(self, query: SearchQuery, error_message: str) -> SearchResult:
+        """Build an unsuccessful SearchResult."""
+        return SearchResult(
+            facilities=[],
+            total_found=0,
+            search_query=query,
+            timestamp=time.time(),
+            success=False,
+            error_message=error_message
+        )
+
+    # ------------------------------------------------------------------
+    # Async API (non-blocking; safe to await from FastAPI routes)
+    # ------------------------------------------------------------------
+
+    async def search_places_async(self, query: SearchQuery, deadline_seconds: Optional[float] = None) -> SearchResult:
+        """
+        Search for places without blocking the event loop.
+        
+        Same behaviour as ``search_places``, but Google requests go through a
+        non-blocking HTTP client and website scraping runs on worker threads.
         
+        Args:
+            query: SearchQuery object with search parameters
+            deadline_seconds: Time allowed for the whole search including enrichment
+            
+        Returns:
+            SearchResult object with found facilities
+        """
+        return await self._search_async(query, deadline=_request_deadline(deadline_seconds))
+
+    async def stream_search_async(self, query: SearchQuery,
+                                  deadline_seconds: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for places and yield progress events as soon as data is available.
+        
+        Events (plain dicts, ``event`` key first):
+            ``facilities``: basic rows from a text search page (``start`` index + ``facilities``)
+            ``patch``: changed fields of one row after details or website contacts arrive
+            ``summary``: final counts; its ``result`` key holds the complete SearchResult
+        
+        Args:
+            query: SearchQuery object with search parameters
+            deadline_seconds: Time allowed for the whole search including enrichment
+        """
+        events: asyncio.Queue = asyncio.Queue()
+        search = asyncio.create_task(self._search_async(query, events, _request_deadline(deadline_seconds)))
         try:
-            response = requests.get(
-                url, 
-                params=params, 
-                headers=headers, 
-                timeout=min(6, 15)
+            while True:
+                next_event = asyncio.create_task(events.get())
+                await asyncio.wait([next_event, search], return_when=asyncio.FIRST_COMPLETED)
+                if next_event.done():
+                    yield next_event.result()
+                    continue
+                next_event.cancel()
+                while not events.empty():
+                    yield events.get_nowait()
+                break
+            
+            result = search.result()
+            yield {
+                'event': 'summary',
+                'success': result.success,
+                'error_message': result.error_message,
+                'total_found': result.total_found,
+                'enriched_count': result.enriched_count,
+                'result': result,
+            }
+        finally:
+            search.cancel()
+
+    async def search_places_tiled_async(self, query: SearchQuery,
+                                        deadline_seconds: Optional[float] = None) -> SearchResult:
+        """
+        Search a whole city by tiling its area (not limited to 60 results).
+        
+        The city is geocoded and its bounds are covered with Nearby Search
+        circles. A tile that comes back saturated (a full 60 results) is split
+        into quadrants and searched again, so only dense areas cost extra calls.
+        Tiles run concurrently within ``TILED_SEARCH_MAX_CALLS`` Google calls and
+        results are deduplicated by place_id.
+        
+        Args:
+            query: SearchQuery with ``max_results`` up to the tiled limit
+            deadline_seconds: Time allowed for enrichment once the tiles are searched
+            
+        Returns:
+            SearchResult object with found facilities
+        """
+        decision = await rate_limiter.check_async(self.rate_limit_identity)
+        if not decision:
+            return self._failed_result(query, decision.message())
+        
+        try:
+            client = http_clients.async_client()
+            area = await self._geocode_area_async(client, query)
+            if area is None:
+                return self._failed_result(query, f"Could not determine the area of '{query.city}, {query.country}'.")
+            
+            places = await self._search_tiles_async(client, query, area)
+            if not places:
+                return self._failed_result(query, "No facilities found for the given search criteria.")
+            
+            facilities = self._process_places_basic(places, query.city, query.max_results)
+            facilities, report = await self._enrich_facilities_with_details_async(
+                client, facilities, deadline=_request_deadline(deadline_seconds)
             )
-            response.raise_for_status()
             
-            data = response.json()
-            increment_request_count()
+            secure_log_request("search_places_tiled", success=True)
+            
+            return SearchResult(
+                facilities=facilities,
+                total_found=len(facilities),
+                search_query=query,
+                timestamp=time.time(),
+                success=True,
+                enriched_count=report.completed
+            )
+            
+        except RateLimitExceeded as e:
+            logger.warning(f"Tiled search refused by rate limiter: {e}")
+            secure_log_request("search_places_tiled", success=False, error_msg=str(e))
+            return self._failed_result(query, str(e))
+        except httpx.HTTPError as e:
+            logger.error(f"Network error during tiled search: {e}")
+            secure_log_request("search_places_tiled", success=False, error_msg=f"Network error: {str(e)}")
+            return self._failed_result(query, "Network error occurred. Please check your internet connection and try again.")
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"Data processing error during tiled search: {e}")
+            secure_log_request("search_places_tiled", success=False, error_msg=f"Data error: {str(e)}")
+            return self._failed_result(query, "Data processing error occurred. Please try again with different search parameters.")
+        except Exception as e:
+            logger.error(f"Unexpected error during tiled search: {e}")
+            secure_log_request("search_places_tiled", success=False, error_msg=f"Unexpected error: {str(e)}")
+            return self._failed_result(query, "An unexpected error occurred. Please try again later.")
+
+    async def batch_search_async(self, queries: List[SearchQuery],
+                                 deadline_seconds: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run many searches with shared concurrency and quota, yielding each result as it completes.
+        
+        At most ``BATCH_MAX_CONCURRENT_SEARCHES`` text searches run at once and
+        all enrichment shares one pool of ``ENRICHMENT_MAX_WORKERS`` slots. A place
+        returned by several queries is enriched once and the same record appears
+        in each of their results. Google calls count against ``self.call_budget``
+        when one is set. Rows not enriched by the deadline are returned as-is.
+        
+        Events (plain dicts, ``event`` key first):
+            ``result``: ``index`` of the query in ``queries`` and its SearchResult under ``result``
+            ``summary``: query count, unique places and number of places enriched
+        
+        Args:
+            queries: Searches to run
+            deadline_seconds: Time allowed for the whole batch
+        """
+        seconds = BATCH_DEFAULT_DEADLINE_SECONDS if deadline_seconds is None else deadline_seconds
+        deadline = time.monotonic() + min(max(0.0, seconds), BATCH_MAX_DEADLINE_SECONDS)
+        
+        decision = await rate_limiter.check_async(self.rate_limit_identity)
+        if not decision:
+            for index, query in enumerate(queries):
+                yield {'event': 'result', 'index': index, 'result': self._failed_result(query, decision.message())}
+            yield {'event': 'summary', 'queries': len(queries), 'unique_places': 0, 'enriched': 0}
+            return
+        
+        client = http_clients.async_client()
+        search_slots = asyncio.Semaphore(BATCH_MAX_CONCURRENT_SEARCHES)
+        enrich_slots = asyncio.Semaphore(ENRICHMENT_MAX_WORKERS)
+        places: Dict[str, Facility] = {}
+        enrichments: Dict[str, asyncio.Task] = {}
+        
+        async def enrich(f: Facility) -> None:
+            try:
+                async with enrich_slots:
+                    needs_scrape = await self._details_stage_async(client, f)
+                if needs_scrape:
+                    async with enrich_slots:
+                        await self._scrape_stage_async(f, deadline)
+            except Exception as e:
+                logger.warning(f"Enrichment failed for {f.name}: {e}")
+        
+        def share(facilities: List[Facility]) -> List[Facility]:
+            """Swap in the batch-wide record of each place and start enriching places seen for the first time."""
+            shared = [places.setdefault(f.place_id, f) if f.place_id else f for f in facilities]
+            # Enrichment slots are granted in request order, so start the best leads first
+            for f in sorted(shared, key=enrichment_priority, reverse=True):
+                if f.place_id and f.place_id not in enrichments:
+                    enrichments[f.place_id] = asyncio.create_task(enrich(f))
+            return shared
+        
+        async def run(index: int, query: SearchQuery) -> Tuple[int, SearchResult]:
+            try:
+                async with search_slots:
+                    if time.monotonic() >= deadline:
+                        return index, self._failed_result(query, "Batch deadline reached before this search started.")
+                    facilities = await self._collect_facilities_async(client, query)
+                if not facilities:
+                    return index, self._failed_result(query, "No facilities found for the given search criteria.")
+                
+                facilities = share(facilities)
+                tasks = [enrichments[f.place_id] for f in facilities if f.place_id]
+                if tasks:
+                    await asyncio.wait(tasks, timeout=max(0.0, deadline - time.monotonic()))
+                
+                return index, SearchResult(
+                    facilities=facilities,
+                    total_found=len(facilities),
+                    search_query=query,
+                    timestamp=time.time(),
+                    success=True,
+                    enriched_count=sum(1 for f in facilities if f.enrichment_status == STATUS_COMPLETE)
+                )
+            except RateLimitExceeded as e:
+                return index, self._failed_result(query, str(e))
+            except Exception as e:
+                logger.error(f"Batch search failed for '{query.to_google_query()}': {e}")
+                return index, self._failed_result(query, "An unexpected error occurred. Please try again later.")
+        
+        runs = [asyncio.create_task(run(index, query)) for index, query in enumerate(queries)]
+        try:
+            for next_result in asyncio.as_completed(runs):
+                index, result = await next_result
+                yield {'event': 'result', 'index': index, 'result': result}
+        finally:
+            for task in runs + list(enrichments.values()):
+                task.cancel()
+        
+        secure_log_request("batch_search", success=True)
+        yield {
+            'event': 'summary',
+            'queries': len(queries),
+            'unique_places': len(places),
+            'enriched': sum(1 for f in places.values() if f.enrichment_status == STATUS_COMPLETE),
+        }
+
+    async def _search_async(self, query: SearchQuery, events: Optional[asyncio.Queue] = None,
+                            deadline: Optional[float] = None) -> SearchResult:
+        """Shared implementation of ``search_places_async`` and ``stream_search_async``."""
+        decision = await rate_limiter.check_async(self.rate_limit_identity)
+        if not decision:
+            return self._failed_result(query, decision.message())
+        
+        try:
+            client = http_clients.async_client()
+            places, pages = await self._open_text_search_async(client, query)
+            
+            if not places:
+                error_msg = "No facilities found for the given search criteria. "
+                error_msg += f"Query: '{query.to_google_query()}'. "
+                error_msg += "This could be due to: 1) No facilities in the area, 2) API quota exceeded, 3) Invalid location, or 4) API key issues."
+                return self._failed_result(query, error_msg)
+            
+            facilities = self._process_places_basic(places, query.city, query.max_results)
+            _emit(events, {'event': 'facilities', 'start': 0, 'facilities': [asdict(f) for f in facilities]})
+            facilities, report = await self._enrich_facilities_with_details_async(
+                client, facilities, self._iter_facility_pages_async(pages, query, len(facilities)) if pages else None,
+                events, deadline
+            )
+            
+            secure_log_request("search_places", success=True)
+            
+            return SearchResult(
+                facilities=facilities,
+                total_found=len(facilities),
+                search_query=query,
+                timestamp=time.time(),
+                success=True,
+                enriched_count=report.completed
+            )
+            
+        except RateLimitExceeded as e:
+            logger.warning(f"Search refused by rate limiter: {e}")
+            secure_log_request("search_places", success=False, error_msg=str(e))
+            return self._failed_result(query, str(e))
+        except httpx.HTTPError as e:
+            logger.error(f"Network error during search: {e}")
+            secure_log_request("search_places", success=False, error_msg=f"Network error: {str(e)}")
+            return self._failed_result(query, "Network error occurred. Please check your internet connection and try again.")
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"Data processing error during search: {e}")
+            secure_log_request("search_places", success=False, error_msg=f"Data error: {str(e)}")
+            return self._failed_result(query, "Data processing error occurred. Please try again with different search parameters.")
+        except Exception as e:
+            logger.error(f"Unexpected error during search: {e}")
+            secure_log_request("search_places", success=False, error_msg=f"Unexpected error: {str(e)}")
+            return self._failed_result(query, "An unexpected error occurred. Please try again later.")
+
+    async def verify_place_async(self, place_name: str, country: str) -> Tuple[bool, str]:
+        """
+        Verify if a place exists without blocking the event loop.
+        
+        Args:
+            place_name: Name of the place to verify
+            country: Country where the place should be located
             
-            if data.get('status') == 'OK':
-                return data.get('result', {})
+        Returns:
+            Tuple of (is_valid, message)
+        """
+        decision = await rate_limiter.check_async(self.rate_limit_identity)
+        if not decision:
+            return False, decision.message()
+        
+        try:
+            client = http_clients.async_client()
+            places = await self._get_places_from_api_async(client, f"{place_name}, {country}", 1)
+            
+            if places:
+                for place in places:
+                    if country.lower() in place.get('formatted_address', '').lower():
+                        return True, f"Verified: {place.get('formatted_address', '')}"
+                return False, "Place not found in specified country"
             else:
-                logger.warning(f"Place details API error: {data.get('status')}")
-                return None
+                return False, "Place not found"
                 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
+            logger.error(f"Network error verifying place: {e}")
+            return False, "Network error occurred while verifying place"
+        except (ValueError, TypeError) as e:
+            logger.error(f"Data error verifying place: {e}")
+            return False, "Invalid place data provided"
+        except Exception as e:
+            logger.error(f"Unexpected error verifying place: {e}")
+            return False, "An unexpected error occurred while verifying place"
+
+    async def _get_places_from_api_async(self, client: httpx.AsyncClient, query: str,
+                                         max_results: int) -> List[Dict[str, Any]]:
+        """Async counterpart of ``_get_places_from_api``."""
+        all_places: List[Dict[str, Any]] = []
+        
+        try:
+            async for places in self._iter_text_search_pages_async(client, query, max_results):
+                all_places.extend(places)
+            
+            return all_places[:max_results]
+            
+        except httpx.HTTPError as e:
+            logger.error(f"Request error: {e}")
+            return all_places[:max_results]
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"Data processing error: {e}")
+            return all_places[:max_results]
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return all_places[:max_results]
+
+    async def _open_text_search_async(self, client: httpx.AsyncClient, query: SearchQuery
+                                      ) -> Tuple[List[Dict[str, Any]], Optional[AsyncIterator[List[Dict[str, Any]]]]]:
+        """Async counterpart of ``_open_text_search``."""
+        query_text = query.to_google_query()
+        cached, state = search_cache.get(query_text, query.max_results)
+        if state != CACHE_MISS:
+            if state == CACHE_STALE:
+                self._revalidate_search_async(client, query_text, query.max_results)
+            return cached, None
+        
+        fetch_count = bucket_max_results(query.max_results)
+        pages = self._record_search_pages_async(
+            query_text, fetch_count, self._iter_text_search_pages_async(client, query_text, fetch_count)
+        )
+        return await self._get_first_page_async(pages), pages
+
+    async def _record_search_pages_async(self, query_text: str, fetch_count: int,
+                                         pages: AsyncIterator[List[Dict[str, Any]]]
+                                         ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Async counterpart of ``_record_search_pages``."""
+        collected: List[Dict[str, Any]] = []
+        complete = False
+        try:
+            async for places in pages:
+                if not places and not collected:
+                    search_cache.put(query_text, fetch_count, [])
+                collected.extend(places)
+                yield places
+            complete = True
+        finally:
+            if complete:
+                search_cache.put(query_text, fetch_count, collected)
+            elif collected:
+                search_cache.put(query_text, len(collected), collected)
+
+    def _revalidate_search_async(self, client: httpx.AsyncClient, query_text: str, max_results: int) -> None:
+        """Async counterpart of ``_revalidate_search`` (runs as a background task)."""
+        key = search_cache.key(query_text, max_results)
+        if not search_cache.begin_refresh(key):
+            return
+        
+        async def refresh() -> None:
+            try:
+                fetch_count = bucket_max_results(max_results)
+                places: List[Dict[str, Any]] = []
+                async for page in self._iter_text_search_pages_async(client, query_text, fetch_count):
+                    places.extend(page)
+                search_cache.put(query_text, fetch_count, places)
+            except Exception as e:
+                logger.warning(f"Background refresh failed for '{query_text}': {e}")
+            finally:
+                search_cache.end_refresh(key)
+        
+        task = asyncio.create_task(refresh())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    async def _get_first_page_async(self, pages: AsyncIterator[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Async counterpart of ``_get_first_page``."""
+        try:
+            return await pages.__anext__()
+        except StopAsyncIteration:
+            return []
+        except RateLimitExceeded:
+            raise
+        except httpx.HTTPError as e:
+            logger.error(f"Request error: {e}")
+            return []
+        except (ValueError, TypeError, KeyError) as e:
+            logger.error(f"Data processing error: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error: {e}")
+            return []
+
+    async def _iter_text_search_pages_async(self, client: httpx.AsyncClient, query: str,
+                                            max_results: int) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Async counterpart of ``_iter_text_search_pages``."""
+        page_token = None
+        fetched = 0
+        while True:
+            data = await self._fetch_text_search_page_async(client, query, page_token)
+            places = self._parse_text_search_response(data, query)
+            fetched += len(places)
+            yield places
+            
+            page_token = data.get('next_page_token')
+            if not page_token or fetched >= min(max_results, MAX_RESULTS_LIMIT):
+                return
+
+    async def _fetch_text_search_page_async(self, client: httpx.AsyncClient, query: str,
+                                            page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Async counterpart of ``_fetch_text_search_page``."""
+        return await _async_text_search_flight.do(
+            _text_search_flight_key(self.api_key_digest, query, page_token),
+            self._request_text_search_page_async, client, query, page_token,
+            on_shared=self._acquire_shared_call_async, retry_on=(RateLimitExceeded,)
+        )
+
+    async def _request_text_search_page_async(self, client: httpx.AsyncClient, query: str,
+                                              page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Async counterpart of ``_request_text_search_page``."""
+        url, params, headers = self._text_search_request(query, page_token)
+        return await self._poll_places_page_async(client, url, params, headers, page_token)
+
+    async def _poll_places_page_async(self, client: httpx.AsyncClient, url: str, params: Dict[str, str],
+                                      headers: Dict[str, str], page_token: Optional[str]) -> Dict[str, Any]:
+        """Request a Places result page, polling while a fresh ``next_page_token`` activates."""
+        delays = _page_token_poll_delays() if page_token else iter([0.0])
+        
+        data: Dict[str, Any] = {}
+        for delay in delays:
+            if delay:
+                await asyncio.sleep(delay)
+            await self._acquire_upstream_call_async()
+            response = await client.get(url, params=params, headers=headers, timeout=TEXT_SEARCH_TIMEOUT_SECONDS,
+                                        extensions={'provider': PLACES_PROVIDER})
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            if not page_token or data.get('status') != 'INVALID_REQUEST':
+                break
+        return data
+
+    async def _collect_facilities_async(self, client: httpx.AsyncClient, query: SearchQuery) -> List[Facility]:
+        """All basic (unenriched) facilities for a query, following result pages up to ``max_results``."""
+        places, pages = await self._open_text_search_async(client, query)
+        facilities = self._process_places_basic(places, query.city, query.max_results)
+        if pages and facilities:
+            try:
+                async for batch in self._iter_facility_pages_async(pages, query, len(facilities)):
+                    facilities.extend(batch)
+            except Exception as e:
+                logger.warning(f"Stopped fetching further result pages: {e}")
+        return facilities
+
+    async def _geocode_area_async(self, client: httpx.AsyncClient, query: SearchQuery) -> Optional[Tile]:
+        """Geocode the searched city to the rectangle to tile (its bounds, else its viewport)."""
+        await self._acquire_upstream_call_async()
+        params = {'address': f"{query.city}, {query.country}", 'key': self.api_key}
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json'
+        }
+        response = await client.get(GOOGLE_GEOCODE_URL, params=params, headers=headers,
+                                    timeout=TEXT_SEARCH_TIMEOUT_SECONDS,
+                                    extensions={'provider': GEOCODING_PROVIDER})
+        response.raise_for_status()
+        
+        data = response.json()
+        if data.get('status') != 'OK' or not data.get('results'):
+            logger.error(f"Geocoding failed for '{query.city}, {query.country}': "
+                         f"{data.get('status')} - {data.get('error_message', 'No error message provided')}")
+            return None
+        geometry = data['results'][0].get('geometry', {})
+        return Tile.from_viewport(geometry.get('bounds') or geometry.get('viewport') or {})
+
+    async def _search_tiles_async(self, client: httpx.AsyncClient, query: SearchQuery,
+                                  area: Tile) -> List[Dict[str, Any]]:
+        """
+        Search tiles concurrently, splitting saturated ones, until the call budget
+        or ``query.max_results`` is reached.
+        
+        Returns:
+            Raw places deduplicated by place_id, in discovery order
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        calls_left = TILED_SEARCH_MAX_CALLS
+        semaphore = asyncio.Semaphore(TILED_SEARCH_CONCURRENCY)
+        tasks: set = set()
+        searched = 0
+        
+        async def search(tile: Tile) -> None:
+            nonlocal calls_left, searched
+            async with semaphore:
+                if calls_left <= 0 or len(found) >= query.max_results:
+                    return
+                # Reserve the tile's pages up front so concurrent tiles cannot overspend
+                reserved = min(MAX_RESULTS_LIMIT // RESULTS_PER_PAGE, calls_left)
+                calls_left -= reserved
+                used = reserved
+                try:
+                    places, used = await self._search_tile_async(client, query.place_type, tile, reserved)
+                except RateLimitExceeded as e:
+                    logger.warning(f"Tiled search stopped by rate limiter: {e}")
+                    calls_left = 0
+                    return
+                except Exception as e:
+                    logger.warning(f"Tile search failed at {tile.center}: {e}")
+                    return
+                finally:
+                    calls_left += reserved - used
+            searched += 1
+            
+            for place in places:
+                place_id = place.get('place_id')
+                if place_id and place_id not in found:
+                    found[place_id] = place
+            
+            # A full result set means the tile may hold more places than Google will list
+            if len(places) >= MAX_RESULTS_LIMIT and tile.radius_meters / 2 >= TILED_SEARCH_MIN_RADIUS_METERS:
+                for child in tile.split():
+                    spawn(child)
+        
+        def spawn(tile: Tile) -> None:
+            tasks.add(asyncio.create_task(search(tile)))
+        
+        for tile in cover(area, NEARBY_MAX_RADIUS_METERS):
+            spawn(tile)
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                tasks.difference_update(done)
+                if len(found) >= query.max_results:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        logger.info(f"Tiled search for '{query.to_google_query()}': {searched} tiles, "
+                    f"{TILED_SEARCH_MAX_CALLS - calls_left} calls, {len(found)} unique places")
+        return list(found.values())[:query.max_results]
+
+    async def _search_tile_async(self, client: httpx.AsyncClient, keyword: str, tile: Tile,
+                                 max_pages: int) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Run a paginated Nearby Search over one tile (served from the search cache when fresh).
+        
+        Returns:
+            Tuple of (places, number of pages requested from Google)
+        """
+        lat, lng = tile.center
+        radius = min(NEARBY_MAX_RADIUS_METERS, int(math.ceil(tile.radius_meters)))
+        cache_query = f"nearby {keyword} @ {lat:.5f},{lng:.5f} r{radius}"
+        cached, state = search_cache.get(cache_query, MAX_RESULTS_LIMIT)
+        if state == CACHE_FRESH:
+            return cached, 0
+        
+        places: List[Dict[str, Any]] = []
+        page_token = None
+        pages = 0
+        while pages < max_pages:
+            url, params, headers = self._nearby_search_request(keyword, lat, lng, radius, page_token)
+            data = await self._poll_places_page_async(client, url, params, headers, page_token)
+            pages += 1
+            places.extend(self._parse_text_search_response(data, cache_query))
+            page_token = data.get('next_page_token')
+            if not page_token:
+                # Only complete result sets are cached
+                search_cache.put(cache_query, MAX_RESULTS_LIMIT, places)
+                break
+        return places, pages
+
+    def _nearby_search_request(self, keyword: str, lat: float, lng: float, radius: int,
+                               page_token: Optional[str] = None) -> Tuple[str, Dict[str, str], Dict[str, str]]:
+        """Build the URL, params and headers for a Nearby Search request."""
+        url = f"{self.base_url}nearbysearch/json"
+        params = {
+            'keyword': keyword,
+            'location': f"{lat},{lng}",
+            'radius': str(radius),
+            'key': self.api_key
+        }
+        if page_token:
+            params['pagetoken'] = page_token
+        headers = {
+            'User-Agent': USER_AGENT,
+            'Accept': 'application/json'
+        }
+        return url, params, headers
+
+    async def _iter_facility_pages_async(self, pages: AsyncIterator[List[Dict[str, Any]]],
+                                         query: SearchQuery, already_found: int) -> AsyncIterator[List[Facility]]:
+        """Async counterpart of ``_iter_facility_pages``."""
+        found = already_found
+        while found < query.max_results:
+            try:
+                places = await pages.__anext__()
+            except StopAsyncIteration:
+                return
+            batch = self._process_places_basic(places, query.city, query.max_results - found)
+            found += len(batch)
+            yield batch
+
+    async def _get_place_details_async(self, client: httpx.AsyncClient, place_id: str) -> Optional[Dict[str, Any]]:
+        """Async counterpart of ``_get_place_details`` (cache reads and writes run on a worker thread)."""
+        cached, stale_fields = await asyncio.to_thread(details_cache.lookup, place_id, DETAILS_FIELD_LIST)
+        if not stale_fields:
+            return cached
+        try:
+            return await _async_details_flight.do(
+                (self.api_key_digest, place_id), self._fetch_place_details_async, client, place_id, cached,
+                stale_fields, on_shared=self._acquire_shared_call_async, retry_on=(RateLimitExceeded,)
+            )
+        except RateLimitExceeded:
+            logger.warning(f"Rate limit reached; skipping details for {place_id}")
+            return None
+
+    async def _fetch_place_details_async(self, client: httpx.AsyncClient, place_id: str, cached: Dict[str, Any],
+                                         stale_fields: List[str]) -> Optional[Dict[str, Any]]:
+        """Async counterpart of ``_fetch_place_details``."""
+        await self._acquire_upstream_call_async()
+        
+        url, params, headers = self._details_request(place_id, stale_fields)
+        
+        try:
+            response = await client.get(url, params=params, headers=headers, timeout=DETAILS_TIMEOUT_SECONDS,
+                                        extensions={'provider': PLACES_PROVIDER})
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            return await asyncio.to_thread(self._cache_details_response, place_id, data, cached, stale_fields)
+            
+        except httpx.HTTPError as e:
             logger.error(f"Request error getting place details: {e}")
             return None
         except (ValueError, TypeError, KeyError) as e:
@@ -408,3 +1474,135 @@ class PlacesService:
         except Exception as e:
             logger.error(f"Unexpected error getting place details: {e}")
             return None
+
+    async def _enrich_facilities_with_details_async(self, client: httpx.AsyncClient,
+                                                    facilities: List[Facility],
+                                                    more_pages: Optional[AsyncIterator[List[Facility]]] = None,
+                                                    events: Optional[asyncio.Queue] = None,
+                                                    deadline: Optional[float] = None
+                                                    ) -> Tuple[List[Facility], EnrichmentReport]:
+        """
+        Async counterpart of ``_enrich_facilities_with_details``.
+        
+        A fixed set of workers takes details and scrape stages from a priority
+        queue (the blocking website scraper runs on worker threads). Further text
+        search pages are consumed in the background while earlier rows are
+        enriched. At the deadline the workers are cancelled, so unfinished work is
+        never merged. If ``events`` is given, new rows and per-row field changes
+        are published to it as they happen.
+        """
+        started_at = time.monotonic()
+        if deadline is None:
+            deadline = _request_deadline()
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        sequence = itertools.count()
+        finished: set = set()
+        completed: set = set()
+
+        def emit_patch(idx: int, f: Facility, before: Dict[str, Any]) -> None:
+            if events is None:
+                return
+            fields = {k: v for k, v in asdict(f).items() if before.get(k) != v}
+            if fields:
+                _emit(events, {'event': 'patch', 'index': idx, 'place_id': f.place_id, 'fields': fields})
+
+        async def run_stage(rank: float, idx: int, stage: str) -> None:
+            f = facilities[idx]
+            before = asdict(f) if events is not None else {}
+            if stage == 'details':
+                needs_scrape = await self._details_stage_async(client, f)
+                if needs_scrape is None:
+                    finished.add(idx)
+                    return
+                emit_patch(idx, f, before)
+                if needs_scrape:
+                    queue.put_nowait((rank, next(sequence), idx, 'scrape'))
+                    return
+            else:
+                await self._scrape_stage_async(f, deadline)
+                emit_patch(idx, f, before)
+            finished.add(idx)
+            completed.add(idx)
+
+        async def worker() -> None:
+            while True:
+                rank, _, idx, stage = await queue.get()
+                try:
+                    await run_stage(rank, idx, stage)
+                except Exception as e:
+                    logger.warning(f"Enrichment failed for {facilities[idx].name}: {e}")
+                    finished.add(idx)
+                finally:
+                    queue.task_done()
+
+        def schedule(start: int) -> None:
+            for idx in range(start, len(facilities)):
+                if facilities[idx].place_id:
+                    # PriorityQueue pops the smallest entry, so rank by negated priority
+                    queue.put_nowait((-enrichment_priority(facilities[idx]), next(sequence), idx, 'details'))
+
+        async def follow_pages() -> None:
+            try:
+                async for batch in more_pages:
+                    start = len(facilities)
+                    facilities.extend(batch)
+                    _emit(events, {'event': 'facilities', 'start': start, 'facilities': [asdict(f) for f in batch]})
+                    schedule(start)
+            except Exception as e:
+                logger.warning(f"Stopped fetching further result pages: {e}")
+
+        schedule(0)
+        workers = [asyncio.create_task(worker()) for _ in range(ENRICHMENT_MAX_WORKERS)]
+        try:
+            if more_pages is not None:
+                pager = asyncio.create_task(follow_pages())
+                _, pending = await asyncio.wait([pager], timeout=max(0.0, deadline - time.monotonic()))
+                for task in pending:
+                    task.cancel()
+            try:
+                await asyncio.wait_for(queue.join(), timeout=max(0.0, deadline - time.monotonic()))
+            except asyncio.TimeoutError:
+                logger.info(f"Enrichment deadline reached with {queue.qsize()} tasks queued")
+        finally:
+            for task in workers:
+                task.cancel()
+
+        report = EnrichmentReport(
+            total=len(facilities),
+            completed=len(completed),
+            timed_out=sum(1 for f in facilities if f.place_id) - len(finished),
+            elapsed_seconds=round(time.monotonic() - started_at, 3)
+        )
+        logger.info(
+            f"Enriched {report.completed}/{report.total} facilities in {report.elapsed_seconds}s"
+        )
+        return facilities, report
+
+    async def _details_stage_async(self, client: httpx.AsyncClient, f: Facility) -> Optional[bool]:
+        """
+        Fetch and merge Place Details for one facility.
+        
+        Returns:
+            None if the lookup failed, otherwise whether a website scrape should follow
+        """
+        details = await self._get_place_details_async(client, f.place_id)
+        if not details:
+            return None
+        self._merge_place_details(f, details)
+        f.enrichment_status = STATUS_PARTIAL if f.website else STATUS_COMPLETE
+        return bool(f.website)
+
+    async def _scrape_stage_async(self, f: Facility, deadline: Optional[float] = None) -> None:
+        """
+        Scrape a facility's website (under the scraper's global and per-domain limits) and merge the contacts found.
+        
+        The scrape returns in time for ``deadline`` with whatever its pages
+        provided by then, so a slow crawl does not lose the first page's fields.
+        """
+        scraped_data = await async_scraper.scrape(
+            f.website, calling_code=calling_code_for(f.international_phone_number, f.formatted_address, f.location),
+            deadline=deadline
+        )
+        if scraped_data:
+            self._merge_scraped_profile(f, scraped_data)
+        f.enrichment_status = STATUS_COMPLETE
@@ -0,0 +1,163 @@
+"""
+In-memory cache for Google text search results keyed on a normalized query.
+
+Queries are folded to a canonical form (case, whitespace and comma spacing) and
+``max_results`` is bucketed to whole result pages, so "Gym in  mumbai ,India"
+with 15 results and "gym in Mumbai, India" with 20 share one entry. Entries are
+served fresh for a TTL, then served stale while a single background refresh
+runs. ZERO_RESULTS answers are cached briefly as negative entries.
+"""
+
+import os
+import re
+import math
+import time
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.app.services.details_cache import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants (overridable via environment)
+SEARCH_CACHE_TTL_SECONDS = float(os.getenv('SEARCH_CACHE_TTL_SECONDS', str(60 * 60)))
+SEARCH_CACHE_STALE_SECONDS = float(os.getenv('SEARCH_CACHE_STALE_SECONDS', str(24 * 60 * 60)))
+SEARCH_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv('SEARCH_CACHE_NEGATIVE_TTL_SECONDS', str(10 * 60)))
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv('SEARCH_CACHE_MAX_ENTRIES', '1000'))
+RESULTS_PER_PAGE = 20
+MAX_RESULTS_LIMIT = 60
+
+# Cache lookup states
+CACHE_FRESH = "fresh"
+CACHE_STALE = "stale"
+CACHE_MISS = "miss"
+
+
+@dataclass
+class _SearchEntry:
+    places: List[Dict[str, Any]]
+    stored_at: float
+
+    @property
+    def negative(self) -> bool:
+        return not self.places
+
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a text query: case-folded, single-spaced, ``a, b`` comma spacing."""
+    text = re.sub(r'\s+', ' ', query.casefold()).strip()
+    return re.sub(r'\s*,\s*', ', ', text)
+
+
+def bucket_max_results(max_results: int) -> int:
+    """Round ``max_results`` up to a whole number of result pages (20, 40 or 60)."""
+    pages = max(1, math.ceil(max_results / RESULTS_PER_PAGE))
+    return min(pages * RESULTS_PER_PAGE, MAX_RESULTS_LIMIT)
+
+
+class SearchResultCache:
+    """LRU cache of raw text search results with TTL, stale-while-revalidate and negative entries."""
+
+    def __init__(self, ttl_seconds: float = SEARCH_CACHE_TTL_SECONDS,
+                 stale_seconds: float = SEARCH_CACHE_STALE_SECONDS,
+                 negative_ttl_seconds: float = SEARCH_CACHE_NEGATIVE_TTL_SECONDS,
+                 max_entries: int = SEARCH_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _SearchEntry]" = OrderedDict()
+        self._refreshing: set = set()
+        self._stats = CacheStats()
+
+    @staticmethod
+    def key(query: str, max_results: int) -> str:
+        """Cache key for a Google text query and requested result count."""
+        return f"{bucket_max_results(max_results)}|{normalize_query(query)}"
+
+    def get(self, query: str, max_results: int) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+        """
+        Look up cached results for a query.
+
+        An entry cached for a larger bucket also answers smaller requests
+        (a 60-result entry serves a 20-result search).
+
+        Returns:
+            Tuple of (places or None, state) where state is CACHE_FRESH, CACHE_STALE or CACHE_MISS.
+            A fresh negative entry returns an empty list.
+        """
+        now = time.time()
+        normalized = normalize_query(query)
+        with self._lock:
+            stale_places: Optional[List[Dict[str, Any]]] = None
+            for bucket in range(bucket_max_results(max_results), MAX_RESULTS_LIMIT + 1, RESULTS_PER_PAGE):
+                key = f"{bucket}|{normalized}"
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                age = now - entry.stored_at
+                if entry.negative:
+                    if age <= self.negative_ttl_seconds:
+                        self._entries.move_to_end(key)
+                        self._stats.hits += 1
+                        return [], CACHE_FRESH
+                elif age <= self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self._stats.hits += 1
+                    return list(entry.places), CACHE_FRESH
+                elif age <= self.ttl_seconds + self.stale_seconds:
+                    self._entries.move_to_end(key)
+                    if stale_places is None:
+                        stale_places = list(entry.places)
+                    continue
+                del self._entries[key]
+
+            if stale_places is not None:
+                self._stats.partial_hits += 1
+                return stale_places, CACHE_STALE
+            self._stats.misses += 1
+            return None, CACHE_MISS
+
+    def put(self, query: str, max_results: int, places: List[Dict[str, Any]]) -> None:
+        """Store results for a query (an empty list stores a negative entry)."""
+        key = self.key(query, max_results)
+        with self._lock:
+            self._entries[key] = _SearchEntry(places=list(places), stored_at=time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def begin_refresh(self, key: str) -> bool:
+        """Claim the background refresh for a stale key; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key: str) -> None:
+        """Release a refresh claimed with ``begin_refresh``."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics (stale serves are reported as partial hits)."""
+        with self._lock:
+            result = self._stats.to_dict()
+            result['entries'] = len(self._entries)
+            result['refreshing'] = len(self._refreshing)
+            return result
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Global cache instance
+search_cache = SearchResultCache()
@@ -0,0 +1,368 @@
+"""
+Email and phone number extraction from page text in linear time.
+
+A single regular expression scan finds every email and phone candidate. Each
+alternative may only start where a run of its characters starts (a
+lookbehind rejects every position inside a run in constant time) and then
+consumes the run possessively, so no character is examined more than a
+constant number of times, even for adversarial input such as long dotted
+tokens, digit soup or repeated '@'. Candidates are then validated, phone
+numbers normalized to E.164 with the facility's country calling code,
+duplicates merged and what is left ranked.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Email local parts and domains, and the characters a phone number is written with.
+# A number may follow a letter only if it starts with '+' ("Main St+1 555 ...")
+_TOKEN_PATTERN = re.compile(
+    r"(?<![A-Za-z0-9._%+\-])(?P<email>[A-Za-z0-9._%+\-]++@[A-Za-z0-9.\-]++)"
+    r"|(?P<phone>(?:(?<![\d+])\+|(?<![\w+]))\(?\d[\d \t\u00a0\-().\/]*+)"
+)
+_DOMAIN_LABEL_PATTERN = re.compile(r'[A-Za-z0-9](?:[A-Za-z0-9\-]*[A-Za-z0-9])?')
+_NON_DIGITS = re.compile(r'\D')
+# Several numbers written in one run ("555-1234 / 555-5678", or wide gaps)
+_PHONE_SPLIT_PATTERN = re.compile(r'\s{2,}|\s*/\s*')
+_YEAR_GROUP_PATTERN = re.compile(r'(?:19|20)\d\d')
+
+# "Top-level domains" that are really file extensions (logo@2x.png)
+_FILE_EXTENSIONS = frozenset({
+    'png', 'jpg', 'jpeg', 'gif', 'svg', 'webp', 'avif', 'ico', 'css', 'js', 'pdf', 'mp4', 'webm',
+})
+_NO_REPLY_PATTERN = re.compile(r'^(?:no-?reply|do-?not-?reply|bounce|mailer-daemon)', re.IGNORECASE)
+# Mailboxes of website builders and error trackers embedded in page source
+_SERVICE_EMAIL_DOMAINS = ('sentry.io', 'wixpress.com', 'sentry-next.wixpress.com')
+_ROLE_MAILBOXES = frozenset({
+    'info', 'contact', 'hello', 'enquiries', 'enquiry', 'inquiries', 'bookings', 'booking',
+    'office', 'reception', 'membership', 'team', 'admin', 'support', 'sales',
+})
+
+# E.164 allows at most 15 digits including the country code
+E164_MAX_DIGITS = 15
+# Digits in a phone number written without a country code (trunk prefix included)
+MIN_NATIONAL_DIGITS = 9
+# Digits of a national significant number once the trunk prefix is removed
+_NSN_DIGITS = (7, 12)
+
+# Calling code and names of each supported country, by ISO 3166 alpha-2 code
+COUNTRY_CALLING_CODES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    'US': ('1', ('united states', 'united states of america', 'usa')),
+    'CA': ('1', ('canada',)),
+    'GB': ('44', ('united kingdom', 'uk', 'great britain', 'england', 'scotland', 'wales')),
+    'IE': ('353', ('ireland',)),
+    'DE': ('49', ('germany', 'deutschland')),
+    'FR': ('33', ('france',)),
+    'IT': ('39', ('italy', 'italia')),
+    'ES': ('34', ('spain', 'españa')),
+    'PT': ('351', ('portugal',)),
+    'NL': ('31', ('netherlands', 'the netherlands')),
+    'BE': ('32', ('belgium',)),
+    'LU': ('352', ('luxembourg',)),
+    'CH': ('41', ('switzerland',)),
+    'AT': ('43', ('austria',)),
+    'SE': ('46', ('sweden',)),
+    'NO': ('47', ('norway',)),
+    'DK': ('45', ('denmark',)),
+    'FI': ('358', ('finland',)),
+    'IS': ('354', ('iceland',)),
+    'PL': ('48', ('poland',)),
+    'CZ': ('420', ('czech republic', 'czechia')),
+    'SK': ('421', ('slovakia',)),
+    'HU': ('36', ('hungary',)),
+    'RO': ('40', ('romania',)),
+    'BG': ('359', ('bulgaria',)),
+    'HR': ('385', ('croatia',)),
+    'SI': ('386', ('slovenia',)),
+    'EE': ('372', ('estonia',)),
+    'LV': ('371', ('latvia',)),
+    'LT': ('370', ('lithuania',)),
+    'GR': ('30', ('greece',)),
+    'CY': ('357', ('cyprus',)),
+    'MT': ('356', ('malta',)),
+    'UA': ('380', ('ukraine',)),
+    'RU': ('7', ('russia', 'russian federation')),
+    'KZ': ('7', ('kazakhstan',)),
+    'UZ': ('998', ('uzbekistan',)),
+    'TR': ('90', ('turkey', 'türkiye')),
+    'IL': ('972', ('israel',)),
+    'EG': ('20', ('egypt',)),
+    'MA': ('212', ('morocco',)),
+    'DZ': ('213', ('algeria',)),
+    'TN': ('216', ('tunisia',)),
+    'NG': ('234', ('nigeria',)),
+    'GH': ('233', ('ghana',)),
+    'KE': ('254', ('kenya',)),
+    'ET': ('251', ('ethiopia',)),
+    'TZ': ('255', ('tanzania',)),
+    'UG': ('256', ('uganda',)),
+    'ZA': ('27', ('south africa',)),
+    'IN': ('91', ('india', 'bharat')),
+    'PK': ('92', ('pakistan',)),
+    'BD': ('880', ('bangladesh',)),
+    'LK': ('94', ('sri lanka',)),
+    'NP': ('977', ('nepal',)),
+    'MM': ('95', ('myanmar',)),
+    'TH': ('66', ('thailand',)),
+    'MY': ('60', ('malaysia',)),
+    'SG': ('65', ('singapore',)),
+    'ID': ('62', ('indonesia',)),
+    'PH': ('63', ('philippines',)),
+    'VN': ('84', ('vietnam', 'viet nam')),
+    'KH': ('855', ('cambodia',)),
+    'LA': ('856', ('laos',)),
+    'MN': ('976', ('mongolia',)),
+    'CN': ('86', ('china',)),
+    'HK': ('852', ('hong kong',)),
+    'TW': ('886', ('taiwan',)),
+    'JP': ('81', ('japan',)),
+    'KR': ('82', ('south korea', 'korea', 'republic of korea')),
+    'AU': ('61', ('australia',)),
+    'NZ': ('64', ('new zealand',)),
+    'AE': ('971', ('united arab emirates', 'uae')),
+    'SA': ('966', ('saudi arabia',)),
+    'MX': ('52', ('mexico', 'méxico')),
+    'BR': ('55', ('brazil', 'brasil')),
+    'AR': ('54', ('argentina',)),
+    'CL': ('56', ('chile',)),
+    'CO': ('57', ('colombia',)),
+    'PE': ('51', ('peru', 'perú')),
+    'VE': ('58', ('venezuela',)),
+}
+# National trunk prefix dropped when a number is written internationally.
+# '0' unless listed; '' means the leading digits are part of the number
+TRUNK_PREFIXES = {
+    '1': '1', '7': '8', '36': '06', '370': '8', '998': '8',
+    '39': '', '34': '', '351': '', '30': '', '47': '', '45': '', '352': '', '354': '',
+    '356': '', '357': '', '372': '', '371': '', '52': '', '65': '', '852': '', '56': '',
+}
+
+_CODES_BY_NAME = {name: code for code, names in COUNTRY_CALLING_CODES.values() for name in names}
+_KNOWN_CODES = frozenset(code for code, _ in COUNTRY_CALLING_CODES.values())
+# Country-code top-level domains that differ from the ISO code
+_CCTLD_ALIASES = {'uk': 'GB'}
+
+
+@dataclass
+class ContactTokens:
+    """Contact details found in a page, best first."""
+    emails: List[str] = field(default_factory=list)
+    # E.164 where the number could be normalized, otherwise as written
+    phones: List[str] = field(default_factory=list)
+
+
+def calling_code_for(*hints: Optional[str]) -> Optional[str]:
+    """
+    Country calling code from the first hint that identifies a country.
+
+    A hint may be an international phone number ('+91 98765 43210'), a
+    country name or ISO code, or an address ending in a country name.
+    """
+    for hint in hints:
+        if not hint:
+            continue
+        hint = hint.strip()
+        if hint.startswith('+'):
+            digits = _NON_DIGITS.sub('', hint)
+            # Country codes form a prefix code, so at most one prefix matches
+            for length in (1, 2, 3):
+                if digits[:length] in _KNOWN_CODES:
+                    return digits[:length]
+            continue
+        country = hint.rsplit(',', 1)[-1].strip()
+        if len(country) == 2 and country.upper() in COUNTRY_CALLING_CODES:
+            return COUNTRY_CALLING_CODES[country.upper()][0]
+        code = _CODES_BY_NAME.get(country.lower())
+        if code:
+            return code
+    return None
+
+
+def calling_code_for_domain(domain: str) -> Optional[str]:
+    """Calling code of a website's country-code top-level domain (None for .com and the like)."""
+    tld = domain.rsplit(':', 1)[0].rstrip('.').rsplit('.', 1)[-1].lower()
+    if len(tld) != 2:
+        return None
+    entry = COUNTRY_CALLING_CODES.get(_CCTLD_ALIASES.get(tld, tld.upper()))
+    return entry[0] if entry else None
+
+
+def normalize_phone(number: str, calling_code: Optional[str] = None) -> Optional[str]:
+    """
+    E.164 form of a phone number.
+
+    Numbers written with '+' or an international '00' prefix need no country;
+    national numbers are completed with ``calling_code`` after removing the
+    country's trunk prefix.
+
+    Returns:
+        '+<digits>', or None if the number is implausible or is national and
+        ``calling_code`` is unknown
+    """
+    number = number.strip()
+    digits = _NON_DIGITS.sub('', number)
+    if not number.startswith('+'):
+        if digits.startswith('00'):
+            digits = digits[2:]
+        elif calling_code == '1' and digits.startswith('011'):
+            digits = digits[3:]
+        elif calling_code is None:
+            return None
+        else:
+            trunk = TRUNK_PREFIXES.get(calling_code, '0')
+            if calling_code == '1' and len(digits) == 10:
+                trunk = ''
+            if trunk and digits.startswith(trunk):
+                digits = digits[len(trunk):]
+            if calling_code == '1':
+                # North American numbers: ten digits, area code not starting with 0 or 1
+                if len(digits) != 10 or digits[0] in '01':
+                    return None
+            elif not _NSN_DIGITS[0] <= len(digits) <= _NSN_DIGITS[1]:
+                return None
+            digits = calling_code + digits
+    if not 8 <= len(digits) <= E164_MAX_DIGITS or digits[0] == '0':
+        return None
+    return f"+{digits}"
+
+
+def is_valid_email(email: str) -> bool:
+    """Whether an address has a plausible local part, domain labels and alphabetic top-level domain."""
+    local, at, domain = email.rpartition('@')
+    if not at or not local or len(local) > 64 or '@' in local:
+        return False
+    if local.startswith('.') or local.endswith('.') or '..' in local:
+        return False
+    labels = domain.split('.')
+    if len(labels) < 2 or not all(_DOMAIN_LABEL_PATTERN.fullmatch(label) for label in labels):
+        return False
+    tld = labels[-1]
+    return len(tld) >= 2 and tld.isalpha() and tld.lower() not in _FILE_EXTENSIONS
+
+
+def _email_from_link(href: str) -> str:
+    # mailto:info@example.com?subject=Hello
+    address = href.split(':', 1)[-1] if href.lower().startswith('mailto:') else href
+    return address.split('?', 1)[0].strip()
+
+
+def _is_own_domain(email_domain: str, site_domain: str) -> bool:
+    if not site_domain:
+        return False
+    site = site_domain.lower().rsplit(':', 1)[0]
+    site = site[4:] if site.startswith('www.') else site
+    return email_domain == site or email_domain.endswith('.' + site) or site.endswith('.' + email_domain)
+
+
+def _phone_numbers_in(run: str) -> List[str]:
+    """Plausible phone numbers in a run of phone characters."""
+    numbers = []
+    for piece in _PHONE_SPLIT_PATTERN.split(run):
+        piece = piece.strip(' \t\u00a0-./').rstrip(' (')
+        # Keep brackets around an area code, drop unmatched ones
+        if piece.endswith(')') and piece.count('(') < piece.count(')'):
+            piece = piece[:-1].rstrip()
+        if piece.startswith('(') and ')' not in piece:
+            piece = piece[1:].lstrip()
+        digits = _NON_DIGITS.sub('', piece)
+        minimum = 8 if piece.startswith('+') else MIN_NATIONAL_DIGITS
+        if not minimum <= len(digits) <= E164_MAX_DIGITS:
+            continue
+        groups = _NON_DIGITS.split(piece)
+        # Runs of years ("2019 2020 2021") are not numbers
+        if all(not group or _YEAR_GROUP_PATTERN.fullmatch(group) for group in groups):
+            continue
+        numbers.append(' '.join(piece.split()))
+    return numbers
+
+
+class _Ranking:
+    """Candidates keyed by their normalized form, scored as they are seen."""
+
+    def __init__(self):
+        self._entries: Dict[str, list] = {}
+
+    def add(self, key: str, value: str, score: int) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            # [display value, best source score, occurrences, first seen]
+            self._entries[key] = [value, score, 1, len(self._entries)]
+        else:
+            entry[1] = max(entry[1], score)
+            entry[2] += 1
+
+    def ranked(self, bonus=lambda key: 0) -> List[str]:
+        def sort_key(item):
+            key, (_, score, count, order) = item
+            # Repeats (header and footer, several pages) count, but less than the source
+            return -(score + bonus(key) + min(count - 1, 2)), order
+        return [entry[0] for _, entry in sorted(self._entries.items(), key=sort_key)]
+
+
+def extract_contacts(text: str, preferred_emails: Iterable[str] = (), preferred_phones: Iterable[str] = (),
+                     site_domain: str = '', calling_code: Optional[str] = None) -> ContactTokens:
+    """
+    Find, normalize, deduplicate and rank the email addresses and phone numbers in a page.
+
+    Args:
+        text: The page text
+        preferred_emails: Addresses from mailto: links or structured data, best first
+        preferred_phones: Numbers from tel: links or structured data, best first
+        site_domain: The website's host; addresses at it rank above others
+        calling_code: Country calling code for national phone numbers (see
+            ``calling_code_for``); by default that of the first international
+            number in the page
+
+    Returns:
+        Emails ranked by source (preferred first), own domain, role mailbox
+        and repetition; phones ranked by source, normalizability and
+        repetition. Ties keep the order of first appearance.
+    """
+    emails = _Ranking()
+    phones = _Ranking()
+
+    def add_email(address: str, score: int) -> None:
+        address = address.strip('.-')
+        if not is_valid_email(address) or _NO_REPLY_PATTERN.match(address):
+            return
+        local, _, domain = address.rpartition('@')
+        domain = domain.lower()
+        if domain in _SERVICE_EMAIL_DOMAINS:
+            return
+        emails.add(f"{local}@{domain}".lower(), f"{local}@{domain}", score)
+
+    # Phone numbers are normalized once the page's own international numbers are known
+    phone_candidates: List[Tuple[str, int]] = []
+
+    def add_phone(number: str, score: int) -> None:
+        phone_candidates.extend((candidate, score) for candidate in _phone_numbers_in(number))
+
+    for address in preferred_emails:
+        if address:
+            add_email(_email_from_link(address), 4)
+    for number in preferred_phones:
+        if number:
+            add_phone(number.split(':', 1)[-1] if number.lower().startswith('tel:') else number, 4)
+
+    for match in _TOKEN_PATTERN.finditer(text):
+        if match.lastgroup == 'email':
+            add_email(match.group('email'), 0)
+        else:
+            add_phone(match.group('phone'), 0)
+
+    if calling_code is None:
+        # A site that writes one number internationally writes the others for the same country
+        calling_code = calling_code_for(*(c for c, _ in phone_candidates if c.startswith('+')))
+    for candidate, score in phone_candidates:
+        e164 = normalize_phone(candidate, calling_code)
+        if e164:
+            phones.add(e164, e164, score + 1)
+        else:
+            phones.add(_NON_DIGITS.sub('', candidate), candidate, score)
+
+    def email_bonus(key: str) -> int:
+        local, _, domain = key.rpartition('@')
+        return 2 * _is_own_domain(domain, site_domain) + (local in _ROLE_MAILBOXES)
+
+    return ContactTokens(emails.ranked(email_bonus), phones.ranked())
@@ -0,0 +1,318 @@
+"""
+Shared, pooled HTTP clients for all upstream API and website requests.
+
+One ``requests.Session`` is kept per upstream origin (scheme + host) so repeated
+calls to Google, Yelp, Foursquare, Overpass or a scraped website reuse open
+TCP/TLS connections instead of handshaking on every request. Async callers share
+a single ``httpx.AsyncClient`` per event loop with the same pool settings.
+
+Calls tagged with a provider name (``provider=`` for sync calls, the
+``provider`` request extension for async ones) go through that provider's
+circuit breaker and get an adaptive timeout from ``provider_health``.
+"""
+
+import os
+import time
+import logging
+import threading
+import weakref
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from .provider_health import provider_health, is_failure_status
+
+# Configuration constants (overridable via environment)
+HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', '16'))
+HTTP_KEEPALIVE_SECONDS = float(os.getenv('HTTP_KEEPALIVE_SECONDS', '60'))
+HTTP_MAX_HOSTS = int(os.getenv('HTTP_MAX_HOSTS', '256'))
+HTTP_ASYNC_MAX_CONNECTIONS = int(os.getenv('HTTP_ASYNC_MAX_CONNECTIONS', '100'))
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class HostStats:
+    """Connection usage counters for one upstream origin."""
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests that were served over an already-open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert counters to a plain dictionary."""
+        return {
+            'requests': self.requests,
+            'connections_opened': self.connections_opened,
+            'connections_reused': self.connections_reused,
+        }
+
+
+class _HostPool:
+    """A pooled session for a single origin plus its bookkeeping."""
+
+    def __init__(self, pool_maxsize: int):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.adapter = adapter
+        self.last_used = time.monotonic()
+        self.requests = 0
+        self.retired_connections = 0
+
+    def open_connections(self) -> int:
+        """Total connections created by the live urllib3 pools of this session."""
+        total = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                total += getattr(pool, 'num_connections', 0)
+        return total
+
+    def expire_idle(self, keepalive_seconds: float) -> None:
+        """Drop pooled connections that have been idle longer than the keep-alive window."""
+        if time.monotonic() - self.last_used > keepalive_seconds:
+            self.retired_connections += self.open_connections()
+            self.adapter.poolmanager.clear()
+
+    def close(self) -> None:
+        """Close the session and all of its connections."""
+        self.session.close()
+
+
+class HttpClientRegistry:
+    """
+    Registry of pooled HTTP clients keyed by upstream origin.
+
+    Sync callers use ``get``/``post``/``head`` (drop-in replacements for the
+    module-level ``requests`` functions). Async callers use ``async_client()``.
+    """
+
+    def __init__(self, pool_maxsize: int = HTTP_POOL_MAXSIZE,
+                 keepalive_seconds: float = HTTP_KEEPALIVE_SECONDS,
+                 max_hosts: int = HTTP_MAX_HOSTS,
+                 async_max_connections: int = HTTP_ASYNC_MAX_CONNECTIONS):
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_seconds = keepalive_seconds
+        self.max_hosts = max_hosts
+        self.async_max_connections = async_max_connections
+        self._lock = threading.Lock()
+        self._pools: "OrderedDict[str, _HostPool]" = OrderedDict()
+        self._retired_stats: Dict[str, HostStats] = {}
+        self._async_stats: Dict[str, HostStats] = {}
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @staticmethod
+    def origin(url: str) -> str:
+        """Return the ``scheme://host[:port]`` origin used as the pool key."""
+        parsed = urlparse(url)
+        return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+    def session(self, url: str) -> requests.Session:
+        """Get the pooled session for the origin of ``url``."""
+        return self._host_pool(self.origin(url)).session
+
+    def _host_pool(self, origin: str) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get(origin)
+            if pool is None:
+                pool = _HostPool(self.pool_maxsize)
+                self._pools[origin] = pool
+                # Bound the number of open sessions (scraped websites are long-tail hosts)
+                while len(self._pools) > self.max_hosts:
+                    old_origin, old_pool = self._pools.popitem(last=False)
+                    self._retire(old_origin, old_pool)
+            else:
+                self._pools.move_to_end(origin)
+                pool.expire_idle(self.keepalive_seconds)
+            pool.last_used = time.monotonic()
+            pool.requests += 1
+            return pool
+
+    def _retire(self, origin: str, pool: _HostPool) -> None:
+        stats = self._retired_stats.setdefault(origin, HostStats())
+        stats.requests += pool.requests
+        stats.connections_opened += pool.retired_connections + pool.open_connections()
+        pool.close()
+
+    def request(self, method: str, url: str, provider: Optional[str] = None,
+                **kwargs: Any) -> requests.Response:
+        """
+        Send a request over the pooled session for ``url``'s origin.
+
+        Args:
+            provider: Optional provider name; the call is then rejected with
+                ``CircuitOpenError`` while that provider's breaker is open, and the
+                given ``timeout`` becomes an upper bound for the adaptive timeout
+        """
+        if provider is None:
+            return self.session(url).request(method, url, **kwargs)
+
+        health = provider_health.get(provider)
+        health.before_call()
+        if isinstance(kwargs.get('timeout'), (int, float)):
+            kwargs['timeout'] = health.timeout(kwargs['timeout'])
+        started = time.monotonic()
+        try:
+            response = self.session(url).request(method, url, **kwargs)
+        except requests.Timeout:
+            health.record(time.monotonic() - started, success=False, timed_out=True)
+            raise
+        except Exception:
+            health.record(time.monotonic() - started, success=False)
+            raise
+        except BaseException:
+            # Cancelled by the caller (e.g. an enrichment deadline), not a provider failure
+            health.abandon()
+            raise
+        health.record(time.monotonic() - started, success=not is_failure_status(response.status_code))
+        return response
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """Pooled equivalent of ``requests.get``."""
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        """Pooled equivalent of ``requests.post``."""
+        return self.request('POST', url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        """Pooled equivalent of ``requests.head``."""
+        kwargs.setdefault('allow_redirects', False)
+        return self.request('HEAD', url, **kwargs)
+
+    def async_client(self) -> httpx.AsyncClient:
+        """
+        Get the shared ``httpx.AsyncClient`` for the running event loop.
+
+        httpx clients are bound to the loop they were first used on, so one
+        client is kept per loop. Each client pools connections per origin.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None or client.is_closed:
+            limits = httpx.Limits(
+                max_connections=self.async_max_connections,
+                max_keepalive_connections=self.async_max_connections,
+                keepalive_expiry=self.keepalive_seconds,
+            )
+            client = httpx.AsyncClient(
+                transport=_CountingAsyncTransport(self, limits=limits),
+                follow_redirects=True,
+            )
+            self._async_clients[loop] = client
+        return client
+
+    def _record_async(self, origin: str, new_connection: bool = False) -> None:
+        with self._lock:
+            stats = self._async_stats.setdefault(origin, HostStats())
+            if new_connection:
+                stats.connections_opened += 1
+            else:
+                stats.requests += 1
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Connection reuse counters per origin (sync and async clients combined).
+
+        Returns:
+            Mapping of origin to ``requests``, ``connections_opened`` and ``connections_reused``
+        """
+        combined: Dict[str, HostStats] = {}
+
+        def add(origin: str, requests_count: int, connections: int) -> None:
+            stats = combined.setdefault(origin, HostStats())
+            stats.requests += requests_count
+            stats.connections_opened += connections
+
+        with self._lock:
+            for origin, stats in self._retired_stats.items():
+                add(origin, stats.requests, stats.connections_opened)
+            for origin, pool in self._pools.items():
+                add(origin, pool.requests, pool.retired_connections + pool.open_connections())
+            for origin, stats in self._async_stats.items():
+                add(origin, stats.requests, stats.connections_opened)
+
+        return {origin: stats.to_dict() for origin, stats in combined.items()}
+
+    def close(self) -> None:
+        """Close all pooled sync sessions."""
+        with self._lock:
+            for origin, pool in list(self._pools.items()):
+                self._retire(origin, pool)
+            self._pools.clear()
+
+    async def aclose(self) -> None:
+        """Close the async client bound to the running loop."""
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+
+class _CountingAsyncTransport(httpx.AsyncHTTPTransport):
+    """httpx transport that reports requests and new connections to the registry."""
+
+    def __init__(self, registry: HttpClientRegistry, **kwargs: Any):
+        super().__init__(**kwargs)
+        self._registry = registry
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        origin = f"{request.url.scheme}://{request.url.netloc.decode('ascii')}".lower()
+        registry = self._registry
+        provider = request.extensions.get('provider')
+        health = provider_health.get(provider) if provider else None
+        if health is not None:
+            health.before_call()
+        registry._record_async(origin)
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            if event_name == 'connection.connect_tcp.complete':
+                registry._record_async(origin, new_connection=True)
+
+        extensions = {**request.extensions, 'trace': trace}
+        if health is None:
+            request.extensions = extensions
+            return await super().handle_async_request(request)
+
+        timeouts = extensions.get('timeout')
+        if isinstance(timeouts, dict) and isinstance(timeouts.get('read'), (int, float)):
+            limit = health.timeout(timeouts['read'])
+            extensions['timeout'] = {
+                key: min(value, limit) if isinstance(value, (int, float)) else value
+                for key, value in timeouts.items()
+            }
+        request.extensions = extensions
+        started = time.monotonic()
+        try:
+            response = await super().handle_async_request(request)
+        except httpx.TimeoutException:
+            health.record(time.monotonic() - started, success=False, timed_out=True)
+            raise
+        except Exception:
+            health.record(time.monotonic() - started, success=False)
+            raise
+        except BaseException:
+            # Cancelled by the caller (e.g. an enrichment deadline), not a provider failure
+            health.abandon()
+            raise
+        health.record(time.monotonic() - started, success=not is_failure_status(response.status_code))
+        return response
+
+
+# Global registry instance
+http_clients = HttpClientRegistry()
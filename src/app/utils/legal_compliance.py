@@ -2,16 +2,32 @@
 Legal compliance utilities to ensure the application operates within legal boundaries.
 """
 
-import requests
+import os
 import time
 import logging
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Dict, List, Mapping, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
 import re
 
+from .http_client import http_clients
+from .single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
+# Configuration constants (overridable via environment)
+COMPLIANCE_TOS_TTL_SECONDS = float(os.getenv('COMPLIANCE_TOS_TTL_SECONDS', str(24 * 60 * 60)))
+COMPLIANCE_LOOKUP_TIMEOUT_SECONDS = 5
+# robots.txt and terms of service pages are read up to this size
+COMPLIANCE_MAX_BYTES = int(os.getenv('COMPLIANCE_MAX_BYTES', str(512 * 1024)))
+COMPLIANCE_CHUNK_BYTES = 16 * 1024
+# Terms of service probes get a short timeout each and a shared budget per lookup
+COMPLIANCE_TOS_TIMEOUT_SECONDS = float(os.getenv('COMPLIANCE_TOS_TIMEOUT_SECONDS', '2'))
+COMPLIANCE_TOS_BUDGET_SECONDS = float(os.getenv('COMPLIANCE_TOS_BUDGET_SECONDS', '4'))
+# Where terms of service are looked for, in order of preference
+TOS_PATHS = ('/terms', '/terms-of-service', '/tos', '/legal')
+
 
 @dataclass
 class ComplianceCheck:
@@ -25,12 +41,26 @@ class ComplianceCheck:
 class LegalComplianceChecker:
     """
     Ensures all data collection activities comply with legal requirements.
+    
+    Concurrent checks of the same domain share one robots.txt and one terms
+    of service lookup. Terms of service locations are probed one at a time,
+    stopping at the first that exists, with a short timeout each and a small
+    overall budget. They are not spaced by the per-page crawl delay and take
+    no request slot, so they never hold back the page fetches that follow.
+    robots.txt verdicts are kept for the life of the process, terms of
+    service verdicts for ``tos_ttl_seconds``.
     """
     
-    def __init__(self):
+    def __init__(self, tos_ttl_seconds: float = COMPLIANCE_TOS_TTL_SECONDS):
         self.rate_limits = {}
         self.last_request_time = {}
         self.robots_cache = {}
+        self.crawl_delays = {}  # robots.txt Crawl-delay per domain (seconds)
+        self.sitemaps = {}  # robots.txt Sitemap URLs per domain
+        self.tos_cache = {}  # domain -> (checked at, terms of service verdict)
+        self.tos_ttl_seconds = tos_ttl_seconds
+        self._slot_lock = threading.Lock()
+        self._lookups = SingleFlight()
         
         # Legal compliance rules
         self.max_requests_per_minute = 10
@@ -38,12 +68,15 @@ class LegalComplianceChecker:
         self.respect_robots_txt = True
         self.require_attribution = True
     
-    def check_website_compliance(self, url: str) -> ComplianceCheck:
+    def check_website_compliance(self, url: str, check_access: bool = True) -> ComplianceCheck:
         """
         Check if a website can be scraped legally and ethically.
         
         Args:
             url: Website URL to check
+            check_access: Probe the URL for authentication requirements. Pass
+                False when the page is about to be fetched anyway and check
+                that response with ``access_violations`` instead.
             
         Returns:
             ComplianceCheck with compliance status and recommendations
@@ -55,24 +88,25 @@ class LegalComplianceChecker:
         try:
             parsed_url = urlparse(url)
             domain = parsed_url.netloc
+            scheme = parsed_url.scheme or 'https'
             
             # Check robots.txt
             if self.respect_robots_txt:
-                robots_compliant, robots_warnings = self._check_robots_txt(domain)
+                robots_compliant, robots_warnings = self._lookups.do(
+                    ('robots', domain), self._check_robots_txt, domain, scheme
+                )
                 if not robots_compliant:
                     violations.append(f"robots.txt disallows scraping for {domain}")
                 warnings.extend(robots_warnings)
             
-            # Check if URL is publicly accessible
-            if not self._is_publicly_accessible(url):
-                violations.append(f"URL {url} is not publicly accessible")
-            
-            # Check for authentication requirements
-            if self._requires_authentication(url):
-                violations.append(f"URL {url} requires authentication")
+            # Check if URL is publicly accessible without authentication
+            if check_access:
+                violations.extend(self._probe_access(url))
             
             # Check rate limiting
-            if not self._check_rate_limit(domain):
+            with self._slot_lock:
+                within_limit = self._check_rate_limit(domain)
+            if not within_limit:
                 warnings.append(f"Rate limit exceeded for {domain}")
                 recommendations.append("Wait before making more requests")
             
@@ -81,8 +115,8 @@ class LegalComplianceChecker:
             if sensitive_patterns:
                 warnings.extend(sensitive_patterns)
             
-            # Check terms of service compliance
-            tos_compliant, tos_warnings = self._check_terms_of_service(domain)
+            # Check terms of service compliance (no point reading them where robots.txt says no)
+            tos_compliant, tos_warnings = (True, []) if violations else self._check_terms_of_service(domain, scheme)
             if not tos_compliant:
                 violations.append(f"Terms of service violation for {domain}")
             warnings.extend(tos_warnings)
@@ -112,7 +146,7 @@ class LegalComplianceChecker:
                 recommendations=["Do not scrape this website due to errors"]
             )
     
-    def _check_robots_txt(self, domain: str) -> Tuple[bool, List[str]]:
+    def _check_robots_txt(self, domain: str, scheme: str = 'https') -> Tuple[bool, List[str]]:
         """Check robots.txt compliance."""
         warnings = []
         
@@ -120,11 +154,11 @@ class LegalComplianceChecker:
             if domain in self.robots_cache:
                 return self.robots_cache[domain]
             
-            robots_url = f"https://{domain}/robots.txt"
-            response = requests.get(robots_url, timeout=5)
+            robots_url = f"{scheme}://{domain}/robots.txt"
+            robots_text = self._fetch_text(robots_url)
             
-            if response.status_code == 200:
-                robots_content = response.text.lower()
+            if robots_text is not None:
+                robots_content = robots_text.lower()
                 
                 # Check for disallow rules
                 if "disallow: /" in robots_content:
@@ -137,10 +171,16 @@ class LegalComplianceChecker:
                     warnings.append(f"robots.txt has disallow rules: {disallow_patterns}")
                 
                 # Check for crawl delay
-                crawl_delay_match = re.search(r'crawl-delay:\s*(\d+)', robots_content)
+                crawl_delay_match = re.search(r'crawl-delay:\s*(\d+(?:\.\d+)?)', robots_content)
                 if crawl_delay_match:
-                    delay = int(crawl_delay_match.group(1))
-                    warnings.append(f"robots.txt specifies crawl delay of {delay} seconds")
+                    delay = float(crawl_delay_match.group(1))
+                    self.crawl_delays[domain] = delay
+                    warnings.append(f"robots.txt specifies crawl delay of {delay:g} seconds")
+                
+                # Sitemap URLs are case-sensitive, so read them from the original text
+                sitemaps = re.findall(r'^\s*sitemap:\s*(\S+)', robots_text, re.IGNORECASE | re.MULTILINE)
+                if sitemaps:
+                    self.sitemaps[domain] = sitemaps
                 
                 self.robots_cache[domain] = (True, warnings)
                 return True, warnings
@@ -155,35 +195,38 @@ class LegalComplianceChecker:
             self.robots_cache[domain] = (True, warnings)
             return True, warnings
     
-    def _is_publicly_accessible(self, url: str) -> bool:
-        """Check if URL is publicly accessible without authentication."""
+    def access_violations(self, url: str, status_code: int, headers: Mapping[str, str]) -> List[str]:
+        """
+        Violations shown by the response to a request for ``url``.
+        
+        Args:
+            url: The requested URL
+            status_code: Final status code (after redirects)
+            headers: Response headers (case-insensitive mapping)
+            
+        Returns:
+            A violation if the page requires authentication, else an empty list
+        """
+        if status_code in (401, 403) or 'www-authenticate' in headers:
+            return [f"URL {url} requires authentication"]
+        return []
+    
+    def _probe_access(self, url: str) -> List[str]:
+        """Access violations found with a HEAD request, for callers that will not fetch the page."""
         try:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (compatible; LegalComplianceBot/1.0)'
             }
             
-            response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
-            
-            # Check for authentication requirements
-            if response.status_code == 401:
-                return False
-            if response.status_code == 403:
-                return False
-            if 'www-authenticate' in response.headers:
-                return False
-            
-            return response.status_code == 200
+            response = http_clients.head(url, headers=headers, timeout=COMPLIANCE_LOOKUP_TIMEOUT_SECONDS,
+                                         allow_redirects=True)
+            violations = self.access_violations(url, response.status_code, response.headers)
+            if not violations and response.status_code != 200:
+                violations.append(f"URL {url} is not publicly accessible")
+            return violations
             
         except Exception:
-            return False
-    
-    def _requires_authentication(self, url: str) -> bool:
-        """Check if URL requires authentication."""
-        try:
-            response = requests.head(url, timeout=5)
-            return response.status_code in [401, 403]
-        except Exception:
-            return False
+            return [f"URL {url} is not publicly accessible"]
     
     def _check_rate_limit(self, domain: str) -> bool:
         """Check if we're within rate limits for a domain."""
@@ -229,9 +272,22 @@ class LegalComplianceChecker:
         
         return warnings
     
-    def _check_terms_of_service(self, domain: str) -> Tuple[bool, List[str]]:
-        """Check terms of service compliance (basic checks)."""
+    def _check_terms_of_service(self, domain: str, scheme: str = 'https') -> Tuple[bool, List[str]]:
+        """Check terms of service compliance (basic checks), cached per domain."""
+        cached = self.tos_cache.get(domain)
+        if cached is not None and time.time() - cached[0] <= self.tos_ttl_seconds:
+            return cached[1]
+        
+        verdict, complete = self._lookups.do(('tos', domain), self._look_up_terms_of_service, domain, scheme)
+        # A lookup cut short by its time budget is retried by the next check
+        if complete:
+            self.tos_cache[domain] = (time.time(), verdict)
+        return verdict
+    
+    def _look_up_terms_of_service(self, domain: str, scheme: str) -> Tuple[Tuple[bool, List[str]], bool]:
+        """The terms of service verdict, and whether every page that needed reading was read."""
         warnings = []
+        complete = True
         
         # Common TOS patterns that might restrict scraping
         tos_indicators = [
@@ -243,50 +299,94 @@ class LegalComplianceChecker:
         ]
         
         try:
-            # Try to fetch terms of service page
-            tos_urls = [
-                f"https://{domain}/terms",
-                f"https://{domain}/terms-of-service",
-                f"https://{domain}/tos",
-                f"https://{domain}/legal"
-            ]
-            
-            for tos_url in tos_urls:
+            # Locations in order of preference; the first that exists is read
+            deadline = time.monotonic() + COMPLIANCE_TOS_BUDGET_SECONDS
+            for path in TOS_PATHS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    warnings.append(f"Could not check terms of service for {domain}: lookup timed out")
+                    complete = False
+                    break
                 try:
-                    response = requests.get(tos_url, timeout=5)
-                    if response.status_code == 200:
-                        content = response.text.lower()
-                        
-                        for indicator in tos_indicators:
-                            if indicator in content:
-                                warnings.append(f"Terms of service may restrict scraping: {indicator}")
-                        
-                        break
+                    content = self._fetch_text(f"{scheme}://{domain}{path}",
+                                               min(COMPLIANCE_TOS_TIMEOUT_SECONDS, remaining))
                 except Exception:
                     continue
+                if content is not None:
+                    content = content.lower()
+                    for indicator in tos_indicators:
+                        if indicator in content:
+                            warnings.append(f"Terms of service may restrict scraping: {indicator}")
+                    break
             
         except Exception as e:
             warnings.append(f"Could not check terms of service for {domain}: {e}")
         
-        return True, warnings  # Assume compliant unless proven otherwise
+        return (True, warnings), complete  # Assume compliant unless proven otherwise
+    
+    def _fetch_text(self, url: str, timeout: float = COMPLIANCE_LOOKUP_TIMEOUT_SECONDS) -> Optional[str]:
+        """
+        Stream a text resource within the lookup's size limit and ``timeout``.
+        
+        Returns:
+            The (possibly truncated) text, or None unless the response is a
+            200 with a text content type
+        """
+        started = time.monotonic()
+        with http_clients.get(url, timeout=timeout, stream=True) as response:
+            content_type = response.headers.get('Content-Type', 'text/plain').lower()
+            if response.status_code != 200 or not content_type.startswith(('text/', 'application/xhtml')):
+                return None
+            chunks = []
+            size = 0
+            for chunk in response.iter_content(COMPLIANCE_CHUNK_BYTES):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= COMPLIANCE_MAX_BYTES or time.monotonic() - started > timeout:
+                    break
+            encoding = response.encoding or 'utf-8'
+        body = b''.join(chunks)[:COMPLIANCE_MAX_BYTES]
+        try:
+            return body.decode(encoding, errors='replace')
+        except LookupError:
+            return body.decode('utf-8', errors='replace')
     
     def enforce_rate_limit(self, domain: str) -> bool:
-        """Enforce rate limiting for a domain."""
-        if not self._check_rate_limit(domain):
-            logger.warning(f"Rate limit exceeded for {domain}")
+        """Enforce rate limiting for a domain, sleeping the calling thread for the crawl delay."""
+        delay = self.reserve_request_slot(domain)
+        if delay is None:
             return False
         
-        # Enforce minimum delay between requests
-        if domain in self.last_request_time:
-            time_since_last = time.time() - self.last_request_time[domain]
-            if time_since_last < self.min_delay_between_requests:
-                sleep_time = self.min_delay_between_requests - time_since_last
-                logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                time.sleep(sleep_time)
-        
-        self.last_request_time[domain] = time.time()
+        if delay > 0:
+            logger.info(f"Rate limiting: sleeping for {delay:.2f} seconds")
+            time.sleep(delay)
         return True
     
+    def reserve_request_slot(self, domain: str) -> Optional[float]:
+        """
+        Reserve the next permitted request time for a domain without waiting for it.
+        
+        Requests to one domain are spaced by the larger of
+        ``min_delay_between_requests`` and the robots.txt crawl delay. Each
+        caller gets its own slot, so concurrent callers queue up behind each
+        other instead of all sending once the delay has passed.
+        
+        Returns:
+            Seconds to wait before sending the request, or None if the
+            per-minute limit for the domain is exhausted
+        """
+        with self._slot_lock:
+            if not self._check_rate_limit(domain):
+                logger.warning(f"Rate limit exceeded for {domain}")
+                return None
+            
+            now = time.time()
+            interval = max(self.min_delay_between_requests, self.crawl_delays.get(domain, 0))
+            last = self.last_request_time.get(domain)
+            send_at = now if last is None else max(now, last + interval)
+            self.last_request_time[domain] = send_at
+            return send_at - now
+    
     def get_attribution_requirements(self, data_source: str) -> List[str]:
         """Get attribution requirements for a data source."""
         attribution_map = {
@@ -0,0 +1,225 @@
+"""
+Per-provider health tracking, adaptive timeouts and circuit breakers.
+
+Every call to an upstream provider (Google, Yelp, Foursquare, Overpass) records
+its latency and outcome. Timeouts are sized from the observed p95 latency
+instead of a fixed worst case, and a provider that keeps failing is skipped for
+a cool-down period so one bad dependency does not slow down every search.
+"""
+
+import os
+import time
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Deque, Dict, Optional
+
+import httpx
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants (overridable via environment)
+PROVIDER_EWMA_ALPHA = float(os.getenv('PROVIDER_EWMA_ALPHA', '0.2'))
+PROVIDER_LATENCY_WINDOW = int(os.getenv('PROVIDER_LATENCY_WINDOW', '100'))
+PROVIDER_MIN_SAMPLES = int(os.getenv('PROVIDER_MIN_SAMPLES', '20'))
+PROVIDER_TIMEOUT_MULTIPLIER = float(os.getenv('PROVIDER_TIMEOUT_MULTIPLIER', '2.0'))
+PROVIDER_MIN_TIMEOUT_SECONDS = float(os.getenv('PROVIDER_MIN_TIMEOUT_SECONDS', '1.0'))
+PROVIDER_FAILURE_THRESHOLD = int(os.getenv('PROVIDER_FAILURE_THRESHOLD', '5'))
+PROVIDER_ERROR_RATE_THRESHOLD = float(os.getenv('PROVIDER_ERROR_RATE_THRESHOLD', '0.5'))
+PROVIDER_COOLDOWN_SECONDS = float(os.getenv('PROVIDER_COOLDOWN_SECONDS', '30'))
+
+# Breaker states
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.RequestException, httpx.TransportError):
+    """
+    Raised instead of calling a provider whose circuit breaker is open.
+
+    It is both a ``requests`` and an ``httpx`` transport error, so existing
+    network-error handling on the sync and async paths covers it.
+    """
+
+    def __init__(self, provider: str, retry_after: float):
+        Exception.__init__(self, f"Circuit open for {provider}; retry in {retry_after:.1f}s")
+        self.provider = provider
+        self.retry_after = retry_after
+
+
+@dataclass
+class ProviderSnapshot:
+    """Point-in-time health of one provider (for monitoring)."""
+    provider: str
+    state: str
+    calls: int
+    failures: int
+    rejected: int
+    consecutive_failures: int
+    ewma_latency_ms: float
+    ewma_error_rate: float
+    p95_latency_ms: Optional[float]
+    adaptive_timeout_seconds: Optional[float]
+    retry_after_seconds: float
+
+
+class ProviderHealth:
+    """Latency/error statistics and circuit breaker for a single provider."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._latencies: Deque[float] = deque(maxlen=PROVIDER_LATENCY_WINDOW)
+        self._ewma_latency = 0.0
+        self._ewma_error_rate = 0.0
+        self._samples = 0
+        self._calls = 0
+        self._failures = 0
+        self._rejected = 0
+        self._consecutive_failures = 0
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def before_call(self) -> None:
+        """
+        Admit a call or raise ``CircuitOpenError``.
+
+        After the cool-down a single probe call is let through (half-open); its
+        outcome closes or re-opens the breaker.
+        """
+        with self._lock:
+            if self._state == CIRCUIT_CLOSED:
+                return
+            now = time.monotonic()
+            retry_after = self._opened_at + PROVIDER_COOLDOWN_SECONDS - now
+            if self._state == CIRCUIT_OPEN and retry_after <= 0:
+                self._state = CIRCUIT_HALF_OPEN
+            if self._state == CIRCUIT_HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self._rejected += 1
+            raise CircuitOpenError(self.name, max(0.0, retry_after))
+
+    def timeout(self, ceiling: Optional[float]) -> Optional[float]:
+        """
+        Timeout for the next call: a multiple of the observed p95 latency.
+
+        The caller's configured timeout stays the upper bound, and it is used
+        as-is until enough samples have been collected.
+        """
+        if ceiling is None:
+            return None
+        with self._lock:
+            p95 = self._p95()
+        if p95 is None:
+            return ceiling
+        return min(ceiling, max(PROVIDER_MIN_TIMEOUT_SECONDS, p95 * PROVIDER_TIMEOUT_MULTIPLIER))
+
+    def record(self, latency: float, success: bool, timed_out: bool = False) -> None:
+        """Record the outcome of a call admitted by ``before_call``."""
+        with self._lock:
+            self._calls += 1
+            self._samples += 1
+            alpha = PROVIDER_EWMA_ALPHA
+            if success or timed_out:
+                # Timeouts count as latency samples so a slowing provider gets longer timeouts
+                self._latencies.append(latency)
+                self._ewma_latency = latency if self._samples == 1 else (
+                    alpha * latency + (1 - alpha) * self._ewma_latency
+                )
+            self._ewma_error_rate = alpha * (0.0 if success else 1.0) + (1 - alpha) * self._ewma_error_rate
+
+            if success:
+                self._consecutive_failures = 0
+                if self._state != CIRCUIT_CLOSED:
+                    logger.info(f"Circuit for {self.name} closed")
+                self._state = CIRCUIT_CLOSED
+                self._probe_in_flight = False
+                return
+
+            self._failures += 1
+            self._consecutive_failures += 1
+            tripped = (
+                self._state == CIRCUIT_HALF_OPEN
+                or self._consecutive_failures >= PROVIDER_FAILURE_THRESHOLD
+                or (self._samples >= PROVIDER_MIN_SAMPLES and self._ewma_error_rate >= PROVIDER_ERROR_RATE_THRESHOLD)
+            )
+            if tripped:
+                if self._state != CIRCUIT_OPEN:
+                    logger.warning(
+                        f"Circuit for {self.name} opened for {PROVIDER_COOLDOWN_SECONDS:.0f}s "
+                        f"({self._consecutive_failures} consecutive failures, "
+                        f"error rate {self._ewma_error_rate:.2f})"
+                    )
+                self._state = CIRCUIT_OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    def abandon(self) -> None:
+        """Release an admitted call that was cancelled before it completed."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def _p95(self) -> Optional[float]:
+        if len(self._latencies) < PROVIDER_MIN_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+    def snapshot(self) -> ProviderSnapshot:
+        """Current statistics and breaker state."""
+        timeout = self.timeout(float('inf'))
+        with self._lock:
+            p95 = self._p95()
+            retry_after = 0.0
+            if self._state == CIRCUIT_OPEN:
+                retry_after = max(0.0, self._opened_at + PROVIDER_COOLDOWN_SECONDS - time.monotonic())
+            return ProviderSnapshot(
+                provider=self.name,
+                state=self._state,
+                calls=self._calls,
+                failures=self._failures,
+                rejected=self._rejected,
+                consecutive_failures=self._consecutive_failures,
+                ewma_latency_ms=round(self._ewma_latency * 1000, 1),
+                ewma_error_rate=round(self._ewma_error_rate, 3),
+                p95_latency_ms=round(p95 * 1000, 1) if p95 is not None else None,
+                adaptive_timeout_seconds=round(timeout, 3) if p95 is not None else None,
+                retry_after_seconds=round(retry_after, 1),
+            )
+
+
+def is_failure_status(status_code: int) -> bool:
+    """Responses that indicate an unhealthy provider (server errors and throttling)."""
+    return status_code >= 500 or status_code == 429
+
+
+class ProviderHealthRegistry:
+    """Health trackers keyed by provider name."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._providers: Dict[str, ProviderHealth] = {}
+
+    def get(self, provider: str) -> ProviderHealth:
+        """Get (or create) the tracker for ``provider``."""
+        with self._lock:
+            health = self._providers.get(provider)
+            if health is None:
+                health = ProviderHealth(provider)
+                self._providers[provider] = health
+            return health
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Breaker state and statistics for every provider seen so far."""
+        with self._lock:
+            providers = list(self._providers.values())
+        return {health.name: asdict(health.snapshot()) for health in providers}
+
+
+# Global registry instance
+provider_health = ProviderHealthRegistry()
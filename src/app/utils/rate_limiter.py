@@ -0,0 +1,339 @@
+"""
+Server-side rate limiting for upstream Google Places calls.
+
+Limits are token buckets kept per Google API key, per user and per client IP.
+Each bucket is stored as a single "theoretical arrival time" (the GCRA form of
+a token bucket), so a check is one read and one write with no background
+refill. By default buckets live in process memory; set ``RATE_LIMIT_DB_PATH``
+to share them through SQLite so limits hold across several uvicorn workers;
+coroutines then use ``check_async``/``acquire_async`` so the SQLite
+transaction (which may wait up to 5 s for another worker's write lock) runs
+off the event loop.
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants (overridable via environment)
+RATE_LIMIT_API_KEY_PER_MINUTE = float(os.getenv('RATE_LIMIT_API_KEY_PER_MINUTE', '300'))
+RATE_LIMIT_API_KEY_BURST = int(os.getenv('RATE_LIMIT_API_KEY_BURST', '120'))
+RATE_LIMIT_USER_PER_MINUTE = float(os.getenv('RATE_LIMIT_USER_PER_MINUTE', '180'))
+RATE_LIMIT_USER_BURST = int(os.getenv('RATE_LIMIT_USER_BURST', '90'))
+RATE_LIMIT_IP_PER_MINUTE = float(os.getenv('RATE_LIMIT_IP_PER_MINUTE', '180'))
+RATE_LIMIT_IP_BURST = int(os.getenv('RATE_LIMIT_IP_BURST', '90'))
+# Empty means in-process buckets only (one uvicorn worker)
+RATE_LIMIT_DB_PATH = os.getenv('RATE_LIMIT_DB_PATH', '')
+RATE_LIMIT_LOCK_STRIPES = 64
+
+
+def _limit_message(scope: Optional[str], retry_after: float) -> str:
+    if retry_after <= 0:
+        return f"Rate limit exceeded ({scope})."
+    return f"Rate limit exceeded ({scope}). Please try again in {max(1, round(retry_after))} seconds."
+
+
+class RateLimitExceeded(Exception):
+    """Raised when an upstream call is refused by the server-side rate limiter."""
+
+    def __init__(self, scope: str, retry_after: float):
+        super().__init__(_limit_message(scope, retry_after))
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+@dataclass(frozen=True)
+class BucketPolicy:
+    """Sustained rate and burst size of one token bucket."""
+    per_minute: float
+    burst: int
+
+    @property
+    def interval(self) -> float:
+        """Seconds between tokens at the sustained rate."""
+        return 60.0 / self.per_minute
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of a rate limit check (truthy when the call is allowed)."""
+    allowed: bool
+    scope: Optional[str] = None
+    retry_after: float = 0.0
+
+    def __bool__(self) -> bool:
+        return self.allowed
+
+    def message(self) -> str:
+        """User-facing explanation of a refusal."""
+        return _limit_message(self.scope, self.retry_after)
+
+
+DEFAULT_POLICIES: Dict[str, BucketPolicy] = {
+    'api_key': BucketPolicy(RATE_LIMIT_API_KEY_PER_MINUTE, RATE_LIMIT_API_KEY_BURST),
+    'user': BucketPolicy(RATE_LIMIT_USER_PER_MINUTE, RATE_LIMIT_USER_BURST),
+    'ip': BucketPolicy(RATE_LIMIT_IP_PER_MINUTE, RATE_LIMIT_IP_BURST),
+}
+
+
+def _evaluate(buckets: List[Tuple[str, str, BucketPolicy]], tats: Dict[str, float],
+              now: float, cost: int) -> Tuple[RateLimitDecision, Dict[str, float]]:
+    """
+    Apply GCRA to every bucket of a call.
+
+    A call is allowed only if every bucket has ``cost`` tokens; nothing is
+    consumed otherwise. Returns the decision and the new arrival times.
+    """
+    new_tats: Dict[str, float] = {}
+    for key, scope, policy in buckets:
+        tat = max(tats.get(key, now), now)
+        new_tat = tat + cost * policy.interval
+        # The bucket is full when tat == now; it holds ``burst`` tokens
+        overflow = new_tat - now - policy.burst * policy.interval
+        if overflow > 0:
+            return RateLimitDecision(False, scope, overflow), {}
+        new_tats[key] = new_tat
+    return RateLimitDecision(True), new_tats
+
+
+class _LocalStore:
+    """In-process bucket state guarded by striped locks (unrelated keys never contend)."""
+
+    def __init__(self, stripes: int = RATE_LIMIT_LOCK_STRIPES):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._tats: Dict[str, float] = {}
+
+    def _stripe(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+    def _stripes(self, keys: List[str]) -> List[threading.Lock]:
+        indexes = sorted({hash(key) % len(self._locks) for key in keys})
+        return [self._locks[i] for i in indexes]
+
+    def apply(self, buckets: List[Tuple[str, str, BucketPolicy]], now: float,
+              cost: int, consume: bool) -> RateLimitDecision:
+        locks = self._stripes([key for key, _, _ in buckets])
+        for lock in locks:
+            lock.acquire()
+        try:
+            decision, new_tats = _evaluate(buckets, self._tats, now, cost)
+            if decision and consume:
+                self._tats.update(new_tats)
+            return decision
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def observe(self, tats: Mapping[str, float]) -> None:
+        """Record arrival times read from the shared store (they only move forward)."""
+        for key, tat in tats.items():
+            with self._stripe(key):
+                if tat > self._tats.get(key, 0.0):
+                    self._tats[key] = tat
+
+    def prune(self, now: float) -> None:
+        """Forget buckets that have refilled completely."""
+        for key in [key for key, tat in list(self._tats.items()) if tat <= now]:
+            with self._stripe(key):
+                # A call may have used the bucket since the snapshot above
+                tat = self._tats.get(key)
+                if tat is not None and tat <= now:
+                    del self._tats[key]
+
+
+class _SQLiteStore:
+    """Bucket state shared by every worker on the host through one SQLite file."""
+
+    def __init__(self, path: str):
+        if path != ':memory:':
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("CREATE TABLE IF NOT EXISTS rate_limits (bucket TEXT PRIMARY KEY, tat REAL NOT NULL)")
+
+    def apply(self, buckets: List[Tuple[str, str, BucketPolicy]], now: float,
+              cost: int, consume: bool) -> Tuple[RateLimitDecision, Dict[str, float]]:
+        keys = [key for key, _, _ in buckets]
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            # BEGIN IMMEDIATE takes the write lock up front so workers cannot interleave
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._db.execute(
+                    f"SELECT bucket, tat FROM rate_limits WHERE bucket IN ({placeholders})", keys
+                ).fetchall()
+                tats = dict(rows)
+                decision, new_tats = _evaluate(buckets, tats, now, cost)
+                if decision and consume:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO rate_limits (bucket, tat) VALUES (?, ?)", new_tats.items()
+                    )
+                    tats.update(new_tats)
+                self._db.execute("COMMIT")
+                return decision, tats
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+
+    def prune(self, now: float) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM rate_limits WHERE tat <= ?", (now,))
+
+
+class RateLimiter:
+    """
+    Token buckets for upstream calls keyed by API key, user and client IP.
+
+    Callers pass an identity mapping such as ``{'api_key': ..., 'user': '42',
+    'ip': '203.0.113.7'}``; scopes with no value are skipped. A call is allowed
+    only if every bucket it touches has capacity.
+
+    With a shared SQLite store, the in-process buckets mirror the last state
+    read from disk. Arrival times only move forward, so a call the mirror
+    refuses would also be refused by the shared store and is rejected without
+    touching SQLite.
+    """
+
+    def __init__(self, policies: Optional[Dict[str, BucketPolicy]] = None,
+                 db_path: str = RATE_LIMIT_DB_PATH):
+        self.policies = dict(policies or DEFAULT_POLICIES)
+        self._local = _LocalStore()
+        self._shared = self._open_shared(db_path) if db_path else None
+        self._counts_lock = threading.Lock()
+        self._allowed = 0
+        self._denied: Dict[str, int] = {}
+        self._calls_since_prune = 0
+
+    @staticmethod
+    def _open_shared(path: str) -> Optional[_SQLiteStore]:
+        try:
+            return _SQLiteStore(path)
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limiter running per-process; could not open {path}: {e}")
+            return None
+
+    def _buckets(self, identity: Mapping[str, Optional[str]]) -> List[Tuple[str, str, BucketPolicy]]:
+        buckets = []
+        for scope, value in identity.items():
+            policy = self.policies.get(scope)
+            if policy is None or not value:
+                continue
+            value = str(value)
+            if scope == 'api_key':
+                # Never keep raw API keys in memory maps or on disk
+                value = hashlib.sha256(value.encode()).hexdigest()[:16]
+            buckets.append((f"{scope}:{value}", scope, policy))
+        return buckets
+
+    def check(self, identity: Mapping[str, Optional[str]], cost: int = 1) -> RateLimitDecision:
+        """Report whether ``cost`` tokens are available without consuming them."""
+        return self._apply(identity, cost, consume=False)
+
+    def acquire(self, identity: Mapping[str, Optional[str]], cost: int = 1) -> RateLimitDecision:
+        """Consume ``cost`` tokens from every bucket of ``identity`` if all have capacity."""
+        return self._apply(identity, cost, consume=True)
+
+    async def check_async(self, identity: Mapping[str, Optional[str]], cost: int = 1) -> RateLimitDecision:
+        """``check`` for coroutines; a shared store is queried on a worker thread."""
+        return await self._apply_async(identity, cost, consume=False)
+
+    async def acquire_async(self, identity: Mapping[str, Optional[str]], cost: int = 1) -> RateLimitDecision:
+        """``acquire`` for coroutines; a shared store is updated on a worker thread."""
+        return await self._apply_async(identity, cost, consume=True)
+
+    async def _apply_async(self, identity: Mapping[str, Optional[str]], cost: int,
+                           consume: bool) -> RateLimitDecision:
+        if self._shared is None:
+            # In-process buckets only hold a stripe lock for a few dict operations
+            return self._apply(identity, cost, consume)
+        return await asyncio.to_thread(self._apply, identity, cost, consume)
+
+    def _apply(self, identity: Mapping[str, Optional[str]], cost: int, consume: bool) -> RateLimitDecision:
+        buckets = self._buckets(identity)
+        if not buckets:
+            return RateLimitDecision(True)
+        now = time.time()
+
+        if self._shared is None:
+            decision = self._local.apply(buckets, now, cost, consume)
+        else:
+            # Fast reject from the mirrored state, otherwise decide in the shared store
+            decision = self._local.apply(buckets, now, cost, consume=False)
+            if decision:
+                try:
+                    decision, tats = self._shared.apply(buckets, now, cost, consume)
+                    self._local.observe(tats)
+                except sqlite3.Error as e:
+                    logger.warning(f"Shared rate limit store unavailable, using per-process buckets: {e}")
+                    decision = self._local.apply(buckets, now, cost, consume)
+
+        self._record(decision, consume, now)
+        return decision
+
+    def _record(self, decision: RateLimitDecision, consume: bool, now: float) -> None:
+        with self._counts_lock:
+            if not decision:
+                self._denied[decision.scope] = self._denied.get(decision.scope, 0) + 1
+            elif consume:
+                self._allowed += 1
+            self._calls_since_prune += 1
+            prune = self._calls_since_prune >= 1000
+            if prune:
+                self._calls_since_prune = 0
+        if prune:
+            self._local.prune(now)
+            if self._shared is not None:
+                try:
+                    self._shared.prune(now)
+                except sqlite3.Error as e:
+                    logger.warning(f"Rate limit store prune failed: {e}")
+
+    def stats(self) -> Dict[str, object]:
+        """Allowed calls and refusals per scope."""
+        with self._counts_lock:
+            return {
+                'allowed': self._allowed,
+                'denied': dict(self._denied),
+                'shared_store': self._shared is not None,
+            }
+
+
+class CallBudget:
+    """A fixed allowance of upstream calls shared by several searches (e.g. one batch request)."""
+
+    def __init__(self, calls: int):
+        self.limit = calls
+        self._used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def used(self) -> int:
+        """Calls taken so far."""
+        return self._used
+
+    def take(self, calls: int = 1) -> bool:
+        """Take ``calls`` from the allowance; False (and nothing taken) if it would be exceeded."""
+        with self._lock:
+            if self._used + calls > self.limit:
+                return False
+            self._used += calls
+            return True
+
+    def release(self, calls: int = 1) -> None:
+        """Return calls that were taken but never made."""
+        with self._lock:
+            self._used = max(0, self._used - calls)
+
+
+# Global rate limiter instance
+rate_limiter = RateLimiter()
@@ -0,0 +1,262 @@
+"""
+On-disk cache of scraped facility websites.
+
+Each scraped URL keeps the contact data extracted from it together with the
+page's ``ETag``/``Last-Modified`` validators. Within the TTL a cached result is
+returned without touching the website; after it the page is revalidated with a
+conditional GET, and a ``304 Not Modified`` renews the entry without parsing
+anything. Domains whose fetches or compliance checks fail are cached
+negatively for a shorter period so dead sites are not retried on every search;
+pages scraped from them earlier are served as-is meanwhile. The store lives in a
+SQLite file shared by all workers and is trimmed to a total size.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from src.app.services.details_cache import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Configuration constants (overridable via environment)
+SCRAPE_CACHE_PATH = os.getenv(
+    'SCRAPE_CACHE_PATH',
+    str(Path(__file__).resolve().parents[3] / "data" / "scrape_cache.db")
+)
+SCRAPE_CACHE_TTL_SECONDS = float(os.getenv('SCRAPE_CACHE_TTL_SECONDS', str(7 * 24 * 60 * 60)))
+SCRAPE_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv('SCRAPE_CACHE_NEGATIVE_TTL_SECONDS', str(60 * 60)))
+SCRAPE_CACHE_MAX_BYTES = int(os.getenv('SCRAPE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+# Writes between size checks
+SCRAPE_CACHE_TRIM_INTERVAL = 100
+
+
+@dataclass
+class CachedScrape:
+    """A cache lookup result; ``fresh`` entries can be used without any request."""
+    data: Dict[str, Any] = field(default_factory=dict)
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fresh: bool = False
+    # The domain recently failed; ``data`` is empty
+    negative: bool = False
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating the cached page."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class ScrapeCache:
+    """
+    Size-bounded SQLite store of scrape results per URL and failures per domain.
+
+    A stale entry is still returned (``fresh=False``) so callers can revalidate
+    it and fall back to it if the website cannot be reached. The SQLite file is
+    opened on first use.
+    """
+
+    def __init__(self, path: str = SCRAPE_CACHE_PATH,
+                 ttl_seconds: float = SCRAPE_CACHE_TTL_SECONDS,
+                 negative_ttl_seconds: float = SCRAPE_CACHE_NEGATIVE_TTL_SECONDS,
+                 max_bytes: int = SCRAPE_CACHE_MAX_BYTES):
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._revalidated = 0
+        self._negative_hits = 0
+        self._writes_since_trim = 0
+        self.path = path
+        self._connection: Optional[sqlite3.Connection] = None
+        self._opened = False
+        self._open_lock = threading.Lock()
+
+    def _open(self, path: str) -> Optional[sqlite3.Connection]:
+        try:
+            if path != ':memory:':
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS scraped_pages ("
+                "url TEXT PRIMARY KEY, payload TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+                "validated_at REAL NOT NULL, last_access REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS idx_scraped_pages_access ON scraped_pages(last_access)")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS failed_domains (domain TEXT PRIMARY KEY, failed_at REAL NOT NULL)"
+            )
+            return db
+        except sqlite3.Error as e:
+            logger.warning(f"Scrape cache disabled; could not open {path}: {e}")
+            return None
+
+    @property
+    def _db(self) -> Optional[sqlite3.Connection]:
+        # Opened on first use, so importing the module creates no files
+        if not self._opened:
+            with self._open_lock:
+                if not self._opened:
+                    self._connection = self._open(self.path)
+                    self._opened = True
+        return self._connection
+
+    @staticmethod
+    def _domain(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def lookup(self, url: str) -> Optional[CachedScrape]:
+        """
+        Look up a URL.
+
+        Returns:
+            A fresh entry, a negative entry for a recently failed domain, a stale
+            entry to revalidate, or None if nothing is cached
+        """
+        if self._db is None:
+            return None
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT payload, etag, last_modified, validated_at FROM scraped_pages WHERE url = ?", (url,)
+                ).fetchone()
+                failed = self._db.execute(
+                    "SELECT failed_at FROM failed_domains WHERE domain = ?", (self._domain(url),)
+                ).fetchone()
+                # While the domain is down, serve whatever was scraped before without retrying
+                domain_down = failed is not None and now - failed[0] <= self.negative_ttl_seconds
+                if row is None:
+                    if domain_down:
+                        self._negative_hits += 1
+                        self._stats.hits += 1
+                        return CachedScrape(fresh=True, negative=True)
+                    self._stats.misses += 1
+                    return None
+                self._db.execute("UPDATE scraped_pages SET last_access = ? WHERE url = ?", (now, url))
+                payload, etag, last_modified, validated_at = row
+                fresh = domain_down or now - validated_at <= self.ttl_seconds
+                if fresh:
+                    self._stats.hits += 1
+                else:
+                    self._stats.partial_hits += 1
+                return CachedScrape(json.loads(payload), etag, last_modified, fresh=fresh)
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Scrape cache read failed for {url}: {e}")
+                return None
+
+    def store(self, url: str, data: Dict[str, Any], etag: Optional[str] = None,
+              last_modified: Optional[str] = None) -> None:
+        """Store what was scraped from ``url`` (an empty dict records a page with nothing to extract)."""
+        if self._db is None:
+            return
+        now = time.time()
+        payload = json.dumps(data)
+        size = len(url) + len(payload) + len(etag or '') + len(last_modified or '')
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO scraped_pages "
+                    "(url, payload, etag, last_modified, validated_at, last_access, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url, payload, etag, last_modified, now, now, size)
+                )
+                self._db.execute("DELETE FROM failed_domains WHERE domain = ?", (self._domain(url),))
+                self._writes_since_trim += 1
+                if self._writes_since_trim >= SCRAPE_CACHE_TRIM_INTERVAL:
+                    self._trim()
+            except sqlite3.Error as e:
+                logger.warning(f"Scrape cache write failed for {url}: {e}")
+
+    def revalidated(self, url: str) -> None:
+        """Mark a stale entry as current again (the website answered 304 Not Modified)."""
+        if self._db is None:
+            return
+        now = time.time()
+        with self._lock:
+            try:
+                self._db.execute(
+                    "UPDATE scraped_pages SET validated_at = ?, last_access = ? WHERE url = ?", (now, now, url)
+                )
+                self._db.execute("DELETE FROM failed_domains WHERE domain = ?", (self._domain(url),))
+                self._revalidated += 1
+            except sqlite3.Error as e:
+                logger.warning(f"Scrape cache write failed for {url}: {e}")
+
+    def record_failure(self, url: str) -> None:
+        """Cache a failed scrape negatively for the URL's whole domain."""
+        if self._db is None:
+            return
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO failed_domains (domain, failed_at) VALUES (?, ?)",
+                    (self._domain(url), time.time())
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Scrape cache write failed for {url}: {e}")
+
+    def _trim(self) -> None:
+        """Evict least recently used pages once their total size exceeds ``max_bytes``."""
+        self._writes_since_trim = 0
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM scraped_pages").fetchone()
+        if total <= self.max_bytes:
+            return
+        # Evict down to 90% so trimming does not run on every write
+        excess = total - int(self.max_bytes * 0.9)
+        evict = []
+        for url, size in self._db.execute("SELECT url, size FROM scraped_pages ORDER BY last_access ASC"):
+            evict.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._db.executemany("DELETE FROM scraped_pages WHERE url = ?", evict)
+        self._db.execute(
+            "DELETE FROM failed_domains WHERE failed_at < ?", (time.time() - self.negative_ttl_seconds,)
+        )
+        self._stats.evictions += len(evict)
+        logger.info(f"Scrape cache evicted {len(evict)} pages")
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss statistics and current size (stale lookups are reported as partial hits)."""
+        with self._lock:
+            result = self._stats.to_dict()
+            result['negative_hits'] = self._negative_hits
+            result['revalidated'] = self._revalidated
+            if self._db is not None:
+                try:
+                    pages, size = self._db.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM scraped_pages"
+                    ).fetchone()
+                    result['pages'] = pages
+                    result['bytes'] = size
+                    result['failed_domains'] = self._db.execute(
+                        "SELECT COUNT(*) FROM failed_domains"
+                    ).fetchone()[0]
+                except sqlite3.Error:
+                    pass
+            return result
+
+    def clear(self) -> None:
+        """Remove every cached page and failure."""
+        with self._lock:
+            if self._db is not None:
+                self._db.execute("DELETE FROM scraped_pages")
+                self._db.execute("DELETE FROM failed_domains")
+
+
+# Global cache instance
+scrape_cache = ScrapeCache()
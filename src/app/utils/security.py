@@ -1,25 +1,17 @@
 """
-Security utilities for input validation, sanitization, and rate limiting.
+Security utilities for input validation, sanitization, and request logging.
 """
 
 import re
-import time
-import streamlit as st
 from typing import Tuple
 from datetime import datetime
 import logging
-import threading
 
 # Configuration constants (replacing deleted config.settings)
-MAX_REQUESTS_PER_SESSION = 50
-SESSION_TIMEOUT_MINUTES = 30
 REQUEST_TIMEOUT_SECONDS = 15
 
 logger = logging.getLogger(__name__)
 
-# Thread lock for session state operations
-_session_lock = threading.Lock()
-
 
 def sanitize_input(text: str) -> str:
     """Sanitize user input to prevent injection attacks."""
@@ -109,41 +101,6 @@ def validate_api_key(api_key: str) -> Tuple[bool, str]:
     return True, "Valid API key"
 
 
-def check_rate_limit() -> bool:
-    """Check if user has exceeded rate limits (thread-safe)."""
-    with _session_lock:
-        current_time = time.time()
-        session_start = st.session_state.get('session_start', current_time)
-        session_duration = current_time - session_start
-        
-        # Check if session has expired
-        if session_duration > SESSION_TIMEOUT_MINUTES * 60:
-            # Reset session but add cooldown period to prevent rapid resets
-            cooldown_period = 60  # 1 minute cooldown
-            last_reset = st.session_state.get('last_reset', 0)
-            
-            if current_time - last_reset > cooldown_period:
-                st.session_state.request_count = 0
-                st.session_state.session_start = current_time
-                st.session_state.last_reset = current_time
-                return True
-            else:
-                # Still in cooldown period
-                return False
-        
-        # Check current request count
-        current_count = st.session_state.get('request_count', 0)
-        return current_count < MAX_REQUESTS_PER_SESSION
-
-
-def increment_request_count():
-    """Increment the request counter (thread-safe)."""
-    with _session_lock:
-        if 'request_count' not in st.session_state:
-            st.session_state.request_count = 0
-        st.session_state.request_count += 1
-
-
 def secure_log_request(operation: str, success: bool = True, error_msg: str = ""):
     """Log requests securely without exposing sensitive data."""
     timestamp = datetime.now().isoformat()
@@ -156,19 +113,6 @@ def secure_log_request(operation: str, success: bool = True, error_msg: str = ""
     logger.info(f"Request logged: {log_data}")
 
 
-def initialize_session_security():
-    """Initialize security-related session state variables (thread-safe)."""
-    with _session_lock:
-        current_time = time.time()
-        
-        if 'request_count' not in st.session_state:
-            st.session_state.request_count = 0
-        if 'session_start' not in st.session_state:
-            st.session_state.session_start = current_time
-        if 'last_reset' not in st.session_state:
-            st.session_state.last_reset = 0
-
-
 def validate_search_inputs(place_type: str, city: str, country: str, max_results: int) -> Tuple[bool, str]:
     """Validate all search input parameters."""
     # Validate business type
@@ -0,0 +1,134 @@
+"""
+Request coalescing ("single flight") for duplicate in-flight upstream calls.
+
+When several callers ask for the same key at the same time, only the first
+(the leader) runs the call; the others wait for it and receive the same result
+or exception. Once the call finishes the key is released, so later callers
+trigger a new call (caching is handled separately).
+
+Followers can be charged for a shared result (``on_shared``), and errors that
+concern only the leader's caller (``retry_on``, e.g. its own rate limit) are
+not passed on: followers that see one retry with their own ``fn`` instead.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, Type
+
+
+class _Call:
+    """An in-flight call shared by the leader and its followers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls made from threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args: Any,
+           on_shared: Optional[Callable[[], None]] = None,
+           retry_on: Tuple[Type[BaseException], ...] = ()) -> Any:
+        """
+        Run ``fn(*args)`` unless a call for ``key`` is already in flight.
+
+        Args:
+            on_shared: Called by a follower before it takes the leader's result; may raise to refuse it
+            retry_on: Leader exceptions that followers do not share; they retry instead
+
+        Returns:
+            The leader's result (followers re-raise the leader's exception)
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.coalesced += 1
+                    leader = False
+                else:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.executed += 1
+                    leader = True
+            if leader:
+                break
+
+            call.done.wait()
+            if isinstance(call.error, retry_on):
+                continue
+            if call.error is not None:
+                raise call.error
+            if on_shared is not None:
+                on_shared()
+            return call.result
+
+        try:
+            call.result = fn(*args)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """Number of upstream calls executed and duplicate calls avoided."""
+        with self._lock:
+            return {'executed': self.executed, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
+
+
+class AsyncSingleFlight:
+    """Coalesces concurrent identical coroutine calls on an event loop."""
+
+    def __init__(self):
+        self._calls: Dict[Tuple[int, Hashable], asyncio.Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args: Any,
+                 on_shared: Optional[Callable[[], Awaitable[None]]] = None,
+                 retry_on: Tuple[Type[BaseException], ...] = ()) -> Any:
+        """
+        Await ``fn(*args)`` unless a call for ``key`` is already in flight on this loop.
+
+        The shared call is shielded, so a cancelled waiter does not cancel it
+        for the others. ``retry_on`` works as in ``SingleFlight.do``; ``on_shared``
+        is the coroutine counterpart of its hook there.
+        """
+        flight_key = (id(asyncio.get_running_loop()), key)
+        while True:
+            task = self._calls.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args))
+                self._calls[flight_key] = task
+                self.executed += 1
+                task.add_done_callback(lambda done: self._release(flight_key, done))
+                return await asyncio.shield(task)
+
+            self.coalesced += 1
+            try:
+                result = await asyncio.shield(task)
+            except retry_on:
+                continue
+            if on_shared is not None:
+                await on_shared()
+            return result
+
+    def _release(self, flight_key: Tuple[int, Hashable], task: asyncio.Future) -> None:
+        # A retrying follower may already have started the next call for this key
+        if self._calls.get(flight_key) is task:
+            del self._calls[flight_key]
+
+    def stats(self) -> Dict[str, int]:
+        """Number of upstream calls executed and duplicate calls avoided."""
+        return {'executed': self.executed, 'coalesced': self.coalesced, 'in_flight': len(self._calls)}
@@ -2,317 +2,1255 @@
 Enhanced web scraping utilities for extracting comprehensive business information from websites.
 """
 
+import os
+import math
+import time
+import asyncio
+import weakref
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 import requests
+import httpx
 from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
 import re
-from typing import Tuple, Dict, List, Optional
+from typing import Tuple, Dict, List, Optional, Iterable, AsyncIterator
 import logging
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urldefrag, urljoin, urlparse
 import json
+from dataclasses import dataclass, asdict, field, fields
 
-from src.app.models.facility import ContactInfo
+from src.app.models.facility import ContactInfo, ScrapedProfile
+from .contact_extractor import ContactTokens, calling_code_for_domain, extract_contacts
+from .http_client import http_clients
+from .legal_compliance import compliance_checker
+from .scrape_cache import CachedScrape, scrape_cache
 
 logger = logging.getLogger(__name__)
 
+# Configuration constants (overridable via environment)
+SCRAPER_MAX_CONCURRENCY = int(os.getenv('SCRAPER_MAX_CONCURRENCY', '16'))
+SCRAPER_PER_DOMAIN_CONCURRENCY = int(os.getenv('SCRAPER_PER_DOMAIN_CONCURRENCY', '2'))
+SCRAPER_TIMEOUT_SECONDS = 10
+# Download guards: total time per page, hard size cap, and the size after which
+# reading stops once the head and some contact details have arrived
+SCRAPER_DOWNLOAD_SECONDS = float(os.getenv('SCRAPER_DOWNLOAD_SECONDS', '15'))
+SCRAPER_MAX_BYTES = int(os.getenv('SCRAPER_MAX_BYTES', str(1024 * 1024)))
+SCRAPER_ENOUGH_BYTES = int(os.getenv('SCRAPER_ENOUGH_BYTES', str(256 * 1024)))
+SCRAPER_CHUNK_BYTES = 16 * 1024
+# BeautifulSoup tree builder: 'auto' uses a C-accelerated parser when one is
+# installed, or name one explicitly ('lxml', 'html.parser', ...)
+SCRAPER_HTML_PARSER = os.getenv('SCRAPER_HTML_PARSER', 'auto')
+# Accelerated builders tried by 'auto', in order of preference
+FAST_HTML_PARSERS = ('lxml',)
+FALLBACK_HTML_PARSER = 'html.parser'
+# Worker processes that decode, parse and extract pages; 0 does it in the fetching thread
+SCRAPER_PARSE_PROCESSES = int(os.getenv('SCRAPER_PARSE_PROCESSES', '0'))
+# Contact discovery beyond the given page: at most SCRAPER_CRAWL_PAGES more pages
+# of the site, SCRAPER_CRAWL_CONCURRENCY at a time, within SCRAPER_CRAWL_SECONDS
+# (or less, when the caller's deadline comes first)
+SCRAPER_CRAWL_PAGES = int(os.getenv('SCRAPER_CRAWL_PAGES', '3'))
+SCRAPER_CRAWL_CONCURRENCY = int(os.getenv('SCRAPER_CRAWL_CONCURRENCY', '2'))
+SCRAPER_CRAWL_SECONDS = float(os.getenv('SCRAPER_CRAWL_SECONDS', '20'))
+# A scrape given a deadline returns this long before it, so the caller can still merge the result
+SCRAPER_DEADLINE_MARGIN_SECONDS = float(os.getenv('SCRAPER_DEADLINE_MARGIN_SECONDS', '0.5'))
 
-def scrape_website_for_contacts(website: str) -> ContactInfo:
+# Fields a scrape looks for by default; crawling stops once all of them are found
+CONTACT_FIELDS = tuple(f.name for f in fields(ContactInfo))
+_PROFILE_FIELDS = frozenset(f.name for f in fields(ScrapedProfile))
+
+# Browser-like headers with a legal compliance notice
+SCRAPER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (compatible; LegalComplianceBot/1.0; +https://example.com/legal-compliance)',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'X-Compliance-Notice': 'This request is made in compliance with robots.txt and terms of service'
+}
+
+# Media types worth parsing; anything else (PDFs, images, feeds) is skipped unread
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+SITEMAP_CONTENT_TYPES = ('application/xml', 'text/xml')
+# File signatures of common non-HTML bodies served without a Content-Type
+_BINARY_SIGNATURES = (b'%PDF', b'\x89PNG', b'GIF8', b'\xff\xd8\xff', b'PK\x03\x04', b'\x1f\x8b')
+# Markup that carries contact details; seeing one lets a large page be cut short
+_CONTACT_MARKERS = (b'mailto:', b'tel:', b'wa.me/', b'whatsapp.com/', b'instagram.com/')
+_CHARSET_PATTERN = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+
+
+def scrape_website_for_contacts(website: str, fields: Iterable[str] = CONTACT_FIELDS,
+                                calling_code: Optional[str] = None,
+                                deadline: Optional[float] = None) -> ScrapedProfile:
     """
     Extract contact information from a website with legal compliance checks.
     
+    Fields missing from the page are looked for on a few more pages of the
+    site (see ``_crawl_site``).
+    
     Args:
         website: The website URL to scrape
+        fields: Contact fields worth crawling further pages for
+        calling_code: Country calling code for phone numbers written without
+            one (default: from the website's country-code domain)
+        deadline: ``time.monotonic()`` value the result is needed by. The
+            crawl stops in time to return what the pages fetched so far
+            (at least the first page) provided.
         
     Returns:
-        ContactInfo object with extracted contact details
+        ScrapedProfile with the contact details, social links and business
+        details found
     """
     if not website:
-        return ContactInfo()
+        return ScrapedProfile()
+    
+    cached = _lookup_cached(website)
+    if cached is not None and cached.fresh:
+        return _profile_from_cache(cached)
     
     try:
-        # Import compliance checker
-        from .legal_compliance import compliance_checker
-        
-        # Check legal compliance before scraping
-        compliance_check = compliance_checker.check_website_compliance(website)
-        
-        if not compliance_check.is_compliant:
-            logger.warning(f"Website {website} failed compliance check: {compliance_check.violations}")
-            return ContactInfo()
-        
-        # Log warnings if any
-        if compliance_check.warnings:
-            logger.info(f"Compliance warnings for {website}: {compliance_check.warnings}")
+        if not _passes_compliance_check(website):
+            scrape_cache.record_failure(website)
+            return _profile_from_cache(cached)
         
         # Enforce rate limiting
         domain = urlparse(website).netloc
-        if not compliance_checker.enforce_rate_limit(domain):
-            logger.warning(f"Rate limit exceeded for {domain}")
-            return ContactInfo()
-        
-        # Set headers to mimic a real browser with legal compliance notice
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (compatible; LegalComplianceBot/1.0; +https://example.com/legal-compliance)',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'X-Compliance-Notice': 'This request is made in compliance with robots.txt and terms of service'
-        }
-        
-        response = requests.get(website, timeout=10, headers=headers)
-        response.raise_for_status()
+        delay = _first_page_delay(domain, deadline)
+        if delay is None:
+            return _profile_from_cache(cached)
+        if delay > 0:
+            logger.info(f"Rate limiting: sleeping for {delay:.2f} seconds")
+            time.sleep(delay)
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        page = _fetch_page(website, cached)
+        if page.denied:
+            scrape_cache.record_failure(website)
+            return _profile_from_cache(cached)
+        if page.not_modified and cached is not None:
+            scrape_cache.revalidated(website)
+            return _profile_from_cache(cached)
         
-        # Extract comprehensive business information
-        business_info = _extract_comprehensive_business_info(soup, website)
-        
-        # Validate data usage compliance
-        data_validation = compliance_checker.validate_data_usage(business_info, 'web_scraping')
-        if not data_validation.is_compliant:
-            logger.warning(f"Data usage validation failed for {website}: {data_validation.violations}")
-        
-        return ContactInfo(
-            email=business_info.get('email', ''),
-            whatsapp=business_info.get('whatsapp', ''),
-            instagram=business_info.get('instagram', ''),
-            established_year=business_info.get('established_year', '')
-        )
+        contact = ScrapedProfile()
+        if page.body is not None:
+            calling_code = calling_code or calling_code_for_domain(domain)
+            home = parse_stage.extract(page.body, page.content_type, website, calling_code)
+            business_info = _crawl_site(website, home, fields, calling_code, deadline)
+            contact = _profile_from_fields(business_info, website)
+        scrape_cache.store(website, asdict(contact), page.etag, page.last_modified)
+        return contact
         
     except requests.RequestException as e:
         logger.warning(f"Failed to scrape website {website}: {e}")
-        return ContactInfo()
+        scrape_cache.record_failure(website)
+        return _profile_from_cache(cached)
     except (ValueError, TypeError, AttributeError) as e:
         logger.warning(f"Data processing error scraping website {website}: {e}")
-        return ContactInfo()
+        return ScrapedProfile()
     except Exception as e:
         logger.error(f"Unexpected error scraping website {website}: {e}")
-        return ContactInfo()
+        return ScrapedProfile()
 
 
-def _extract_comprehensive_business_info(soup: BeautifulSoup, base_url: str) -> Dict[str, str]:
+class _PageDownload:
+    """
+    A page being streamed in, with the limits that decide when to stop reading.
+    
+    Reading stops at ``SCRAPER_MAX_BYTES`` or after ``SCRAPER_DOWNLOAD_SECONDS``
+    (the page is then truncated), or, past ``SCRAPER_ENOUGH_BYTES``, as soon as
+    the whole ``<head>`` and at least one contact marker have arrived.
+    """
+    
+    def __init__(self, content_type: Optional[str]):
+        self.content_type = content_type
+        self.size = 0
+        self.truncated = False
+        self._chunks: List[bytes] = []
+        self._started = time.monotonic()
+        self._head_complete = False
+        self._contact_seen = False
+        # End of the previous chunk, so markers split across chunks are still found
+        self._carry = b''
+    
+    def feed(self, chunk: bytes) -> bool:
+        """Add the next chunk; True once no more should be read."""
+        room = SCRAPER_MAX_BYTES - self.size
+        if len(chunk) >= room:
+            chunk = chunk[:room]
+            self.truncated = True
+        self._chunks.append(chunk)
+        self.size += len(chunk)
+        
+        window = self._carry + chunk.lower()
+        self._carry = window[-32:]
+        if not self._head_complete:
+            self._head_complete = b'</head' in window
+        if not self._contact_seen:
+            self._contact_seen = any(marker in window for marker in _CONTACT_MARKERS)
+        
+        if self.truncated:
+            return True
+        if time.monotonic() - self._started > SCRAPER_DOWNLOAD_SECONDS:
+            self.truncated = True
+            return True
+        return self.size >= SCRAPER_ENOUGH_BYTES and self._head_complete and self._contact_seen
+    
+    def body(self) -> Optional[bytes]:
+        """Raw page, or None if the body turned out not to be a document."""
+        body = b''.join(self._chunks)
+        if body.startswith(_BINARY_SIGNATURES):
+            return None
+        return body
+
+
+def _decode_page(body: bytes, content_type: Optional[str]) -> str:
+    """Decode a page using the Content-Type charset, then a <meta> charset, then UTF-8."""
+    charset = None
+    match = _CHARSET_PATTERN.search(content_type or '') or _META_CHARSET_PATTERN.search(body[:4096])
+    if match:
+        charset = match.group(1)
+        charset = charset.decode('ascii') if isinstance(charset, bytes) else charset
+    try:
+        return body.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+@dataclass
+class _FetchedPage:
+    """Outcome of a page fetch and the validators to revalidate it with later."""
+    # Raw page; None when it was not modified, is not an HTML document or access was denied
+    body: Optional[bytes] = None
+    content_type: Optional[str] = None
+    not_modified: bool = False
+    # The site requires authentication (see ``LegalComplianceChecker.access_violations``)
+    denied: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def _lookup_cached(website: str) -> Optional[CachedScrape]:
+    cached = scrape_cache.lookup(website)
+    # Entries written before whole profiles were cached hold only the contact fields; scrape those again
+    if cached is not None and not cached.negative and not _PROFILE_FIELDS <= cached.data.keys():
+        return None
+    return cached
+
+
+def _profile_from_cache(cached: Optional[CachedScrape]) -> ScrapedProfile:
+    if cached is None:
+        return ScrapedProfile()
+    return ScrapedProfile(**{key: value for key, value in cached.data.items() if key in _PROFILE_FIELDS})
+
+
+def _request_headers(cached: Optional[CachedScrape]) -> Dict[str, str]:
+    # Conditional GET when revalidating a cached page
+    if cached is None or cached.negative:
+        return SCRAPER_HEADERS
+    return {**SCRAPER_HEADERS, **cached.validators()}
+
+
+def _is_accepted_content_type(content_type: Optional[str], accepted: Tuple[str, ...]) -> bool:
+    # A missing Content-Type is sniffed from the body instead
+    if not content_type:
+        return True
+    return content_type.split(';', 1)[0].strip().lower() in accepted
+
+
+def _finish_download(download: _PageDownload, website: str) -> Optional[bytes]:
+    if download.truncated:
+        logger.info(f"Stopped reading {website} after {download.size} bytes")
+    body = download.body()
+    if body is None:
+        logger.info(f"Skipping {website}: body is not a text document")
+    return body
+
+
+def _fetch_page(website: str, cached: Optional[CachedScrape] = None,
+                content_types: Tuple[str, ...] = HTML_CONTENT_TYPES) -> _FetchedPage:
+    """
+    Stream a page within the size, time and content-type guards.
+    
+    Args:
+        website: The page URL
+        cached: Cached scrape of the page; its validators make the GET conditional
+        content_types: Media types worth reading
+        
+    Returns:
+        The (possibly truncated) page, ``not_modified`` if the cached copy is
+        current, or ``denied`` if the site asks for authentication
+    """
+    with http_clients.get(website, timeout=SCRAPER_TIMEOUT_SECONDS, headers=_request_headers(cached),
+                          stream=True) as response:
+        if response.status_code == 304:
+            return _FetchedPage(not_modified=True)
+        if _access_denied(website, response.status_code, response.headers):
+            return _FetchedPage(denied=True)
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type')
+        page = _FetchedPage(content_type=content_type, etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified'))
+        if not _is_accepted_content_type(content_type, content_types):
+            logger.info(f"Skipping {website}: content type {content_type}")
+            return page
+        download = _PageDownload(content_type)
+        for chunk in response.iter_content(SCRAPER_CHUNK_BYTES):
+            if download.feed(chunk):
+                break
+    page.body = _finish_download(download, website)
+    return page
+
+
+async def _fetch_page_async(website: str, cached: Optional[CachedScrape] = None,
+                            content_types: Tuple[str, ...] = HTML_CONTENT_TYPES) -> _FetchedPage:
+    """Async counterpart of ``_fetch_page``."""
+    client = http_clients.async_client()
+    async with client.stream('GET', website, headers=_request_headers(cached), timeout=SCRAPER_TIMEOUT_SECONDS,
+                             follow_redirects=True) as response:
+        if response.status_code == 304:
+            return _FetchedPage(not_modified=True)
+        if _access_denied(website, response.status_code, response.headers):
+            return _FetchedPage(denied=True)
+        response.raise_for_status()
+        content_type = response.headers.get('Content-Type')
+        page = _FetchedPage(content_type=content_type, etag=response.headers.get('ETag'),
+                            last_modified=response.headers.get('Last-Modified'))
+        if not _is_accepted_content_type(content_type, content_types):
+            logger.info(f"Skipping {website}: content type {content_type}")
+            return page
+        download = _PageDownload(content_type)
+        async for chunk in response.aiter_bytes():
+            if download.feed(chunk):
+                break
+    page.body = _finish_download(download, website)
+    return page
+
+
+def _access_denied(website: str, status_code: int, headers) -> bool:
+    # The page fetch itself shows whether the site is publicly accessible
+    violations = compliance_checker.access_violations(website, status_code, headers)
+    if violations:
+        logger.warning(f"Website {website} failed compliance check: {violations}")
+    return bool(violations)
+
+
+def _passes_compliance_check(website: str) -> bool:
+    """
+    Run the legal compliance check for a website and log its outcome.
+    
+    Access is not probed here; ``_fetch_page`` checks the page's own response.
+    """
+    compliance_check = compliance_checker.check_website_compliance(website, check_access=False)
+    
+    if not compliance_check.is_compliant:
+        logger.warning(f"Website {website} failed compliance check: {compliance_check.violations}")
+        return False
+    
+    # Log warnings if any
+    if compliance_check.warnings:
+        logger.info(f"Compliance warnings for {website}: {compliance_check.warnings}")
+    return True
+
+
+def _time_left(deadline: Optional[float]) -> float:
+    """Seconds until a scrape with this deadline must return (infinite without one)."""
+    if deadline is None:
+        return math.inf
+    return deadline - SCRAPER_DEADLINE_MARGIN_SECONDS - time.monotonic()
+
+
+def _first_page_delay(domain: str, deadline: Optional[float]) -> Optional[float]:
+    """
+    Reserve the request slot for a site's first page.
+    
+    Returns:
+        Seconds to wait for it, or None if the domain's per-minute limit is
+        spent or the slot comes too late for ``deadline``
+    """
+    delay = compliance_checker.reserve_request_slot(domain)
+    if delay is None:
+        logger.warning(f"Rate limit exceeded for {domain}")
+        return None
+    if delay >= _time_left(deadline):
+        logger.info(f"Skipping {domain}: its next request slot is past the deadline")
+        return None
+    return delay
+
+
+def resolve_html_parser(preference: str = SCRAPER_HTML_PARSER) -> str:
+    """
+    Tree builder to parse scraped pages with.
+    
+    'auto' picks the first installed builder from ``FAST_HTML_PARSERS``. Any
+    builder that is not installed falls back to the pure-Python 'html.parser'.
+    """
+    candidates = FAST_HTML_PARSERS if preference == 'auto' else (preference,)
+    for name in candidates:
+        if builder_registry.lookup(name) is not None:
+            return name
+    if preference != 'auto':
+        logger.warning(f"HTML parser '{preference}' is not available, using {FALLBACK_HTML_PARSER}")
+    return FALLBACK_HTML_PARSER
+
+
+HTML_PARSER = resolve_html_parser()
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse a page with ``parser`` (default ``HTML_PARSER``), falling back to 'html.parser' on failure."""
+    parser = parser or HTML_PARSER
+    if parser == FALLBACK_HTML_PARSER:
+        return BeautifulSoup(html, parser)
+    try:
+        return BeautifulSoup(html, parser)
+    except Exception as e:
+        logger.debug(f"{parser} could not parse page, retrying with {FALLBACK_HTML_PARSER}: {e}")
+        return BeautifulSoup(html, FALLBACK_HTML_PARSER)
+
+
+@dataclass
+class _ExtractedPage:
+    """What the parse stage returns for a page."""
+    fields: Dict[str, str]
+    # Same-site links likely to hold contact details, best first
+    contact_links: List[str] = field(default_factory=list)
+
+
+def _extract_page(body: bytes, content_type: Optional[str], website: str,
+                  calling_code: Optional[str] = None) -> _ExtractedPage:
+    """Decode, parse and extract a fetched page (runs in a parse worker process when enabled)."""
+    page = _PageIndex(parse_html(_decode_page(body, content_type)))
+    return _ExtractedPage(_extract_comprehensive_business_info(page, website, calling_code),
+                          _rank_contact_links(page.anchors, website))
+
+
+class ParseStage:
+    """
+    The CPU-bound part of scraping: decoding, parsing and field extraction.
+    
+    With ``processes`` > 0 pages are sent as raw bytes to a pool of worker
+    processes and only the extracted fields and links come back, so parsing
+    does not compete for the GIL with the threads and event loop serving
+    requests.
+    Otherwise pages are parsed in the calling thread. If a worker dies the
+    pool is replaced and the page is parsed in the caller instead.
+    """
+    
+    def __init__(self, processes: int = SCRAPER_PARSE_PROCESSES):
+        self.processes = processes
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+    
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                # Workers start from a fresh interpreter; forking a process with live threads is unsafe
+                self._pool = ProcessPoolExecutor(max_workers=self.processes,
+                                                 mp_context=multiprocessing.get_context('spawn'))
+            return self._pool
+    
+    def _discard(self, pool: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+    
+    def _submit(self, body: bytes, content_type: Optional[str], website: str,
+                calling_code: Optional[str]) -> Tuple[ProcessPoolExecutor, Future]:
+        pool = self._executor()
+        try:
+            return pool, pool.submit(_extract_page, body, content_type, website, calling_code)
+        except (BrokenProcessPool, RuntimeError):
+            self._discard(pool)
+            pool = self._executor()
+            return pool, pool.submit(_extract_page, body, content_type, website, calling_code)
+    
+    def extract(self, body: bytes, content_type: Optional[str], website: str,
+                calling_code: Optional[str] = None) -> _ExtractedPage:
+        """Extract business information and contact links from a fetched page, blocking until done."""
+        if not self.processes:
+            return _extract_page(body, content_type, website, calling_code)
+        pool, future = self._submit(body, content_type, website, calling_code)
+        try:
+            return future.result()
+        except BrokenProcessPool:
+            logger.warning(f"Parse worker died on {website}; parsing in process")
+            self._discard(pool)
+            return _extract_page(body, content_type, website, calling_code)
+    
+    async def extract_async(self, body: bytes, content_type: Optional[str], website: str,
+                            calling_code: Optional[str] = None) -> _ExtractedPage:
+        """Async counterpart of ``extract`` (requires ``processes`` > 0)."""
+        pool, future = self._submit(body, content_type, website, calling_code)
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            logger.warning(f"Parse worker died on {website}; parsing in process")
+            self._discard(pool)
+            return _extract_page(body, content_type, website, calling_code)
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes (a later page starts a new pool)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+# Global parse stage instance
+parse_stage = ParseStage()
+
+
+def _profile_text(value) -> str:
+    # JSON-LD values may be lists or numbers
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(item) for item in value if item)
+    return str(value).strip() if value else ''
+
+
+def _profile_from_fields(business_info: Dict[str, str], website: str) -> ScrapedProfile:
+    """The scraped profile from the fields extracted from a site, after the data usage check."""
+    # Validate data usage compliance
+    data_validation = compliance_checker.validate_data_usage(business_info, 'web_scraping')
+    if not data_validation.is_compliant:
+        logger.warning(f"Data usage validation failed for {website}: {data_validation.violations}")
+    
+    profile = ScrapedProfile(**{name: _profile_text(business_info.get(name)) for name in _PROFILE_FIELDS})
+    if not profile.description:
+        profile.description = _profile_text(business_info.get('business_description'))
+    return profile
+
+
+class _ContactCrawl:
+    """
+    One site's contact crawl: its deadline and the pages extracted so far.
+    
+    Fields are merged first page first, then in link rank order, so the result
+    does not depend on which page happened to arrive first.
+    """
+    
+    def __init__(self, website: str, home: _ExtractedPage, wanted: Iterable[str],
+                 calling_code: Optional[str] = None, deadline: Optional[float] = None):
+        self.website = website
+        self.domain = urlparse(website).netloc
+        self.home = home
+        self.wanted = tuple(wanted)
+        self.calling_code = calling_code
+        self.deadline = time.monotonic() + min(SCRAPER_CRAWL_SECONDS, _time_left(deadline))
+        self.fetched = 0
+        self._pages: Dict[int, Dict[str, str]] = {}
+    
+    def remaining(self) -> float:
+        """Seconds left in the crawl's time budget."""
+        return max(0.0, self.deadline - time.monotonic())
+    
+    def add(self, rank: int, page: Optional[_ExtractedPage]) -> None:
+        if page is not None:
+            self.fetched += 1
+            self._pages[rank] = page.fields
+    
+    def fields(self) -> Dict[str, str]:
+        """The first page's fields with gaps filled from the other pages."""
+        merged = dict(self.home.fields)
+        for rank in sorted(self._pages):
+            for key, value in self._pages[rank].items():
+                if value and not merged.get(key):
+                    merged[key] = value
+        return merged
+    
+    def missing(self) -> List[str]:
+        """Wanted fields no page has provided yet."""
+        merged = self.fields()
+        return [name for name in self.wanted if not merged.get(name)]
+    
+    def needs_sitemap(self) -> bool:
+        """True if the first page links nowhere promising and the sitemap should be read."""
+        return not self.home.contact_links and SCRAPER_CRAWL_PAGES >= 2
+    
+    def targets(self, sitemap_links: List[str]) -> List[str]:
+        """Pages to fetch, best first (a sitemap request counts as one of the pages)."""
+        if self.home.contact_links:
+            return self.home.contact_links[:SCRAPER_CRAWL_PAGES]
+        return sitemap_links[:SCRAPER_CRAWL_PAGES - 1]
+    
+    def finish(self) -> Dict[str, str]:
+        if self.fetched:
+            missing = self.missing()
+            logger.info(f"Crawled {self.fetched} more pages of {self.domain}"
+                        + (f"; still missing {', '.join(missing)}" if missing else ""))
+        return self.fields()
+
+
+# Words in a link's path or text that suggest contact details, and their weights
+_CONTACT_LINK_WORDS = {
+    'contact': 10, 'kontakt': 10, 'contacto': 10, 'contato': 10, 'impressum': 9,
+    'get in touch': 8, 'reach us': 8, 'find us': 6, 'about': 6, 'our story': 5,
+    'location': 5, 'visit': 3, 'team': 3, 'info': 2,
+}
+# Paths never worth fetching for contact details
+_SKIP_LINK_PATTERN = re.compile(
+    r'log-?in|sign-?(in|up)|register|cart|checkout|account|admin|wp-|feed|privacy|terms|cookie'
+    r'|\.(pdf|jpe?g|png|gif|svg|webp|zip|mp[34]|xml|gz)$'
+)
+_SITEMAP_LOC_PATTERN = re.compile(rb'<loc>\s*([^<\s]+)\s*</loc>')
+
+
+def _site_key(netloc: str) -> str:
+    netloc = netloc.lower()
+    return netloc[4:] if netloc.startswith('www.') else netloc
+
+
+def _contact_word_score(text: str) -> int:
+    return max((weight for word, weight in _CONTACT_LINK_WORDS.items() if word in text), default=0)
+
+
+def _rank_contact_links(links: Iterable[Tuple[str, str]], base_url: str) -> List[str]:
+    """
+    Same-site pages most likely to hold contact details, best first.
+    
+    ``links`` are (href, link text) pairs in document order. A link scores the
+    weight of the best contact word in its path plus the best one in its text,
+    less a little for every path segment past the first. Links that score
+    nothing, leave the site, or point at logins, legal pages or files are
+    dropped; ties keep document order.
+    """
+    site = _site_key(urlparse(base_url).netloc)
+    seen = {base_url.rstrip('/')}
+    ranked = []
+    for order, (href, text) in enumerate(links):
+        url = urldefrag(urljoin(base_url, href.strip()))[0]
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https') or _site_key(parsed.netloc) != site:
+            continue
+        path = parsed.path.lower()
+        if url.rstrip('/') in seen or _SKIP_LINK_PATTERN.search(path):
+            continue
+        seen.add(url.rstrip('/'))
+        score = _contact_word_score(path) + _contact_word_score(text.lower())
+        if score:
+            depth = len([segment for segment in path.split('/') if segment])
+            ranked.append((-(score - 0.5 * max(0, depth - 1)), order, url))
+    ranked.sort()
+    return [url for _, _, url in ranked]
+
+
+def _sitemap_url(website: str) -> str:
+    # Sitemaps listed in robots.txt, else the conventional location
+    parsed = urlparse(website)
+    listed = compliance_checker.sitemaps.get(parsed.netloc)
+    return listed[0] if listed else f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"
+
+
+def _sitemap_links(body: Optional[bytes], website: str) -> List[str]:
+    if body is None:
+        return []
+    locs = _SITEMAP_LOC_PATTERN.findall(body)
+    return _rank_contact_links(((loc.decode('utf-8', errors='replace'), '') for loc in locs), website)
+
+
+def _wait_for_slot(crawl: _ContactCrawl, stop: threading.Event) -> bool:
+    """Wait for the domain's next request slot; False if it comes too late or the crawl stopped."""
+    delay = compliance_checker.reserve_request_slot(crawl.domain)
+    if delay is None or delay >= crawl.remaining():
+        return False
+    return not stop.wait(delay)
+
+
+def _fetch_sitemap_links(crawl: _ContactCrawl, stop: threading.Event) -> List[str]:
+    url = _sitemap_url(crawl.website)
+    if not _wait_for_slot(crawl, stop):
+        return []
+    try:
+        return _sitemap_links(_fetch_page(url, content_types=SITEMAP_CONTENT_TYPES).body, crawl.website)
+    except requests.RequestException as e:
+        logger.info(f"No sitemap at {url}: {e}")
+        return []
+
+
+def _fetch_contact_page(crawl: _ContactCrawl, url: str, stop: threading.Event) -> Optional[_ExtractedPage]:
+    if not _wait_for_slot(crawl, stop):
+        return None
+    try:
+        page = _fetch_page(url)
+        if page.body is None:
+            return None
+        return parse_stage.extract(page.body, page.content_type, url, crawl.calling_code)
+    except requests.RequestException as e:
+        logger.info(f"Failed to fetch contact page {url}: {e}")
+    except Exception as e:
+        logger.warning(f"Error scraping contact page {url}: {e}")
+    return None
+
+
+_crawl_pool: Optional[ThreadPoolExecutor] = None
+_crawl_pool_lock = threading.Lock()
+
+
+def _crawl_executor() -> ThreadPoolExecutor:
+    # Separate from any pool the caller runs in, so crawls never wait on their own thread
+    global _crawl_pool
+    with _crawl_pool_lock:
+        if _crawl_pool is None:
+            _crawl_pool = ThreadPoolExecutor(max_workers=SCRAPER_MAX_CONCURRENCY, thread_name_prefix="crawler")
+        return _crawl_pool
+
+
+def _crawl_site(website: str, home: _ExtractedPage, wanted: Iterable[str],
+                calling_code: Optional[str] = None, deadline: Optional[float] = None) -> Dict[str, str]:
+    """
+    Fill fields missing from a site's first page from its most promising other pages.
+    
+    Up to ``SCRAPER_CRAWL_PAGES`` links ranked by ``_rank_contact_links`` (or
+    taken from the sitemap when the page links nowhere promising) are fetched
+    ``SCRAPER_CRAWL_CONCURRENCY`` at a time, each in its own rate-limit slot.
+    Links on those pages are not followed. Crawling stops as soon as every
+    wanted field has a value, ``SCRAPER_CRAWL_SECONDS`` have passed or the
+    caller's ``deadline`` (less ``SCRAPER_DEADLINE_MARGIN_SECONDS``) is near;
+    pages not fetched by then are abandoned.
+    
+    Returns:
+        The first page's fields merged with what the other pages provided
+    """
+    crawl = _ContactCrawl(website, home, wanted, calling_code, deadline)
+    if SCRAPER_CRAWL_PAGES <= 0 or not crawl.missing() or not crawl.remaining():
+        return crawl.fields()
+    
+    stop = threading.Event()
+    pending: Dict[Future, int] = {}
+    try:
+        sitemap = _fetch_sitemap_links(crawl, stop) if crawl.needs_sitemap() else []
+        queue = list(enumerate(crawl.targets(sitemap)))
+        executor = _crawl_executor()
+        while queue or pending:
+            while queue and len(pending) < SCRAPER_CRAWL_CONCURRENCY:
+                rank, url = queue.pop(0)
+                pending[executor.submit(_fetch_contact_page, crawl, url, stop)] = rank
+            done, _ = wait(pending, timeout=crawl.remaining(), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                crawl.add(pending.pop(future), future.result())
+            if not crawl.missing():
+                break
+    finally:
+        # Wakes fetches still waiting for their slot; one already downloading finishes unused
+        stop.set()
+        for future in pending:
+            future.cancel()
+    return crawl.finish()
+
+
+class _LoopLimits:
+    """Concurrency limits of one event loop (asyncio primitives are bound to a loop)."""
+    
+    def __init__(self, max_concurrency: int):
+        self.global_slots = asyncio.Semaphore(max_concurrency)
+        self.domain_slots: Dict[str, asyncio.Semaphore] = {}
+        self.domain_users: Dict[str, int] = {}
+
+
+class AsyncScraper:
+    """
+    Scrapes websites concurrently on an event loop.
+    
+    At most ``max_concurrency`` compliance checks, fetches and parses run at
+    once, and at most ``per_domain_concurrency`` scrapes of the same domain are
+    in progress. Crawl delays from the compliance checker are awaited with
+    ``asyncio.sleep`` while holding only the domain slot, so a slow domain
+    never ties up a thread or a global slot. Blocking work (compliance checks
+    and parsing) runs on the scraper's own thread pool, sized to the global
+    limit rather than the loop's small default executor; parsing goes to the
+    worker processes of ``parse_stage`` instead when it has any. Further
+    pages of a site crawled for missing fields are fetched as concurrent
+    tasks, each holding a global slot while it downloads and parses.
+    """
+    
+    def __init__(self, max_concurrency: int = SCRAPER_MAX_CONCURRENCY,
+                 per_domain_concurrency: int = SCRAPER_PER_DOMAIN_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self.per_domain_concurrency = per_domain_concurrency
+        self._limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopLimits]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+    
+    async def _run_blocking(self, fn, *args):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency,
+                                                    thread_name_prefix="scraper")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    def _loop_limits(self) -> _LoopLimits:
+        loop = asyncio.get_running_loop()
+        limits = self._limits.get(loop)
+        if limits is None:
+            limits = _LoopLimits(self.max_concurrency)
+            self._limits[loop] = limits
+        return limits
+    
+    async def scrape(self, website: str, fields: Iterable[str] = CONTACT_FIELDS,
+                     calling_code: Optional[str] = None, deadline: Optional[float] = None) -> ScrapedProfile:
+        """Async counterpart of ``scrape_website_for_contacts``."""
+        if not website:
+            return ScrapedProfile()
+        
+        # The scrape cache is SQLite behind a lock shared with worker threads, so keep it off the loop
+        cached = await asyncio.to_thread(_lookup_cached, website)
+        if cached is not None and cached.fresh:
+            return _profile_from_cache(cached)
+        
+        limits = self._loop_limits()
+        domain = urlparse(website).netloc
+        domain_slot = limits.domain_slots.get(domain)
+        if domain_slot is None:
+            domain_slot = asyncio.Semaphore(self.per_domain_concurrency)
+            limits.domain_slots[domain] = domain_slot
+        limits.domain_users[domain] = limits.domain_users.get(domain, 0) + 1
+        try:
+            async with domain_slot:
+                return await self._scrape(website, domain, limits.global_slots, cached, fields,
+                                          calling_code or calling_code_for_domain(domain), deadline)
+        finally:
+            limits.domain_users[domain] -= 1
+            if not limits.domain_users[domain]:
+                del limits.domain_users[domain]
+                del limits.domain_slots[domain]
+    
+    async def _scrape(self, website: str, domain: str, global_slots: asyncio.Semaphore,
+                      cached: Optional[CachedScrape], wanted: Iterable[str],
+                      calling_code: Optional[str], deadline: Optional[float]) -> ScrapedProfile:
+        try:
+            async with global_slots:
+                # The compliance check makes blocking requests of its own
+                if not await self._run_blocking(_passes_compliance_check, website):
+                    await asyncio.to_thread(scrape_cache.record_failure, website)
+                    return _profile_from_cache(cached)
+            
+            delay = _first_page_delay(domain, deadline)
+            if delay is None:
+                return _profile_from_cache(cached)
+            if delay > 0:
+                logger.info(f"Rate limiting: waiting {delay:.2f} seconds for {domain}")
+                await asyncio.sleep(delay)
+            
+            async with global_slots:
+                page = await _fetch_page_async(website, cached)
+                if page.denied:
+                    await asyncio.to_thread(scrape_cache.record_failure, website)
+                    return _profile_from_cache(cached)
+                if page.not_modified and cached is not None:
+                    await asyncio.to_thread(scrape_cache.revalidated, website)
+                    return _profile_from_cache(cached)
+                home = None
+                if page.body is not None:
+                    home = await self._extract(page.body, page.content_type, website, calling_code)
+            contact = ScrapedProfile()
+            if home is not None:
+                business_info = await self._crawl(website, home, wanted, global_slots, calling_code, deadline)
+                contact = _profile_from_fields(business_info, website)
+            await asyncio.to_thread(scrape_cache.store, website, asdict(contact), page.etag, page.last_modified)
+            return contact
+        
+        except httpx.HTTPError as e:
+            logger.warning(f"Failed to scrape website {website}: {e}")
+            await asyncio.to_thread(scrape_cache.record_failure, website)
+            return _profile_from_cache(cached)
+        except (ValueError, TypeError, AttributeError) as e:
+            logger.warning(f"Data processing error scraping website {website}: {e}")
+            return ScrapedProfile()
+        except Exception as e:
+            logger.error(f"Unexpected error scraping website {website}: {e}")
+            return ScrapedProfile()
+    
+    async def _extract(self, body: bytes, content_type: Optional[str], website: str,
+                       calling_code: Optional[str]) -> _ExtractedPage:
+        # Parsing is CPU-bound; keep it off the event loop
+        if parse_stage.processes:
+            return await parse_stage.extract_async(body, content_type, website, calling_code)
+        return await self._run_blocking(_extract_page, body, content_type, website, calling_code)
+    
+    async def _crawl(self, website: str, home: _ExtractedPage, wanted: Iterable[str],
+                     global_slots: asyncio.Semaphore, calling_code: Optional[str],
+                     deadline: Optional[float]) -> Dict[str, str]:
+        """Async counterpart of ``_crawl_site``; every fetch takes a global slot."""
+        crawl = _ContactCrawl(website, home, wanted, calling_code, deadline)
+        if SCRAPER_CRAWL_PAGES <= 0 or not crawl.missing() or not crawl.remaining():
+            return crawl.fields()
+        
+        sitemap = await self._fetch_sitemap_links(crawl, global_slots) if crawl.needs_sitemap() else []
+        queue = list(enumerate(crawl.targets(sitemap)))
+        pending: Dict[asyncio.Future, int] = {}
+        try:
+            while queue or pending:
+                while queue and len(pending) < SCRAPER_CRAWL_CONCURRENCY:
+                    rank, url = queue.pop(0)
+                    pending[asyncio.ensure_future(self._fetch_contact_page(crawl, url, global_slots))] = rank
+                done, _ = await asyncio.wait(pending, timeout=crawl.remaining(),
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    break
+                for task in done:
+                    crawl.add(pending.pop(task), task.result())
+                if not crawl.missing():
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+        return crawl.finish()
+    
+    async def _wait_for_slot(self, crawl: _ContactCrawl) -> bool:
+        delay = compliance_checker.reserve_request_slot(crawl.domain)
+        if delay is None or delay >= crawl.remaining():
+            return False
+        await asyncio.sleep(delay)
+        return True
+    
+    async def _fetch_sitemap_links(self, crawl: _ContactCrawl, global_slots: asyncio.Semaphore) -> List[str]:
+        url = _sitemap_url(crawl.website)
+        if not await self._wait_for_slot(crawl):
+            return []
+        try:
+            async with global_slots:
+                page = await _fetch_page_async(url, content_types=SITEMAP_CONTENT_TYPES)
+            return _sitemap_links(page.body, crawl.website)
+        except httpx.HTTPError as e:
+            logger.info(f"No sitemap at {url}: {e}")
+            return []
+    
+    async def _fetch_contact_page(self, crawl: _ContactCrawl, url: str,
+                                  global_slots: asyncio.Semaphore) -> Optional[_ExtractedPage]:
+        if not await self._wait_for_slot(crawl):
+            return None
+        try:
+            async with global_slots:
+                page = await _fetch_page_async(url)
+                if page.body is None:
+                    return None
+                return await self._extract(page.body, page.content_type, url, crawl.calling_code)
+        except httpx.HTTPError as e:
+            logger.info(f"Failed to fetch contact page {url}: {e}")
+        except Exception as e:
+            logger.warning(f"Error scraping contact page {url}: {e}")
+        return None
+    
+    async def scrape_many(self, websites: Iterable[str]) -> AsyncIterator[Tuple[str, ScrapedProfile]]:
+        """
+        Scrape a batch of websites concurrently.
+        
+        Duplicate URLs are scraped once. Yields (website, ScrapedProfile) pairs as
+        each scrape finishes; leaving the loop early cancels the rest.
+        """
+        tasks = {asyncio.ensure_future(self._scrape_one(website)) for website in dict.fromkeys(websites) if website}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _scrape_one(self, website: str) -> Tuple[str, ScrapedProfile]:
+        return website, await self.scrape(website)
+
+
+# Global async scraper instance
+async_scraper = AsyncScraper()
+
+
+# Anchors the social/contact extractors look for: the first <a> (in document
+# order) whose href contains any of the substrings
+_LINK_PATTERNS = {
+    'whatsapp': ('wa.me',),
+    'whatsapp_web': ('whatsapp.com',),
+    'instagram': ('instagram.com',),
+    'facebook': ('facebook.com',),
+    'twitter': ('twitter.com', 'x.com'),
+    'linkedin': ('linkedin.com',),
+    'youtube': ('youtube.com',),
+}
+
+# Section selectors in priority order. ('itemprop', v) is [itemprop="v"],
+# ('class', v) is .v and ('class*', v) is [class*="v"]
+_ADDRESS_SELECTORS = (
+    ('itemprop', 'address'), ('class', 'address'), ('class', 'location'),
+    ('class*', 'address'), ('class*', 'location'),
+)
+_HOURS_SELECTORS = (
+    ('itemprop', 'openingHours'), ('class', 'hours'), ('class', 'business-hours'),
+    ('class*', 'hours'), ('class*', 'time'),
+)
+_DESCRIPTION_SELECTORS = (
+    ('itemprop', 'description'), ('class', 'description'), ('class', 'about'),
+    ('class*', 'description'), ('class*', 'about'),
+)
+_SECTION_SELECTORS = _ADDRESS_SELECTORS + _HOURS_SELECTORS + _DESCRIPTION_SELECTORS
+
+# Keywords that might indicate establishment year, in priority order
+_YEAR_KEYWORDS = ('since', 'established', 'founded', 'started', 'opened')
+# No keyword starts inside another one, so a single scan finds the first match of each
+_YEAR_PATTERN = re.compile(rf"({'|'.join(_YEAR_KEYWORDS)})[\s:]*([12][0-9]{{3}})")
+# Phone numbers kept in the 'phone' field
+MAX_PHONE_NUMBERS = 3
+
+
+def _matches_selector(attrs: Dict, selector: Tuple[str, str]) -> bool:
+    kind, value = selector
+    if kind == 'itemprop':
+        return attrs.get('itemprop') == value
+    classes = attrs.get('class')
+    if not classes:
+        return False
+    if isinstance(classes, str):
+        classes = classes.split()
+    if kind == 'class':
+        return value in classes
+    return value in ' '.join(classes)
+
+
+class _PageIndex:
+    """
+    Everything the extractors need from a page, collected in one walk of the tree.
+
+    Holds the first anchor for each link pattern, the first element for each
+    section selector, the first meta description, the JSON-LD blocks, the
+    mailto: and tel: links, every (href, text) pair that could lead to
+    another page, and the page text (computed once).
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.mailtos: List[str] = []
+        self.tels: List[str] = []
+        self.links: Dict[str, str] = {}
+        self.sections: Dict[Tuple[str, str], object] = {}
+        self.meta_description: Optional[str] = None
+        self.json_ld: List[Optional[str]] = []
+        self.anchors: List[Tuple[str, str]] = []
+
+        pending_links = dict(_LINK_PATTERNS)
+        pending_sections = list(_SECTION_SELECTORS)
+        seen_meta_description = False
+        for tag in soup.find_all(True):
+            name = tag.name
+            attrs = tag.attrs
+            if name == 'a':
+                href = attrs.get('href')
+                if isinstance(href, str):
+                    if href.startswith('mailto'):
+                        self.mailtos.append(href)
+                    elif href.startswith('tel:'):
+                        self.tels.append(href)
+                    elif not href.startswith(('#', 'javascript:')):
+                        self.anchors.append((href, tag.get_text(' ', strip=True)))
+                    for key, needles in list(pending_links.items()):
+                        if any(needle in href for needle in needles):
+                            self.links[key] = href
+                            del pending_links[key]
+            elif name == 'meta':
+                if not seen_meta_description and attrs.get('name') == 'description':
+                    seen_meta_description = True
+                    self.meta_description = attrs.get('content')
+            elif name == 'script':
+                if attrs.get('type') == 'application/ld+json':
+                    self.json_ld.append(tag.string)
+            if pending_sections and ('class' in attrs or 'itemprop' in attrs):
+                for selector in [s for s in pending_sections if _matches_selector(attrs, s)]:
+                    self.sections[selector] = tag
+                    pending_sections.remove(selector)
+
+        self.text = soup.get_text()
+        self._lower_text: Optional[str] = None
+
+    @property
+    def lower_text(self) -> str:
+        if self._lower_text is None:
+            self._lower_text = self.text.lower()
+        return self._lower_text
+
+
+def _page_index(page) -> _PageIndex:
+    """Accept either a parsed page or an index already built for it."""
+    return page if isinstance(page, _PageIndex) else _PageIndex(page)
+
+
+def _extract_comprehensive_business_info(soup: BeautifulSoup, base_url: str,
+                                        calling_code: Optional[str] = None) -> Dict[str, str]:
     """
     Extract comprehensive business information from website.
     
+    The page is walked once (see ``_PageIndex``) and every extractor reads
+    from that index.
+    
     Args:
-        soup: BeautifulSoup object of the webpage
+        soup: BeautifulSoup object of the webpage, or its ``_PageIndex``
         base_url: Base URL for resolving relative links
+        calling_code: Country calling code for phone numbers written without one
         
     Returns:
         Dictionary with extracted business information
     """
+    page = _page_index(soup)
     info = {}
     
+    # Structured data (JSON-LD) first: its email and telephone rank above the page's
+    structured_data = _extract_structured_data(page)
+    contacts = _contact_tokens(page, base_url, calling_code, structured_data)
+    
     # Extract contact information
-    info['email'] = _extract_email(soup)
-    info['whatsapp'] = _extract_whatsapp(soup)
-    info['instagram'] = _extract_instagram(soup)
-    info['established_year'] = _extract_established_year(soup)
+    info['email'] = contacts.emails[0] if contacts.emails else ""
+    info['whatsapp'] = _extract_whatsapp(page)
+    info['instagram'] = _extract_instagram(page)
+    info['established_year'] = _extract_established_year(page)
     
     # Extract additional social media links
-    info['facebook'] = _extract_facebook(soup)
-    info['twitter'] = _extract_twitter(soup)
-    info['linkedin'] = _extract_linkedin(soup)
-    info['youtube'] = _extract_youtube(soup)
+    info['facebook'] = _extract_facebook(page)
+    info['twitter'] = _extract_twitter(page)
+    info['linkedin'] = _extract_linkedin(page)
+    info['youtube'] = _extract_youtube(page)
     
     # Extract business details
-    info['phone'] = _extract_phone_numbers(soup)
-    info['address'] = _extract_address(soup)
-    info['hours'] = _extract_business_hours(soup)
-    info['description'] = _extract_business_description(soup)
+    info['phone'] = ', '.join(contacts.phones[:MAX_PHONE_NUMBERS])
+    info['address'] = _extract_address(page)
+    info['hours'] = _extract_business_hours(page)
+    info['description'] = _extract_business_description(page)
     
-    # Extract structured data (JSON-LD)
-    structured_data = _extract_structured_data(soup)
-    if structured_data:
-        info.update(structured_data)
+    # Structured data overrides the rest (its email and phone are already ranked in)
+    info.update({key: value for key, value in structured_data.items() if key not in ('email', 'phone')})
     
     return info
 
 
-def _extract_email(soup: BeautifulSoup) -> str:
+def _contact_values(value) -> List[str]:
+    # JSON-LD email and telephone may be a string or a list of them
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value if item]
+    return [str(value)] if value else []
+
+
+def _contact_tokens(page: _PageIndex, base_url: str, calling_code: Optional[str],
+                    structured_data: Optional[Dict] = None) -> ContactTokens:
+    """Emails and phone numbers of a page, ranked (see ``extract_contacts``)."""
+    structured_data = structured_data or {}
+    return extract_contacts(
+        page.text,
+        preferred_emails=_contact_values(structured_data.get('email')) + page.mailtos,
+        preferred_phones=_contact_values(structured_data.get('phone')) + page.tels,
+        site_domain=urlparse(base_url).netloc,
+        calling_code=calling_code,
+    )
+
+
+def _extract_email(page, base_url: str = '') -> str:
     """Extract email address from website."""
-    # Look for mailto links
-    mailto_link = soup.select_one('a[href^=mailto]')
-    if mailto_link:
-        email = mailto_link['href'].replace('mailto:', '').strip()
-        if _is_valid_email(email):
-            return email
-    
-    # Look for email patterns in text
-    text = soup.get_text()
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    
-    for email in emails:
-        if _is_valid_email(email):
-            return email
-    
-    return ""
+    emails = _contact_tokens(_page_index(page), base_url, None).emails
+    return emails[0] if emails else ""
+
 
+def _handle_from_link(href: Optional[str], domain: str) -> str:
+    if href is None:
+        return ""
+    return href.split(f'{domain}/')[-1].split('?')[0].replace('/', '')
 
-def _extract_whatsapp(soup: BeautifulSoup) -> str:
+
+def _extract_whatsapp(page) -> str:
     """Extract WhatsApp number from website."""
+    page = _page_index(page)
     # Look for WhatsApp links
-    wa_link = soup.select_one('a[href*="wa.me"]')
-    if wa_link:
-        whatsapp = wa_link['href'].split('wa.me/')[-1].split('?')[0].replace('/', '')
-        if whatsapp:
-            return whatsapp
+    whatsapp = _handle_from_link(page.links.get('whatsapp'), 'wa.me')
+    if whatsapp:
+        return whatsapp
     
     # Look for WhatsApp links with different patterns
-    wa_link = soup.select_one('a[href*="whatsapp.com"]')
-    if wa_link:
-        whatsapp = wa_link['href'].split('whatsapp.com/')[-1].split('?')[0].replace('/', '')
-        if whatsapp:
-            return whatsapp
-    
-    return ""
+    return _handle_from_link(page.links.get('whatsapp_web'), 'whatsapp.com')
 
 
-def _extract_instagram(soup: BeautifulSoup) -> str:
+def _extract_instagram(page) -> str:
     """Extract Instagram handle from website."""
-    # Look for Instagram links
-    insta_link = soup.select_one('a[href*="instagram.com"]')
-    if insta_link:
-        instagram = insta_link['href'].split('instagram.com/')[-1].split('?')[0].replace('/', '')
-        if instagram and not instagram.startswith('http'):
-            return instagram
-    
+    page = _page_index(page)
+    instagram = _handle_from_link(page.links.get('instagram'), 'instagram.com')
+    if instagram and not instagram.startswith('http'):
+        return instagram
     return ""
 
 
-def _extract_established_year(soup: BeautifulSoup) -> str:
+def _extract_established_year(page) -> str:
     """Extract established year from website."""
-    text = soup.get_text().lower()
-    
-    # Keywords that might indicate establishment year
-    keywords = ['since', 'established', 'founded', 'started', 'opened']
+    page = _page_index(page)
+    # First "since 2020", "established in 2015", ... per keyword
+    first_years: Dict[str, str] = {}
+    for match in _YEAR_PATTERN.finditer(page.lower_text):
+        first_years.setdefault(match.group(1), match.group(2))
+        if len(first_years) == len(_YEAR_KEYWORDS):
+            break
     
-    for keyword in keywords:
-        # Look for patterns like "since 2020", "established in 2015", etc.
-        pattern = rf"{keyword}[\s:]*([12][0-9]{{3}})"
-        match = re.search(pattern, text)
-        if match:
-            year = match.group(1)
-            # Validate year (reasonable range)
-            if 1900 <= int(year) <= 2025:
-                return year
+    for keyword in _YEAR_KEYWORDS:
+        year = first_years.get(keyword)
+        # Validate year (reasonable range)
+        if year and 1900 <= int(year) <= 2025:
+            return year
     
     return ""
 
 
-def _extract_facebook(soup: BeautifulSoup) -> str:
+def _extract_facebook(page) -> str:
     """Extract Facebook page from website."""
-    fb_link = soup.select_one('a[href*="facebook.com"]')
-    if fb_link:
-        return fb_link['href']
-    return ""
+    return _page_index(page).links.get('facebook', "")
 
 
-def _extract_twitter(soup: BeautifulSoup) -> str:
+def _extract_twitter(page) -> str:
     """Extract Twitter handle from website."""
-    twitter_link = soup.select_one('a[href*="twitter.com"], a[href*="x.com"]')
-    if twitter_link:
-        return twitter_link['href']
-    return ""
+    return _page_index(page).links.get('twitter', "")
 
 
-def _extract_linkedin(soup: BeautifulSoup) -> str:
+def _extract_linkedin(page) -> str:
     """Extract LinkedIn page from website."""
-    linkedin_link = soup.select_one('a[href*="linkedin.com"]')
-    if linkedin_link:
-        return linkedin_link['href']
-    return ""
+    return _page_index(page).links.get('linkedin', "")
 
 
-def _extract_youtube(soup: BeautifulSoup) -> str:
+def _extract_youtube(page) -> str:
     """Extract YouTube channel from website."""
-    youtube_link = soup.select_one('a[href*="youtube.com"]')
-    if youtube_link:
-        return youtube_link['href']
-    return ""
+    return _page_index(page).links.get('youtube', "")
 
 
-def _extract_phone_numbers(soup: BeautifulSoup) -> str:
+def _extract_phone_numbers(page, calling_code: Optional[str] = None) -> str:
     """Extract phone numbers from website."""
-    text = soup.get_text()
-    # Phone number patterns
-    phone_patterns = [
-        r'\+?[\d\s\-\(\)]{10,}',  # General phone pattern
-        r'\(\d{3}\)\s?\d{3}-\d{4}',  # US format
-        r'\d{3}-\d{3}-\d{4}',  # US format
-        r'\+1\s?\d{3}\s?\d{3}\s?\d{4}',  # International US
-    ]
-    
-    phones = []
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        for match in matches:
-            # Clean and validate phone number
-            clean_phone = re.sub(r'[^\d+]', '', match)
-            if len(clean_phone) >= 10:
-                phones.append(match.strip())
-    
-    return ', '.join(phones[:3])  # Return up to 3 phone numbers
-
-
-def _extract_address(soup: BeautifulSoup) -> str:
+    phones = _contact_tokens(_page_index(page), '', calling_code).phones
+    return ', '.join(phones[:MAX_PHONE_NUMBERS])  # Return up to 3 phone numbers
+
+
+def _section_text(page: _PageIndex, selectors: Tuple[Tuple[str, str], ...]) -> Optional[str]:
+    """Text of the element found by the first selector that matched anything."""
+    for selector in selectors:
+        elem = page.sections.get(selector)
+        if elem is not None:
+            return elem.get_text().strip()
+    return None
+
+
+def _extract_address(page) -> str:
     """Extract business address from website."""
-    # Look for address in structured data
-    address_selectors = [
-        '[itemprop="address"]',
-        '.address',
-        '.location',
-        '[class*="address"]',
-        '[class*="location"]'
-    ]
-    
-    for selector in address_selectors:
-        address_elem = soup.select_one(selector)
-        if address_elem:
-            return address_elem.get_text().strip()
-    
-    return ""
+    return _section_text(_page_index(page), _ADDRESS_SELECTORS) or ""
 
 
-def _extract_business_hours(soup: BeautifulSoup) -> str:
+def _extract_business_hours(page) -> str:
     """Extract business hours from website."""
-    hours_selectors = [
-        '[itemprop="openingHours"]',
-        '.hours',
-        '.business-hours',
-        '[class*="hours"]',
-        '[class*="time"]'
-    ]
-    
-    for selector in hours_selectors:
-        hours_elem = soup.select_one(selector)
-        if hours_elem:
-            return hours_elem.get_text().strip()
-    
-    return ""
+    return _section_text(_page_index(page), _HOURS_SELECTORS) or ""
 
 
-def _extract_business_description(soup: BeautifulSoup) -> str:
+def _extract_business_description(page) -> str:
     """Extract business description from website."""
+    page = _page_index(page)
     # Look for meta description first
-    meta_desc = soup.select_one('meta[name="description"]')
-    if meta_desc and meta_desc.get('content'):
-        return meta_desc['content'].strip()
+    if page.meta_description:
+        return page.meta_description.strip()
     
     # Look for structured data description
-    desc_selectors = [
-        '[itemprop="description"]',
-        '.description',
-        '.about',
-        '[class*="description"]',
-        '[class*="about"]'
-    ]
-    
-    for selector in desc_selectors:
-        desc_elem = soup.select_one(selector)
-        if desc_elem:
+    for selector in _DESCRIPTION_SELECTORS:
+        desc_elem = page.sections.get(selector)
+        if desc_elem is not None:
             text = desc_elem.get_text().strip()
             if len(text) > 50:  # Only return substantial descriptions
                 return text[:500]  # Limit to 500 characters
@@ -320,16 +1258,13 @@ def _extract_business_description(soup: BeautifulSoup) -> str:
     return ""
 
 
-def _extract_structured_data(soup: BeautifulSoup) -> Dict[str, str]:
+def _extract_structured_data(page) -> Dict[str, str]:
     """Extract structured data (JSON-LD) from website."""
     structured_data = {}
     
-    # Look for JSON-LD structured data
-    json_scripts = soup.find_all('script', type='application/ld+json')
-    
-    for script in json_scripts:
+    for script in _page_index(page).json_ld:
         try:
-            data = json.loads(script.string)
+            data = json.loads(script)
             if isinstance(data, dict):
                 # Extract business information from structured data
                 if data.get('@type') in ['LocalBusiness', 'Organization', 'Business']:
@@ -348,7 +1283,8 @@ def _extract_structured_data(soup: BeautifulSoup) -> Dict[str, str]:
                         elif isinstance(addr, str):
                             structured_data['address'] = addr
                     if 'openingHours' in data:
-                        structured_data['hours'] = ', '.join(data['openingHours'])
+                        hours = data['openingHours']
+                        structured_data['hours'] = hours if isinstance(hours, str) else ', '.join(hours)
                     if 'foundingDate' in data:
                         structured_data['founded'] = data['foundingDate']
                     if 'sameAs' in data:
@@ -357,9 +1293,3 @@ def _extract_structured_data(soup: BeautifulSoup) -> Dict[str, str]:
             continue
     
     return structured_data
-
-
-def _is_valid_email(email: str) -> bool:
-    """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
@@ -0,0 +1,81 @@
+"""
+Shared test setup: every test runs against the local upstream simulator.
+
+Services read their configuration at import time, so the simulator is started
+and the environment pointed at it before any service module is imported.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.app.devtools.upstream_simulator import (  # noqa: E402
+    SimulatorConfig, UpstreamSimulator, service_environment, start_in_thread
+)
+
+WORKDIR = Path(tempfile.mkdtemp(prefix="facility-finder-tests-"))
+
+
+def _simulator_config() -> SimulatorConfig:
+    config = SimulatorConfig(page_token_delay_seconds=0.2)
+    for profile in config.providers.values():
+        profile.latency_ms = 50
+        profile.latency_sigma = 0.0
+        profile.error_rate = 0.0
+    return config
+
+
+_server, SIMULATOR_URL = start_in_thread(_simulator_config())
+os.environ.update(service_environment(SIMULATOR_URL))
+os.environ['PLACES_CACHE_PATH'] = str(WORKDIR / "places_cache.db")
+os.environ['SCRAPE_CACHE_PATH'] = str(WORKDIR / "scrape_cache.db")
+os.environ['RATE_LIMIT_DB_PATH'] = ''
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    _server.should_exit = True
+
+
+@pytest.fixture
+def simulator() -> UpstreamSimulator:
+    """The running simulator with fresh counters."""
+    sim: UpstreamSimulator = _server.config.app.state.simulator
+    sim.reset()
+    return sim
+
+
+@pytest.fixture
+def simulator_url() -> str:
+    return SIMULATOR_URL
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch: pytest.MonkeyPatch):
+    """Start every test with cold search, details and scrape caches and empty rate limit buckets."""
+    from src.app.services import places_service
+    from src.app.services.details_cache import details_cache
+    from src.app.services.search_cache import search_cache
+    from src.app.utils.scrape_cache import scrape_cache
+    from src.app.utils.legal_compliance import compliance_checker
+    from src.app.utils.rate_limiter import RateLimiter
+
+    for cache in (details_cache, search_cache, scrape_cache):
+        cache.clear()
+    monkeypatch.setattr(places_service, 'rate_limiter', RateLimiter(db_path=''))
+    # Every synthetic site shares the simulator's host: start with its request slots free and
+    # no politeness delay (tests of the production spacing set their own)
+    monkeypatch.setattr(compliance_checker, 'last_request_time', {})
+    monkeypatch.setattr(compliance_checker, 'rate_limits', {})
+    monkeypatch.setattr(compliance_checker, 'min_delay_between_requests', 0)
+    monkeypatch.setattr(compliance_checker, 'max_requests_per_minute', 10 ** 9)
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return 'asyncio'
@@ -0,0 +1,75 @@
+"""Batch searches share Google calls between duplicate queries and stop at the batch's call budget."""
+
+import json
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from src.app.main_api import app
+
+QUERY = {'place_type': "gym", 'city': "Batch City", 'country': "India", 'max_results': 20}
+# Folds to the same Google query and result page as QUERY
+SAME_QUERY = {'place_type': "GYM", 'city': " batch  city", 'country': "India", 'max_results': 15}
+OTHER_QUERY = {'place_type': "yoga", 'city': "Other City", 'country': "India", 'max_results': 20}
+
+
+async def _batch(queries: List[Dict[str, Any]], max_upstream_calls: int) -> List[Dict[str, Any]]:
+    transport = httpx.ASGITransport(app=app, client=('203.0.113.7', 4000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+        response = await client.post("/facilities/search/batch", json={
+            'api_key': "test-key", 'queries': queries, 'deadline_seconds': 10,
+            'max_upstream_calls': max_upstream_calls,
+        })
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith("application/x-ndjson")
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def _results(events: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    assert [event['event'] for event in events] == ['result'] * (len(events) - 1) + ['summary']
+    return {event['index']: event for event in events[:-1]}
+
+
+def _places_calls(simulator) -> int:
+    return simulator.stats()['providers']['google_places']['calls']
+
+
+@pytest.mark.anyio
+async def test_duplicate_queries_share_calls_and_records(simulator):
+    events = await _batch([QUERY, SAME_QUERY], max_upstream_calls=500)
+
+    results, summary = _results(events), events[-1]
+    assert sorted(results) == [0, 1]
+    assert results[0]['success'] and results[1]['success']
+    # One text search and one details call per place, for both queries together
+    assert summary['unique_places'] == 20
+    assert summary['upstream_calls'] == _places_calls(simulator) == 1 + 20
+    by_id = {f['place_id']: f for f in results[0]['facilities']}
+    assert all(f == by_id[f['place_id']] for f in results[1]['facilities'])
+
+
+@pytest.mark.anyio
+async def test_budget_of_one_call_answers_only_queries_sharing_it(simulator):
+    events = await _batch([QUERY, SAME_QUERY, OTHER_QUERY], max_upstream_calls=1)
+
+    results, summary = _results(events), events[-1]
+    assert sorted(results) == [0, 1, 2]
+    # The duplicate rides on the one call; the other query finds the budget spent
+    assert results[0]['success'] == results[1]['success'] != results[2]['success']
+    refused = [result for result in results.values() if not result['success']]
+    assert all("batch quota" in result['error_message'] for result in refused)
+    assert summary['upstream_calls'] == _places_calls(simulator) == 1
+    assert summary['enriched'] == 0
+
+
+@pytest.mark.anyio
+async def test_exhausted_budget_returns_unenriched_rows(simulator):
+    events = await _batch([QUERY, OTHER_QUERY], max_upstream_calls=5)
+
+    results, summary = _results(events), events[-1]
+    assert all(result['success'] and result['total_found'] == 20 for result in results.values())
+    # Two text searches leave three details calls; the other places come back as found
+    assert summary['upstream_calls'] == _places_calls(simulator) == 5
+    assert summary['unique_places'] == 40
+    assert summary['enriched'] <= 3
@@ -0,0 +1,119 @@
+"""Place Details are cached per field, survive the in-memory LRU in SQLite and can be invalidated."""
+
+from types import SimpleNamespace
+from typing import List
+
+import pytest
+
+from src.app.devtools.upstream_simulator import places_near
+from src.app.services import details_cache as details_cache_module
+from src.app.services.details_cache import DAY_SECONDS, PlaceDetailsCache, details_cache
+from src.app.services.places_service import DETAILS_FIELD_LIST, PlacesService
+
+FIELDS = ['place_id', 'name', 'rating', 'website']
+RESULT = {'place_id': 'p1', 'name': "Iron Gym", 'rating': 4.5}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the cache's notion of now (seconds since the epoch)."""
+    now = SimpleNamespace(value=1_700_000_000.0)
+    monkeypatch.setattr(details_cache_module, 'time', SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+@pytest.fixture
+def requested_fields(monkeypatch) -> List[List[str]]:
+    """Fields asked of Google by each Place Details request."""
+    requests: List[List[str]] = []
+    build = PlacesService._details_request
+
+    def spy(self, place_id, fields=None):
+        requests.append(list(fields or DETAILS_FIELD_LIST))
+        return build(self, place_id, fields)
+
+    monkeypatch.setattr(PlacesService, '_details_request', spy)
+    return requests
+
+
+@pytest.fixture
+def place_id(simulator) -> str:
+    return places_near(simulator.config, 'gym', 10.0, 10.0, 5000)[0].place_id
+
+
+def test_fields_expire_on_their_own_ttl(tmp_path, clock):
+    cache = PlaceDetailsCache(str(tmp_path / "details.db"))
+    cache.store('p1', RESULT, FIELDS)
+
+    clock.value += DAY_SECONDS - 1
+    assert cache.lookup('p1', FIELDS) == (RESULT, [])
+
+    # Rating lives a day; the name and website a week; place_id never expires
+    clock.value += 2
+    assert cache.lookup('p1', FIELDS) == ({'place_id': 'p1', 'name': "Iron Gym"}, ['rating'])
+
+    clock.value += 7 * DAY_SECONDS
+    assert cache.lookup('p1', FIELDS) == ({'place_id': 'p1'}, ['name', 'rating', 'website'])
+
+
+def test_absent_field_is_cached_as_known_missing(tmp_path):
+    cache = PlaceDetailsCache(str(tmp_path / "details.db"))
+    cache.store('p1', RESULT, FIELDS)
+
+    fresh, stale = cache.lookup('p1', FIELDS)
+
+    # No website is a cached answer, not a reason to ask Google again
+    assert 'website' not in fresh and stale == []
+
+
+def test_entries_evicted_from_memory_are_promoted_back_from_sqlite(tmp_path):
+    cache = PlaceDetailsCache(str(tmp_path / "details.db"), memory_entries=2)
+    for place in ('a', 'b', 'c'):
+        cache.store(place, {**RESULT, 'place_id': place}, FIELDS)
+    assert list(cache._memory) == ['b', 'c']
+
+    fresh, stale = cache.lookup('a', FIELDS)
+
+    assert fresh['place_id'] == 'a' and stale == []
+    assert list(cache._memory) == ['c', 'a']
+    assert cache.stats()['disk_entries'] == 3
+    # A new process (a fresh cache on the same file) sees the same entries
+    assert PlaceDetailsCache(str(tmp_path / "details.db")).lookup('b', FIELDS)[1] == []
+
+
+def test_clear_invalidates_memory_and_sqlite(tmp_path):
+    path = str(tmp_path / "details.db")
+    cache = PlaceDetailsCache(path)
+    cache.store('p1', RESULT, FIELDS)
+
+    cache.clear()
+
+    assert cache.lookup('p1', FIELDS) == ({}, FIELDS)
+    assert cache.stats()['disk_entries'] == 0
+    assert PlaceDetailsCache(path).lookup('p1', FIELDS) == ({}, FIELDS)
+
+
+def test_details_lookup_requests_only_expired_fields(simulator, place_id, clock, requested_fields):
+    service = PlacesService("test-key")
+
+    first = service._get_place_details(place_id)
+    assert service._get_place_details(place_id) == first
+    assert requested_fields == [DETAILS_FIELD_LIST]
+
+    clock.value += DAY_SECONDS + 1
+    refreshed = service._get_place_details(place_id)
+
+    assert requested_fields[1] == ['rating', 'user_ratings_total', 'business_status']
+    assert refreshed['name'] == first['name']
+    assert simulator.stats()['providers']['google_places']['calls'] == 2
+
+
+def test_invalidated_place_is_fetched_again(simulator, place_id, requested_fields):
+    service = PlacesService("test-key")
+    service._get_place_details(place_id)
+
+    details_cache.clear()
+    service._get_place_details(place_id)
+
+    assert requested_fields == [DETAILS_FIELD_LIST, DETAILS_FIELD_LIST]
+    assert simulator.stats()['providers']['google_places']['calls'] == 2
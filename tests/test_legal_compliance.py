@@ -0,0 +1,28 @@
+"""Compliance lookups must not be spaced like page fetches or take their request slots."""
+
+import time
+from urllib.parse import urlparse
+
+from src.app.devtools.upstream_simulator import places_near
+from src.app.utils.legal_compliance import LegalComplianceChecker
+
+
+def _site(simulator, base_url: str) -> str:
+    place = next(p for p in places_near(simulator.config, "gym", 10.0, 10.0, 20000) if p.has_website)
+    return f"{base_url}/sites/{place.place_id}/"
+
+
+def test_terms_lookup_ignores_page_spacing(simulator, simulator_url):
+    checker = LegalComplianceChecker()
+    checker.min_delay_between_requests = 6
+    site = _site(simulator, simulator_url)
+
+    started = time.monotonic()
+    check = checker.check_website_compliance(site, check_access=False)
+    elapsed = time.monotonic() - started
+
+    # robots.txt plus every terms of service location (the simulator has none) back to back
+    assert check.is_compliant
+    assert elapsed < 2
+    # The first page fetch can go out at once
+    assert checker.reserve_request_slot(urlparse(site).netloc) == 0
@@ -0,0 +1,50 @@
+"""The accelerated HTML parser backends extract the same contact data as html.parser."""
+
+from pathlib import Path
+from typing import Dict, Set, Tuple
+
+import pytest
+from bs4.builder import builder_registry
+
+from src.app.utils import web_scraper
+
+PAGES_DIR = Path(__file__).resolve().parent.parent / "benchmarks" / "fixtures" / "pages"
+PAGES = sorted(path.name for path in PAGES_DIR.glob('*.html'))
+REFERENCE_PARSER = web_scraper.FALLBACK_HTML_PARSER
+EXTRACTORS = (
+    '_extract_email', '_extract_whatsapp', '_extract_instagram', '_extract_established_year',
+    '_extract_facebook', '_extract_twitter', '_extract_linkedin', '_extract_youtube',
+    '_extract_phone_numbers', '_extract_address', '_extract_business_hours',
+    '_extract_business_description', '_extract_structured_data',
+)
+# (page, parser, extractor) -> why the backends legitimately disagree
+KNOWN_DIFFERENCES: Dict[Tuple[str, str, str], str] = {
+    ('malformed_markup.html', 'lxml', '_extract_business_hours'):
+        "unclosed <td class=hours>: html.parser nests the following cell inside it, lxml closes it",
+}
+
+
+def _extract_all(html: str, parser: str) -> Dict[str, object]:
+    page = web_scraper._PageIndex(web_scraper.parse_html(html, parser))
+    return {name: getattr(web_scraper, name)(page) for name in EXTRACTORS}
+
+
+def test_known_differences_refer_to_fixture_pages():
+    assert {page for page, _, _ in KNOWN_DIFFERENCES} <= set(PAGES)
+    assert {parser for _, parser, _ in KNOWN_DIFFERENCES} <= set(web_scraper.FAST_HTML_PARSERS)
+
+
+@pytest.mark.parametrize('parser', web_scraper.FAST_HTML_PARSERS)
+@pytest.mark.parametrize('page', PAGES)
+def test_backend_matches_reference_parser(page: str, parser: str):
+    if builder_registry.lookup(parser) is None:
+        pytest.skip(f"{parser} is not installed")
+    html = (PAGES_DIR / page).read_text(encoding='utf-8')
+
+    expected = _extract_all(html, REFERENCE_PARSER)
+    actual = _extract_all(html, parser)
+
+    differing: Set[str] = {name for name in EXTRACTORS if actual[name] != expected[name]}
+    # A listed difference that no longer occurs fails too, so the list stays accurate
+    known = {extractor for (p, backend, extractor) in KNOWN_DIFFERENCES if (p, backend) == (page, parser)}
+    assert differing == known, {name: (expected[name], actual[name]) for name in differing ^ known}
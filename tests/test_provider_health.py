@@ -0,0 +1,131 @@
+"""Upstream calls get adaptive timeouts, and failing providers are cut off and probed back in."""
+
+import time
+
+import httpx
+import pytest
+import requests
+
+from src.app.utils import http_client, provider_health as provider_health_module
+from src.app.utils.http_client import http_clients
+from src.app.utils.provider_health import (
+    CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, PROVIDER_FAILURE_THRESHOLD, CircuitOpenError,
+    ProviderHealthRegistry
+)
+
+PROVIDER = 'yelp'
+COOLDOWN_SECONDS = 0.3
+CEILING_SECONDS = 5.0
+
+
+@pytest.fixture
+def health(monkeypatch):
+    """A fresh breaker for the provider, with a short cool-down and few samples needed."""
+    registry = ProviderHealthRegistry()
+    monkeypatch.setattr(http_client, 'provider_health', registry)
+    monkeypatch.setattr(provider_health_module, 'PROVIDER_COOLDOWN_SECONDS', COOLDOWN_SECONDS)
+    monkeypatch.setattr(provider_health_module, 'PROVIDER_MIN_SAMPLES', 5)
+    monkeypatch.setattr(provider_health_module, 'PROVIDER_MIN_TIMEOUT_SECONDS', 0.05)
+    return registry.get(PROVIDER)
+
+
+@pytest.fixture
+def yelp(simulator, monkeypatch):
+    """The simulated Yelp profile (changes are undone after the test)."""
+    profile = simulator.config.providers[PROVIDER]
+    for name in ('latency_ms', 'error_rate'):
+        monkeypatch.setattr(profile, name, getattr(profile, name))
+    return profile
+
+
+def _search(simulator_url: str) -> requests.Response:
+    return http_clients.get(
+        f"{simulator_url}/v3/businesses/search", params={'term': "Iron Gym", 'location': "Pune"},
+        headers={'Authorization': "Bearer test"}, timeout=CEILING_SECONDS, provider=PROVIDER
+    )
+
+
+def _yelp_calls(simulator) -> int:
+    return simulator.stats()['providers'][PROVIDER]['calls']
+
+
+def test_timeout_follows_observed_latency(health, yelp, simulator_url):
+    assert health.timeout(CEILING_SECONDS) == CEILING_SECONDS
+
+    for _ in range(provider_health_module.PROVIDER_MIN_SAMPLES):
+        _search(simulator_url)
+
+    # About twice the 50 ms p95, far below the configured ceiling
+    assert 0.1 <= health.timeout(CEILING_SECONDS) < 0.5
+    assert health.snapshot().adaptive_timeout_seconds == round(health.timeout(float('inf')), 3)
+
+
+def test_slowed_provider_is_cut_off_at_the_adaptive_timeout(health, yelp, simulator_url):
+    for _ in range(provider_health_module.PROVIDER_MIN_SAMPLES):
+        _search(simulator_url)
+    yelp.latency_ms = 2000
+
+    started = time.monotonic()
+    with pytest.raises(requests.Timeout):
+        _search(simulator_url)
+
+    assert time.monotonic() - started < 1.0
+    assert health.snapshot().failures == 1
+
+
+def test_breaker_opens_probes_and_closes(health, yelp, simulator, simulator_url):
+    yelp.error_rate = 1.0
+    for _ in range(PROVIDER_FAILURE_THRESHOLD):
+        assert _search(simulator_url).status_code == 500
+    assert health.snapshot().state == CIRCUIT_OPEN
+
+    # While open, calls fail fast without reaching the provider
+    with pytest.raises(CircuitOpenError):
+        _search(simulator_url)
+    assert _yelp_calls(simulator) == PROVIDER_FAILURE_THRESHOLD
+
+    # After the cool-down one probe goes through; a failed probe re-opens the breaker
+    time.sleep(COOLDOWN_SECONDS)
+    assert _search(simulator_url).status_code == 500
+    assert health.snapshot().state == CIRCUIT_OPEN
+    with pytest.raises(CircuitOpenError):
+        _search(simulator_url)
+
+    # A successful probe closes it
+    yelp.error_rate = 0.0
+    time.sleep(COOLDOWN_SECONDS)
+    assert _search(simulator_url).ok
+    assert health.snapshot().state == CIRCUIT_CLOSED
+    assert _search(simulator_url).ok
+    assert _yelp_calls(simulator) == PROVIDER_FAILURE_THRESHOLD + 3
+
+
+def test_half_open_breaker_admits_a_single_probe(health, yelp, simulator_url):
+    yelp.error_rate = 1.0
+    for _ in range(PROVIDER_FAILURE_THRESHOLD):
+        _search(simulator_url)
+    time.sleep(COOLDOWN_SECONDS)
+
+    health.before_call()  # the probe, still in flight
+
+    assert health.snapshot().state == CIRCUIT_HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        _search(simulator_url)
+
+
+@pytest.mark.anyio
+async def test_async_calls_share_the_breaker(health, yelp, simulator, simulator_url):
+    yelp.error_rate = 1.0
+    async with httpx.AsyncClient(transport=http_client._CountingAsyncTransport(http_clients)) as client:
+        for _ in range(PROVIDER_FAILURE_THRESHOLD):
+            response = await client.get(
+                f"{simulator_url}/v3/businesses/search", params={'term': "Iron Gym", 'location': "Pune"},
+                headers={'Authorization': "Bearer test"}, extensions={'provider': PROVIDER}
+            )
+            assert response.status_code == 500
+
+        assert health.snapshot().state == CIRCUIT_OPEN
+        # The sync path sees the breaker the async calls opened
+        with pytest.raises(CircuitOpenError):
+            _search(simulator_url)
+    assert _yelp_calls(simulator) == PROVIDER_FAILURE_THRESHOLD
@@ -0,0 +1,60 @@
+"""Rate limit checks from coroutines never block the event loop on the shared SQLite store."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.app.utils.rate_limiter import BucketPolicy, RateLimiter
+
+STORE_BUSY_SECONDS = 0.5
+MAX_STALL_SECONDS = 0.2
+IDENTITY = {'api_key': 'test-key', 'user': '1', 'ip': '203.0.113.7'}
+
+
+@pytest.mark.anyio
+async def test_shared_store_wait_does_not_stall_the_event_loop(tmp_path):
+    limiter = RateLimiter(db_path=str(tmp_path / "rate_limits.db"))
+    busy = threading.Event()
+
+    def hold_store() -> None:
+        # Stands in for another request (or worker) holding the store's write lock
+        with limiter._shared._lock:
+            busy.set()
+            time.sleep(STORE_BUSY_SECONDS)
+
+    threading.Thread(target=hold_store, daemon=True).start()
+    busy.wait()
+
+    stalls = []
+
+    async def tick() -> None:
+        last = time.monotonic()
+        while True:
+            await asyncio.sleep(0.01)
+            now = time.monotonic()
+            stalls.append(now - last - 0.01)
+            last = now
+
+    ticker = asyncio.ensure_future(tick())
+    try:
+        decision = await limiter.acquire_async(IDENTITY)
+    finally:
+        ticker.cancel()
+
+    assert decision
+    assert stalls and max(stalls) < MAX_STALL_SECONDS
+
+
+@pytest.mark.anyio
+async def test_async_checks_share_buckets_with_sync_ones(tmp_path):
+    limiter = RateLimiter(policies={'user': BucketPolicy(per_minute=1, burst=1)},
+                          db_path=str(tmp_path / "rate_limits.db"))
+
+    assert await limiter.check_async(IDENTITY)
+    assert limiter.acquire(IDENTITY)
+    refused = await limiter.acquire_async(IDENTITY)
+
+    assert not refused and refused.scope == 'user'
+    assert not limiter.check(IDENTITY)
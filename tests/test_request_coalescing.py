@@ -0,0 +1,113 @@
+"""Identical concurrent Google calls are made once, without leaking results or limits between callers."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from src.app.models.facility import SearchQuery
+from src.app.services import places_service
+from src.app.services.places_service import PlacesService
+from src.app.utils.rate_limiter import BucketPolicy, RateLimiter, RateLimitExceeded
+
+CONCURRENT_SEARCHES = 5
+QUERY_TEXT = "gym in Coalesce City, India"
+
+
+def _places_calls(simulator) -> int:
+    return simulator.stats()['providers']['google_places']['calls']
+
+
+def _query(city: str) -> SearchQuery:
+    return SearchQuery(place_type="gym", city=city, country="India", max_results=20)
+
+
+def _one_call_per_user(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Limit every user to a single Google call (API key and IP buckets stay roomy)."""
+    limiter = RateLimiter(policies={
+        'api_key': BucketPolicy(per_minute=1000, burst=1000),
+        'user': BucketPolicy(per_minute=1, burst=1),
+        'ip': BucketPolicy(per_minute=1000, burst=1000),
+    }, db_path='')
+    monkeypatch.setattr(places_service, 'rate_limiter', limiter)
+
+
+@pytest.mark.anyio
+async def test_concurrent_identical_searches_make_one_upstream_call_each(simulator):
+    await PlacesService("test-key").search_places_async(_query("Baseline City"), 10)
+    single = _places_calls(simulator)
+    simulator.reset()
+
+    results = await asyncio.gather(*(
+        PlacesService("test-key", user_id=user).search_places_async(_query("Coalesce City"), 10)
+        for user in range(CONCURRENT_SEARCHES)
+    ))
+
+    assert all(result.success and result.total_found == 20 for result in results)
+    # One text search plus one details call per place, however many callers asked
+    assert _places_calls(simulator) == single
+
+
+def test_concurrent_identical_searches_on_threads_make_one_upstream_call_each(simulator):
+    PlacesService("test-key").search_places(_query("Baseline Town"), 10)
+    single = _places_calls(simulator)
+    simulator.reset()
+
+    with ThreadPoolExecutor(CONCURRENT_SEARCHES) as pool:
+        results = list(pool.map(
+            lambda user: PlacesService("test-key", user_id=user).search_places(_query("Coalesce Town"), 10),
+            range(CONCURRENT_SEARCHES)
+        ))
+
+    assert all(result.success and result.total_found == 20 for result in results)
+    assert _places_calls(simulator) == single
+
+
+@pytest.mark.anyio
+async def test_searches_with_different_api_keys_are_not_shared(simulator):
+    async with httpx.AsyncClient() as client:
+        await asyncio.gather(*(
+            PlacesService(key)._fetch_text_search_page_async(client, QUERY_TEXT) for key in ("key-a", "key-b")
+        ))
+
+    assert _places_calls(simulator) == 2
+
+
+@pytest.mark.anyio
+async def test_follower_is_charged_to_its_own_limits(simulator, monkeypatch):
+    _one_call_per_user(monkeypatch)
+    leader = PlacesService("test-key", user_id=1)
+    follower = PlacesService("test-key", user_id=2)
+    places_service.rate_limiter.acquire(follower.rate_limit_identity)  # the follower's only call is spent
+
+    async with httpx.AsyncClient() as client:
+        led, followed = await asyncio.gather(
+            leader._fetch_text_search_page_async(client, QUERY_TEXT),
+            follower._fetch_text_search_page_async(client, QUERY_TEXT),
+            return_exceptions=True
+        )
+
+    assert led['status'] == 'OK'
+    assert isinstance(followed, RateLimitExceeded) and followed.scope == 'user'
+    assert _places_calls(simulator) == 1
+
+
+@pytest.mark.anyio
+async def test_leader_rate_limit_is_not_passed_to_followers(simulator, monkeypatch):
+    _one_call_per_user(monkeypatch)
+    leader = PlacesService("test-key", user_id=1)
+    follower = PlacesService("test-key", user_id=2)
+    places_service.rate_limiter.acquire(leader.rate_limit_identity)  # the leader's only call is spent
+
+    async with httpx.AsyncClient() as client:
+        led, followed = await asyncio.gather(
+            leader._fetch_text_search_page_async(client, QUERY_TEXT),
+            follower._fetch_text_search_page_async(client, QUERY_TEXT),
+            return_exceptions=True
+        )
+
+    assert isinstance(led, RateLimitExceeded)
+    # The follower made the call itself, on its own quota
+    assert followed['status'] == 'OK'
+    assert _places_calls(simulator) == 1
@@ -0,0 +1,130 @@
+"""Search results are served stale while one refresh runs, cached when empty and cached when cut short."""
+
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from src.app.models.facility import SearchQuery
+from src.app.services import search_cache as search_cache_module
+from src.app.services.places_service import PlacesService
+from src.app.services.search_cache import (
+    CACHE_FRESH, CACHE_MISS, CACHE_STALE, SEARCH_CACHE_NEGATIVE_TTL_SECONDS, SEARCH_CACHE_TTL_SECONDS,
+    search_cache
+)
+
+CONCURRENT_SEARCHES = 5
+REFRESH_TIMEOUT_SECONDS = 5.0
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Control the cache's notion of now (seconds since the epoch)."""
+    now = SimpleNamespace(value=1_700_000_000.0)
+    monkeypatch.setattr(search_cache_module, 'time', SimpleNamespace(time=lambda: now.value))
+    return now
+
+
+def _places_calls(simulator) -> int:
+    return simulator.stats()['providers']['google_places']['calls']
+
+
+def _query(city: str, max_results: int = 20) -> SearchQuery:
+    return SearchQuery(place_type="gym", city=city, country="India", max_results=max_results)
+
+
+def _wait_for_refreshes() -> None:
+    deadline = time.monotonic() + REFRESH_TIMEOUT_SECONDS
+    while search_cache.stats()['refreshing']:
+        assert time.monotonic() < deadline, "background refresh did not finish"
+        time.sleep(0.01)
+
+
+def test_stale_hit_triggers_exactly_one_refresh(simulator, clock):
+    query = _query("Stale City")
+    stale = [{'place_id': 'old', 'name': "Closed Gym"}]
+    search_cache.put(query.to_google_query(), query.max_results, stale)
+    clock.value += SEARCH_CACHE_TTL_SECONDS + 1
+
+    with ThreadPoolExecutor(CONCURRENT_SEARCHES) as pool:
+        served = list(pool.map(lambda _: PlacesService("test-key")._open_text_search(query),
+                               range(CONCURRENT_SEARCHES)))
+    _wait_for_refreshes()
+
+    # Every caller got the stale answer at once, and Google was asked once
+    assert all(first_page == stale and pages is None for first_page, pages in served)
+    assert _places_calls(simulator) == 1
+    refreshed, state = search_cache.get(query.to_google_query(), query.max_results)
+    assert state == CACHE_FRESH and refreshed != stale
+
+
+@pytest.mark.anyio
+async def test_stale_hit_triggers_exactly_one_refresh_async(simulator, clock):
+    query = _query("Stale Town")
+    stale = [{'place_id': 'old', 'name': "Closed Gym"}]
+    search_cache.put(query.to_google_query(), query.max_results, stale)
+    clock.value += SEARCH_CACHE_TTL_SECONDS + 1
+
+    async with httpx.AsyncClient() as client:
+        served = await asyncio.gather(*(
+            PlacesService("test-key")._open_text_search_async(client, query) for _ in range(CONCURRENT_SEARCHES)
+        ))
+        deadline = time.monotonic() + REFRESH_TIMEOUT_SECONDS
+        while search_cache.stats()['refreshing']:
+            assert time.monotonic() < deadline, "background refresh did not finish"
+            await asyncio.sleep(0.01)
+
+    assert all(first_page == stale and pages is None for first_page, pages in served)
+    assert _places_calls(simulator) == 1
+    assert search_cache.get(query.to_google_query(), query.max_results)[1] == CACHE_FRESH
+
+
+def test_empty_results_are_cached_until_the_negative_ttl(simulator, clock, monkeypatch):
+    monkeypatch.setattr(simulator.config, 'places_per_cell', 0)
+    service = PlacesService("test-key")
+    query = _query("Empty City")
+
+    assert service.search_places(query, 10).total_found == 0
+    assert service.search_places(query, 10).total_found == 0
+    assert _places_calls(simulator) == 1
+
+    clock.value += SEARCH_CACHE_NEGATIVE_TTL_SECONDS + 1
+    assert search_cache.get(query.to_google_query(), query.max_results) == (None, CACHE_MISS)
+    service.search_places(query, 10)
+    assert _places_calls(simulator) == 2
+
+
+def test_negative_entry_is_not_served_stale(clock):
+    search_cache.put("gym in Nowhere, India", 20, [])
+
+    clock.value += SEARCH_CACHE_NEGATIVE_TTL_SECONDS + 1
+
+    # Unlike results, an empty answer is never kept past its TTL
+    assert search_cache.get("gym in Nowhere, India", 20) == (None, CACHE_MISS)
+
+
+def test_pages_fetched_before_an_early_stop_are_cached(clock):
+    service = PlacesService("test-key")
+    first = [{'place_id': f"p{i}"} for i in range(20)]
+    second = [{'place_id': f"p{i}"} for i in range(20, 40)]
+    pages = service._record_search_pages("gym in Partial City, India", 60, iter([first, second, []]))
+
+    assert next(pages) == first
+    pages.close()
+
+    # Only the 20-result bucket is covered; larger requests still go to Google
+    assert search_cache.get("gym in Partial City, India", 20) == (first, CACHE_FRESH)
+    assert search_cache.get("gym in Partial City, India", 40) == (None, CACHE_MISS)
+
+
+def test_stale_entry_is_served_until_the_stale_window_ends(clock):
+    search_cache.put("gym in Old City, India", 20, [{'place_id': 'p1'}])
+
+    clock.value += SEARCH_CACHE_TTL_SECONDS + 1
+    assert search_cache.get("gym in Old City, India", 20)[1] == CACHE_STALE
+
+    clock.value += search_cache.stale_seconds
+    assert search_cache.get("gym in Old City, India", 20) == (None, CACHE_MISS)
@@ -0,0 +1,77 @@
+"""The search and cache statistics endpoints must not block the event loop that serves other routes."""
+
+import time
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from src.app.main_api import app
+from src.app.services.details_cache import details_cache
+from src.app.utils.scrape_cache import scrape_cache
+
+# Longest stall of the /health poll tolerated while a search is in flight
+MAX_STALL_SECONDS = 0.3
+# How long a worker thread holds the cache locks, as a slow SQLite write would
+CACHE_CONTENTION_SECONDS = 1.0
+POLL_INTERVAL_SECONDS = 0.05
+
+
+def _hold_cache_locks(release: threading.Event) -> threading.Thread:
+    def hold() -> None:
+        with details_cache._lock, scrape_cache._lock:
+            release.wait(CACHE_CONTENTION_SECONDS)
+
+    thread = threading.Thread(target=hold, daemon=True)
+    thread.start()
+    return thread
+
+
+@pytest.mark.anyio
+async def test_health_stays_responsive_during_search(simulator):
+    transport = httpx.ASGITransport(app=app, client=('203.0.113.7', 4000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+        release = threading.Event()
+        holder = _hold_cache_locks(release)
+        search = asyncio.ensure_future(client.post("/facilities/search", json={
+            'api_key': "test-key", 'place_type': "gym", 'city': "Responsive City",
+            'country': "India", 'max_results': 20, 'deadline_seconds': 5,
+        }))
+
+        # Time each poll including its pause, so a stall that starts during the pause still counts
+        slowest = 0.0
+        while not search.done():
+            started = time.monotonic()
+            response = await client.get("/health")
+            assert response.status_code == 200
+            await asyncio.sleep(POLL_INTERVAL_SECONDS)
+            slowest = max(slowest, time.monotonic() - started - POLL_INTERVAL_SECONDS)
+        release.set()
+        holder.join()
+
+        response = search.result()
+        assert response.status_code == 200
+        assert response.json()['total_found'] > 0
+        assert simulator.stats()['providers']['google_places']['calls'] > 1
+        assert slowest < MAX_STALL_SECONDS, f"the event loop stalled {slowest:.2f}s while a search was running"
+
+
+@pytest.mark.anyio
+async def test_cache_stats_do_not_block_other_routes():
+    transport = httpx.ASGITransport(app=app, client=('203.0.113.7', 4000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+        release = threading.Event()
+        holder = _hold_cache_locks(release)
+        # Timed from before the pause, during which /health/cache starts running
+        started = time.monotonic()
+        stats = asyncio.ensure_future(client.get("/health/cache"))
+        await asyncio.sleep(POLL_INTERVAL_SECONDS)
+        response = await client.get("/health")
+        stall = time.monotonic() - started - POLL_INTERVAL_SECONDS
+        release.set()
+        holder.join()
+
+        assert response.status_code == 200
+        assert (await stats).json()['place_details']['disk_entries'] >= 0
+        assert stall < MAX_STALL_SECONDS, f"/health waited {stall:.2f}s behind /health/cache"
@@ -0,0 +1,45 @@
+"""A scrape given a deadline returns the first page's fields instead of waiting out a slow crawl."""
+
+import time
+
+import pytest
+
+from src.app.devtools.upstream_simulator import _site_html, places_near
+from src.app.utils.legal_compliance import compliance_checker
+from src.app.utils.web_scraper import async_scraper, scrape_website_for_contacts
+
+DEADLINE_SECONDS = 2.0
+
+
+@pytest.fixture
+def slow_site(simulator, simulator_url, monkeypatch) -> str:
+    """A site whose email is only on its contact page, with the production 6 s spacing between pages."""
+    monkeypatch.setattr(compliance_checker, 'min_delay_between_requests', 6)
+    place = next(p for p in places_near(simulator.config, "gym", 10.0, 10.0, 20000)
+                 if p.has_website and 'mailto:' not in _site_html(simulator.config, p, ''))
+    site = f"{simulator_url}/sites/{place.place_id}/"
+    # robots.txt and the terms of service lookup are done and cached before the clock starts
+    compliance_checker.check_website_compliance(site, check_access=False)
+    return site
+
+
+def test_scrape_returns_first_page_fields_by_the_deadline(slow_site):
+    started = time.monotonic()
+    profile = scrape_website_for_contacts(slow_site, deadline=started + DEADLINE_SECONDS)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < DEADLINE_SECONDS
+    assert profile.instagram and profile.whatsapp
+    # Only on the contact page, whose request slot comes after the deadline
+    assert not profile.email
+
+
+@pytest.mark.anyio
+async def test_async_scrape_returns_first_page_fields_by_the_deadline(slow_site):
+    started = time.monotonic()
+    profile = await async_scraper.scrape(slow_site, deadline=started + DEADLINE_SECONDS)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < DEADLINE_SECONDS
+    assert profile.instagram and profile.whatsapp
+    assert not profile.email